@@ -7,82 +7,43 @@ from kivy.uix.button import Button                        # import widget Button
 from kivy.uix.slider import Slider                        # import widget Slider (pengatur nilai)
 from kivy.uix.textinput import TextInput                  # import widget TextInput (input teks)
 from kivy.uix.togglebutton import ToggleButton            # import ToggleButton (tombol toggle/group)
+from kivy.uix.scrollview import ScrollView                # isi drawer bisa digulir saat overlay profiler tampil
+from kivy.uix.widget import Widget                        # area gambar panel analitik
 from kivy.graphics import Color, Line, Ellipse, Rectangle, RoundedRectangle, InstructionGroup  # import primitive grafis
+from kivy.graphics import Mesh, Point                     # satu instruksi gabungan per layer untuk mode ensemble
+from kivy.graphics import StencilPush, StencilUse, StencilUnUse, StencilPop  # clipping kurva ke area plot
+from kivy.graphics.texture import Texture                 # histogram ruang fase ditampilkan sebagai tekstur kecil
 from kivy.clock import Clock                              # import Clock untuk scheduling / update berkala
 from kivy.core.window import Window                       # import Window untuk konfigurasi jendela (mis. ukuran)
 from kivy.metrics import dp                               # import dp (density-independent pixels) untuk ukuran konsisten
 from kivy.core.text import Label as CoreLabel             # import CoreLabel untuk menghasilkan tekstur teks custom
 from kivy.properties import NumericProperty, BooleanProperty, StringProperty, ListProperty  # import properti untuk binding
 from kivy.animation import Animation                      # import Animation untuk efek transisi animasi
+from kivy.logger import Logger                            # log error redraw (sekali per pesan baru)
 import math, time, random                                 # import modul standar: math (matematika), time (waktu), random (acak)
+try:
+    import numpy as np                                    # opsional: hanya untuk vertex mode ensemble
+except ImportError:
+    np = None
+from physics import DoublePendulum, ChainPendulum, BatchPendulum  # model fisika (RK4) dari modul physics yang bebas Kivy; rantai N link; batch untuk ensemble
+from lod import MinMaxLOD, DistanceLOD                    # level-of-detail untuk kurva grafik dan trail
+from worker import PhysicsWorker                          # thread fisika terpisah dari clock render
+from recording import TrajectoryWriter, TrajectoryReader, ReplayPendulum  # rekaman trajektori biner & replay memmap
+from profiler import Profiler                             # durasi per-tahap, laju langkah, frame drop, jumlah vertex
+from checkpoint import Checkpointer                       # checkpoint berkala + seek deterministik ke waktu simulasi
+from analytics import Analytics, levels                   # analitik streaming (Poincaré, spektrum, flip, histogram fase)
+import contextlib, glob, os                               # nullcontext bila worker belum ada; pencarian file rekaman
 
 Window.size = (1200, 760)                                 # set ukuran jendela/layar awal aplikasi (width, height)
 
-# ---- Physics integrator (RK4) ----
-def derivatives(pendulum, y):                             # fungsi menghitung turunan state untuk sistem double pendulum
-    theta1, omega1, theta2, omega2 = y                    # unpack state: sudut dan kecepatan angular untuk dua massa
-    m1, m2 = pendulum.m1, pendulum.m2                     # ambil massa dari objek pendulum
-    l1, l2 = pendulum.l1, pendulum.l2                     # ambil panjang tali dari objek pendulum
-    g = pendulum.g                                        # ambil percepatan gravitasi dari objek pendulum
-    delta = theta2 - theta1                               # difference antar sudut (θ2 - θ1)
-    cos_d = math.cos(delta); sin_d = math.sin(delta)      # hitung cos dan sin dari delta (dipakai berkali-kali)
-    denom1 = (m1 + m2) * l1 - m2 * l1 * cos_d * cos_d     # denominator untuk rumus domega1 (menghindari pembagian nol)
-    if abs(denom1) < 1e-12: denom1 = 1e-12 if denom1 >= 0 else -1e-12  # proteksi numeric: kalau hampir nol, ganti nilai kecil
-    denom2 = (l2 / l1) * denom1                           # denominator untuk domega2 berdasarkan denom1
-    if abs(denom2) < 1e-12: denom2 = 1e-12 if denom2 >= 0 else -1e-12  # proteksi numeric untuk denom2
-    domega1 = (                                          # hitung turunan omega1 (akses rumus dinamika)
-        m2 * l1 * omega1 * omega1 * sin_d * cos_d +      # bagian inersia/kinetik terkait omega1 dan omega2
-        m2 * g * math.sin(theta2) * cos_d +             # bagian gaya gravitasi dari massa kedua yang dikopel
-        m2 * l2 * omega2 * omega2 * sin_d -             # kontribusi gerak massa kedua terhadap massa pertama
-        (m1 + m2) * g * math.sin(theta1)                # gaya gravitasi pada massa pertama
-    ) / denom1                                           # bagi oleh denom1 untuk mendapatkan domega1
-    domega2 = (                                          # hitung turunan omega2 (rumus dinamika untuk massa kedua)
-        - m2 * l2 * omega2 * omega2 * sin_d * cos_d +   # kontribusi inersia massa kedua
-        (m1 + m2) * g * math.sin(theta1) * cos_d -      # gaya gravitasi massa pertama di-coupling ke massa kedua
-        (m1 + m2) * l1 * omega1 * omega1 * sin_d -      # kontribusi gerak massa pertama
-        (m1 + m2) * g * math.sin(theta2)                # gaya gravitasi langsung pada massa kedua
-    ) / denom2                                           # bagi oleh denom2 untuk mendapatkan domega2
-    return [omega1, domega1, omega2, domega2]            # kembalikan turunan state sebagai list [dθ1/dt, dω1/dt, dθ2/dt, dω2/dt]
-
-def rk4_step(pendulum, y, dt):                           # fungsi integrator Runge-Kutta 4 untuk satu langkah waktu dt
-    k1 = derivatives(pendulum, y)                        # k1 = f(y)
-    y2 = [y[i] + 0.5 * dt * k1[i] for i in range(4)]     # sementara y untuk menghitung k2 (y + dt/2 * k1)
-    k2 = derivatives(pendulum, y2)                       # k2 = f(y2)
-    y3 = [y[i] + 0.5 * dt * k2[i] for i in range(4)]     # sementara y untuk k3
-    k3 = derivatives(pendulum, y3)                       # k3 = f(y3)
-    y4 = [y[i] + dt * k3[i] for i in range(4)]           # sementara y untuk k4 (y + dt * k3)
-    k4 = derivatives(pendulum, y4)                       # k4 = f(y4)
-    return [ y[i] + (dt / 6.0) * (k1[i] + 2.0*k2[i] + 2.0*k3[i] + k4[i]) for i in range(4) ]  # rumus kombinasi RK4
-
-# ---- Double pendulum model ----
-class DoublePendulum:                                     # kelas model fisika double pendulum: menyimpan state dan update physics
-    def __init__(self, m1=1.0, m2=1.0, l1=1.0, l2=1.0, g=9.81):  # konstruktor dengan parameter default
-        self.m1, self.m2, self.l1, self.l2, self.g = m1, m2, l1, l2, g  # simpan parameter fisik
-        self.state = [math.pi/2, 0.0, math.pi/2, 0.0]    # state awal: θ1, ω1, θ2, ω2 (default berdiri horizontal-ish)
-        self.time = 0.0                                  # waktu simulasi (counter)
-        self.base_dt = 0.005; self.dt = self.base_dt     # langkah waktu dasar (base_dt) dan dt yang aktif
-        self.history = [(0.0, self.state[0], self.state[2])]  # histori waktu & sudut untuk plot/analisis
-        self.trail = []                                  # jejak posisi bob kedua untuk digambar (visual trail)
-        self.max_history = 5000                          # batas panjang history/trail untuk membatasi memori
-
-    def update(self):                                    # update satu langkah fisika: integrasi + menyimpan jejak
-        self.state = rk4_step(self, self.state, self.dt) # integrasikan state menggunakan RK4
-        self.time += self.dt                              # tambahkan waktu simulasi
-        self.history.append((self.time, self.state[0], self.state[2]))  # simpan waktu dan kedua sudut ke history
-        if len(self.history) > self.max_history: self.history.pop(0)    # jaga agar history tidak melebihi max
-        theta1, _, theta2, _ = self.state                  # ambil sudut (abaikan omega)
-        x1 = self.l1 * math.sin(theta1); y1 = - self.l1 * math.cos(theta1)  # posisi (x1,y1) massa pertama relatif pivot
-        x2 = x1 + self.l2 * math.sin(theta2); y2 = y1 - self.l2 * math.cos(theta2)  # posisi (x2,y2) massa kedua
-        self.trail.append((x2, y2))                        # tambahkan posisi bob kedua ke trail
-        if len(self.trail) > self.max_history: self.trail.pop(0)  # batasi panjang trail
-
-    def get_positions(self):                              # helper untuk mendapatkan posisi pivot, bob1, bob2 (world coords relatif)
-        theta1, _, theta2, _ = self.state                 # ambil sudut dari state
-        x1 = self.l1 * math.sin(theta1); y1 = - self.l1 * math.cos(theta1)  # hitung posisi bob1
-        x2 = x1 + self.l2 * math.sin(theta2); y2 = y1 - self.l2 * math.cos(theta2)  # hitung posisi bob2
-        return (0.0, 0.0), (x1, y1), (x2, y2)             # kembalikan pivot, bob1, bob2
-
 # ---- Graph canvas ----
+def _nice_ceil(x):                                        # bulatkan ke atas ke angka "bagus" (1, 2, 2.5, 5 × 10^k) untuk skala sumbu
+    if x <= 0: return 1.0                                 # proteksi: tanpa data, skala default 1
+    e = 10.0 ** math.floor(math.log10(x))                 # orde besaran
+    for m in (1.0, 2.0, 2.5, 5.0, 10.0):
+        if m * e >= x: return m * e
+    return 10.0 * e
+
 class GraphCanvas(BoxLayout):                             # canvas khusus untuk menggambarkan grafik sudut vs waktu di bagian bawah UI
     def __init__(self, **kwargs):
         super().__init__(**kwargs)                        # panggil konstruktor BoxLayout
@@ -91,27 +52,21 @@ class GraphCanvas(BoxLayout):                             # canvas khusus untuk
         self.margin_top = dp(12); self.margin_right = dp(16)    # margin atas & kanan
         self.window_duration = 10.0                        # durasi jendela waktu yang ditampilkan (detik)
         self.bg_color = (0.95,0.95,0.95,1)                 # warna latar default (tidak selalu terpakai langsung)
+        self._static_key = None                            # (pos, size) saat instruksi statis terakhir dibangun
+        self._src = None; self._gen = -1; self._t_last = 0.0  # ring buffer sumber, generasinya, dan t terakhir (deteksi reset/pendulum baru)
+        self._lods = {}; self._scale = 1.0                 # cache LOD per zoom (detik per piksel) dan skala sudut saat ini
+        self.vertex_count = 0                              # titik kurva yang digambar pada frame terakhir
         self.bind(size=self.redraw, pos=self.redraw)      # re-draw saat ukuran/pos berubah
 
-    def redraw(self, *a):                                 # fungsi menggambar ulang seluruh grafik
-        self.canvas.clear()                               # bersihkan canvas dulu
-        app = App.get_running_app()                       # ambil instance app yang sedang berjalan
-        if not hasattr(app,'pendulum') or len(app.pendulum.history) < 2: return  # kalau belum ada data, langsung keluar
-        history = app.pendulum.history                    # ambil history dari model pendulum
-        t_max = history[-1][0]; t_min = max(0.0, t_max - self.window_duration)  # tentukan rentang waktu yang terlihat
-        visible = [(t,a1,a2) for t,a1,a2 in history if t >= t_min]  # filter entri history yang dalam jendela waktu
-        if len(visible) < 2:
-            visible = history; t_min = visible[0][0]; t_max = visible[-1][0]    # fallback bila sedikit data
-        time_range = max(1e-6, t_max - t_min)            # jaga agar time_range tidak nol
+    def _build_static(self):                              # bangun instruksi yang tetap antar frame: latar, grid, sumbu, tick, judul
+        self.canvas.clear()                               # hanya dipanggil saat ukuran/pos berubah
         plot_x = self.x + self.margin_left; plot_y = self.y + self.margin_bottom  # koordinat origin plot
         plot_w = max(10, self.width - self.margin_left - self.margin_right)     # lebar area plot
         plot_h = max(60, self.height - self.margin_bottom - self.margin_top)    # tinggi area plot
-        all_angles = [a for _,a1,a2 in visible for a in (a1,a2)]  # kumpulkan semua sudut yang terlihat
-        max_angle = max(abs(a) for a in all_angles) if all_angles else 1.0      # cari nilai sudut maksimal untuk normalisasi
-        if max_angle == 0: max_angle = 1.0                 # proteksi agar tidak membagi nol
-
+        self._plot = (plot_x, plot_y, plot_w, plot_h)     # simpan geometri plot untuk pemetaan titik
+        self._xlabels = []; self._ylabels = []            # pasangan [teks, Rectangle] per tick label (tekstur dibuat ulang hanya bila teks berubah)
         with self.canvas:                                 # mulai blok menggambar
-            Color(*App.get_running_app().current_graph_bg)  # set warna background grafik dari tema aplikasi
+            self._bg_color = Color(*App.get_running_app().current_graph_bg)  # warna background (diperbarui tiap frame tanpa rebuild)
             Rectangle(pos=self.pos, size=self.size)      # gambar rectangle background untuk seluruh widget
             Color(0.85,0.85,0.85,1)                       # set warna garis grid
             for i in range(1,5):                          # gambar garis horizontal grid
@@ -120,50 +75,76 @@ class GraphCanvas(BoxLayout):                             # canvas khusus untuk
             Color(0.12,0.12,0.12,1)                       # warna untuk axis
             Line(points=[plot_x, plot_y, plot_x, plot_y+plot_h], width=1.5)  # sumbu-y
             Line(points=[plot_x, plot_y, plot_x+plot_w, plot_y], width=1.5)  # sumbu-x
-
-            for i in range(6):                           # gambar tick dan label waktu pada sumbu-x
-                t_val = t_min + i * time_range / 5; x_tick = plot_x + i*plot_w/5
+            for i in range(6):                           # tick sumbu-x; label diisi di _set_label
+                x_tick = plot_x + i*plot_w/5
                 Line(points=[x_tick, plot_y, x_tick, plot_y - dp(6)], width=1.1)  # tick kecil
-                lab = CoreLabel(text=f"{t_val:.1f}", font_size=dp(11)); lab.refresh()  # buat tekstur label memakai CoreLabel
-                self.canvas.add(Rectangle(texture=lab.texture, pos=(x_tick - lab.texture.size[0]/2, plot_y - dp(26)), size=lab.texture.size))  # gambar label
-
-            for i in range(5):                           # gambar tick & label untuk sumbu-y (angle)
-                rel = (i-2)/2.0; angle_val = rel * max_angle
+                self._xlabels.append(['', Rectangle(size=(0, 0))])  # slot label (tekstur menyusul)
+            for i in range(5):                           # tick sumbu-y (angle)
                 y_tick = plot_y + i*plot_h/4
                 Line(points=[plot_x, y_tick, plot_x - dp(6), y_tick], width=1.1)  # tick kecil horizontal
-                lab = CoreLabel(text=f"{angle_val:.2f}", font_size=dp(11)); lab.refresh()  # buat label tekstur
-                self.canvas.add(Rectangle(texture=lab.texture, pos=(plot_x - dp(50), y_tick - lab.texture.size[1]/2), size=lab.texture.size))  # gambar label
-
-            labx = CoreLabel(text="Time (s)", font_size=dp(12)); labx.refresh()  # label sumbu x
-            self.canvas.add(Rectangle(texture=labx.texture, pos=(plot_x + plot_w/2 - labx.texture.size[0]/2, plot_y - dp(36)), size=labx.texture.size))  # gambar label sumbu x
-            laby = CoreLabel(text="Angle (rad)", font_size=dp(12)); laby.refresh()  # label sumbu y
-            Push = InstructionGroup()                      # buat instruction group (tidak dipakai penuh di sini, placeholder)
-            Push.add(Rectangle(texture=laby.texture, pos=(plot_x - dp(74), plot_y + plot_h/2 - laby.texture.size[1]/2), size=laby.texture.size))  # tambahkan rectangle teks ke group (tidak dipakai rotasi)
-
-            # rotate not strictly necessary; simpler: draw normal left label
-            for t,a1,a2 in visible:                        # placeholder loop (tidak melakukan apa-apa di dalamnya)
-                pass
-
-            # plot curves
-            Color(0.85,0.2,0.2,1)                          # warna garis untuk sudut pertama
-            pts1 = []                                      # list titik untuk curve 1
-            for t,a1,_ in visible:                         # bangun titik-titik (x,y) untuk curve sudut1
-                x = plot_x + ((t - t_min) / time_range) * plot_w
-                y = plot_y + plot_h/2 + (a1 / max_angle) * (plot_h/2)
-                pts1 += [x,y]
-            if len(pts1) >= 4: Line(points=pts1, width=1.6)  # gambar line untuk curve 1 bila cukup titik
-            Color(0.15,0.45,0.85,1)                        # warna garis untuk sudut kedua
-            pts2=[]                                        # list titik untuk curve 2
-            for t,_,a2 in visible:                         # bangun titik-titik untuk curve sudut2
-                x = plot_x + ((t - t_min) / time_range) * plot_w
-                y = plot_y + plot_h/2 + (a2 / max_angle) * (plot_h/2)
-                pts2 += [x,y]
-            if len(pts2) >= 4: Line(points=pts2, width=1.6)  # gambar line untuk curve 2 bila cukup titik
+                self._ylabels.append(['', Rectangle(size=(0, 0))])  # slot label
+            labx = CoreLabel(text="Time (s)", font_size=dp(12)); labx.refresh()  # label sumbu x (sekali per rebuild)
+            Rectangle(texture=labx.texture, pos=(plot_x + plot_w/2 - labx.texture.size[0]/2, plot_y - dp(36)), size=labx.texture.size)  # gambar label sumbu x
+            # curves: titik dari LOD min/max, dipotong stencil ke area plot (titik tepi kiri berada sedikit di luar jendela)
+            StencilPush(); Rectangle(pos=(plot_x, plot_y), size=(plot_w, plot_h)); StencilUse()
+            Color(0.85,0.2,0.2,1); self._line1 = Line(points=[], width=1.6)  # kurva sudut pertama
+            Color(0.15,0.45,0.85,1); self._line2 = Line(points=[], width=1.6)  # kurva sudut kedua
+            StencilUnUse(); Rectangle(pos=(plot_x, plot_y), size=(plot_w, plot_h)); StencilPop()
+        self._static_key = (tuple(self.pos), tuple(self.size))
+
+    def _set_label(self, slot, text, x, y, anchor):       # perbarui satu tick label; render tekstur hanya bila teks berubah
+        if slot[0] != text:
+            lab = CoreLabel(text=text, font_size=dp(11)); lab.refresh()  # buat tekstur label memakai CoreLabel
+            slot[0] = text; slot[1].texture = lab.texture; slot[1].size = lab.texture.size
+        w, h = slot[1].size
+        slot[1].pos = (x - w/2, y) if anchor == 'x' else (x, y - h/2)  # tengah horizontal (sumbu-x) atau vertikal (sumbu-y)
+
+    def _sync_lods(self, history, lock):                  # masukkan sampel baru ke LOD untuk zoom aktif; LOD di-cache per zoom → (lods, t_min)
+        bucket = self.window_duration / self._plot[2]     # detik per kolom piksel = level zoom
+        with lock:                                        # sampel baru disalin di bawah lock model: thread fisika tidak menimpa ring buffer selama dibaca
+            t_max = history[-1][0]; t_min = max(0.0, t_max - self.window_duration)  # tentukan rentang waktu yang terlihat
+            if history is not self._src or history.generation != self._gen or t_max < self._t_last:  # reset / pendulum baru / waktu mundur
+                self._lods = {}; self._src = history; self._gen = history.generation
+            self._t_last = t_max
+            lods = self._lods.get(bucket)
+            if lods is None:                              # zoom baru: buat LOD (cache dibatasi beberapa zoom terakhir)
+                if len(self._lods) >= 4: self._lods.pop(next(iter(self._lods)))
+                lods = self._lods[bucket] = (MinMaxLOD(bucket), MinMaxLOD(bucket))
+            i = max(history.bisect(lods[0].last_x, right=True), history.bisect(t_min) - 1, 0)  # hanya sampel yang belum masuk & masih relevan
+            ts, a1, a2 = (history.column(j, i).tolist() for j in range(3))  # salinan jendela (bukan view live)
+        lods[0].extend(ts, a1); lods[1].extend(ts, a2)    # O(sampel baru), di luar lock
+        lods[0].trim(t_min); lods[1].trim(t_min)         # buang titik yang sudah keluar jendela
+        return lods, t_min
+
+    def redraw(self, *a):                                 # perbarui grafik: LOD inkremental + pemetaan titik yang jumlahnya konstan
+        app = App.get_running_app()                       # ambil instance app yang sedang berjalan
+        if not hasattr(app,'pendulum') or len(app.pendulum.history) < 2:  # kalau belum ada data, kosongkan dan keluar
+            self.canvas.clear(); self._static_key = None; return
+        if self._static_key != (tuple(self.pos), tuple(self.size)): self._build_static()  # geometri berubah → bangun ulang
+        self._bg_color.rgba = app.current_graph_bg        # warna latar mengikuti animasi tema
+        (lod1, lod2), t_min = self._sync_lods(app.pendulum.history, app.model_lock())  # history dari model pendulum
+        ts1, a1s = lod1.window(t_min); ts2, a2s = lod2.window(t_min)  # ±2 titik per kolom piksel, tidak bergantung max_history/speed
+        peak = max(max(map(abs, a1s), default=0.0), max(map(abs, a2s), default=0.0))  # sudut maksimal yang terlihat (min/max terjaga oleh LOD)
+        if peak > self._scale or (peak < 0.4 * self._scale and _nice_ceil(peak) != self._scale):  # skala perlu naik/turun (dengan histeresis)
+            self._scale = _nice_ceil(peak)
+        plot_x, plot_y, plot_w, plot_h = self._plot
+        kx = plot_w / self.window_duration; x0 = plot_x - t_min * kx  # pemetaan waktu → x
+        cy = plot_y + plot_h/2; ky = (plot_h/2) / self._scale  # pemetaan sudut → y
+        pts1 = []; pts2 = []
+        for t, v in zip(ts1, a1s): pts1 += (x0 + t * kx, cy + v * ky)  # titik curve 1
+        for t, v in zip(ts2, a2s): pts2 += (x0 + t * kx, cy + v * ky)  # titik curve 2
+        self._line1.points = pts1; self._line2.points = pts2  # perbarui titik Line in-place
+        self.vertex_count = (len(pts1) + len(pts2)) // 2  # untuk profiler
+        for i, slot in enumerate(self._xlabels):          # label waktu pada sumbu-x
+            self._set_label(slot, f"{t_min + i * self.window_duration / 5:.1f}", plot_x + i*plot_w/5, plot_y - dp(26), 'x')
+        for i, slot in enumerate(self._ylabels):          # label sudut pada sumbu-y
+            self._set_label(slot, f"{(i-2)/2.0 * self._scale:.2f}", plot_x - dp(50), plot_y + i*plot_h/4, 'y')
 
     def clear_graph(self):                                # fungsi untuk mereset history grafik
         app = App.get_running_app()                        # ambil instance app
         if hasattr(app,'pendulum'):                        # bila pendulum ada, atur history jadi array awal dengan waktu 0
-            app.pendulum.history = [(0.0, app.pendulum.state[0], app.pendulum.state[2])]
+            with app.model_lock():                         # jangan bentrok dengan tick thread fisika
+                app.pendulum.clear_history()
 
 # ---- Pendulum visual canvas ----
 class PendulumCanvas(BoxLayout):                         # canvas visual utama yang menggambar pendulum (rod + bobs + trail)
@@ -172,43 +153,182 @@ class PendulumCanvas(BoxLayout):                         # canvas visual utama y
         self.bind(size=self.redraw, pos=self.redraw)      # redraw ketika ukuran/pos berubah
         self.pivot_offset_top = dp(90)                     # offset pivot dari bagian atas widget (visual)
         self.neon_color = (0.12, 0.65, 0.95, 1)            # warna neon untuk trail (RGBA)
+        self.trail_window = 900                            # jumlah sampel trail terakhir yang ditampilkan
+        self.trail_min_px = dp(1.5)                        # titik trail yang lebih dekat dari ini (piksel) dibuang
+        self._trail_lods = {}; self._trail_src = None; self._trail_gen = -1  # cache DistanceLOD per zoom + deteksi reset trail
+        self.vertex_count = 0                              # titik trail (+ vertex ensemble) yang digambar pada frame terakhir
+        self._ens = None; self._ens_n = -1                 # grup instruksi ensemble (dibuat sekali, vertex diperbarui per frame) + N-nya
+
+    def _trail_points(self, trail, scale, lock):          # titik trail (world) setelah decimation jarak-piksel, diperbarui inkremental
+        if trail is not self._trail_src or trail.generation != self._trail_gen:  # trail di-reset atau pendulum baru
+            self._trail_lods = {}; self._trail_src = trail; self._trail_gen = trail.generation
+        key = round(scale, 3)                             # level zoom (piksel per meter)
+        lod = self._trail_lods.get(key)
+        if lod is None:                                   # zoom baru: buat LOD (cache dibatasi beberapa zoom terakhir)
+            if len(self._trail_lods) >= 4: self._trail_lods.pop(next(iter(self._trail_lods)))
+            lod = self._trail_lods[key] = DistanceLOD(self.trail_min_px / scale)
+        with lock:                                        # x, y dan sampel terakhir disalin dari jendela yang sama di bawah lock model
+            total = trail.total; id_min = total - self.trail_window  # nomor sampel tertua yang masih ditampilkan
+            n = min(total - 1 - lod.last_id, len(trail), self.trail_window)  # sampel baru yang belum diproses
+            new = (trail.column(0, -n).tolist(), trail.column(1, -n).tolist()) if n > 0 else ((), ())
+            last = trail[-1]
+        for i, px, py in zip(range(total - n, total), *new): lod.add(i, px, py)
+        lod.trim(id_min)
+        xs, ys = lod.window(id_min)
+        if lod.ids and lod.ids[-1] != total - 1:          # sambungkan ke posisi terbaru agar trail menempel ke bob
+            px, py = last; xs.append(px); ys.append(py)
+        return xs, ys
+
+    def _ensemble_group(self, n):                         # rods: satu Mesh 'lines' (pivot bersama), bob1/bob2: satu Point per layer
+        if self._ens_n != n:
+            idx = []
+            for i in range(n): idx += (0, 1 + i, 1 + i, 1 + n + i)  # segmen pivot→bob1 dan bob1→bob2 untuk tiap anggota
+            g = InstructionGroup(); self._ens_rods = Mesh(mode='lines', indices=idx)
+            self._ens_b1 = Point(pointsize=dp(2.5)); self._ens_b2 = Point(pointsize=dp(2.5))
+            for inst in (Color(0.6,0.6,0.6,0.25), self._ens_rods, Color(0.9,0.2,0.2,0.55), self._ens_b1, Color(0.18,0.45,0.85,0.55), self._ens_b2): g.add(inst)
+            self._ens = g; self._ens_n = n; self._ens_v = np.zeros((2 * n + 1, 4))  # vertex (x, y, u, v); baris 0 = pivot
+        return self._ens
+
+    def _draw_ensemble(self, batch, state, cx, cy, scale):  # perbarui vertex semua anggota ensemble (numpy) lalu tambahkan grupnya
+        n = len(batch); g = self._ensemble_group(n)
+        (x1, y1), (x2, y2) = batch.get_positions(state)
+        v = self._ens_v; v[0, 0] = cx; v[0, 1] = cy
+        v[1:n+1, 0] = cx + x1 * scale; v[1:n+1, 1] = cy + y1 * scale
+        v[n+1:, 0] = cx + x2 * scale; v[n+1:, 1] = cy + y2 * scale
+        self._ens_rods.vertices = v.ravel().tolist()
+        self._ens_b1.points = v[1:n+1, :2].ravel().tolist(); self._ens_b2.points = v[n+1:, :2].ravel().tolist()
+        self.canvas.add(g)
+        return 4 * n + 1                                   # vertex rods + titik bob
 
     def redraw(self, *a):                                 # fungsi menggambar ulang pendulum
         self.canvas.clear()                               # bersihkan canvas dulu
         app = App.get_running_app()                       # ambil instance app
         if not hasattr(app,'pendulum'): return            # jika belum ada pendulum, keluar
         pend = app.pendulum                                # referensi cepat ke objek pendulum
-        _, b1, b2 = pend.get_positions()                  # dapatkan posisi pivot (diabaikan), bob1, bob2
+        w = getattr(app, 'physics', None)                  # worker fisika (bila ada)
+        state = w.interpolated_state() if w is not None and w.pendulum is pend else None  # state interpolasi antar tick fisika
+        batch = w.ensemble if state is not None else None  # ensemble (mode multi-pendulum) yang dimajukan worker bersama pend
+        ens = w.interpolated_ensemble() if batch is not None else None
+        pts = pend.get_positions(state)                   # posisi pivot lalu tiap bob (double pendulum: pivot, bob1, bob2; rantai: N+1 titik)
         cx = self.center_x; cy = self.top - self.pivot_offset_top  # hitung pivot world coords (center x dan offset top)
-        total_len = max(1e-6, pend.l1 + pend.l2)          # total panjang tali (proteksi nol)
+        total_len = max(1e-6, sum(pend.lengths))          # total panjang tali (proteksi nol)
         avail_w = self.width * 0.95; avail_h = (self.height - self.pivot_offset_top) * 0.95  # ruang tersedia untuk menggambar
         avail_r = max(10.0, min(avail_w/2.0, avail_h))    # radius avail untuk skala
         scale = avail_r / total_len                       # skala untuk memetakan panjang fisik ke pixel
         x0,y0 = cx,cy                                     # pivot point di layar
-        x1 = cx + b1[0]*scale; y1 = cy + b1[1]*scale      # posisi bob1 dalam koordinat layar (skala applied)
-        x2 = cx + b2[0]*scale; y2 = cy + b2[1]*scale      # posisi bob2 dalam koordinat layar
+        xy = [(cx + x*scale, cy + y*scale) for x, y in pts[1:]]  # posisi tiap bob dalam koordinat layar (skala applied)
+        n = len(xy); r = dp(12) if n <= 2 else min(dp(12), 0.35 * min(pend.lengths) * scale)  # rantai panjang: bob mengecil agar tidak saling menutupi
 
         with self.canvas:                                 # mulai menggambar elemen-elemen
             # background
             Color(*App.get_running_app().current_dark_bg) # warna latar dari tema aplikasi
             Rectangle(pos=self.pos, size=self.size)      # gambar latar widget
+            verts = self._draw_ensemble(batch, ens, x0, y0, scale) if ens is not None and ens.shape[1] == len(batch) else 0  # ensemble di bawah pendulum referensi
             # rods
-            Color(0.22,0.22,0.22,1); Line(points=[x0,y0,x1,y1], width=dp(4)); Line(points=[x1,y1,x2,y2], width=dp(4))  # gambar batang pendulum
+            Color(0.22,0.22,0.22,1); Line(points=[x0,y0] + [c for p in xy for c in p], width=max(dp(1.5), r / 3))  # gambar batang pendulum (satu polyline; tebal ikut ukuran bob)
             # pivot
             Color(0,0,0,1); Ellipse(pos=(x0-dp(5), y0-dp(5)), size=(dp(10),dp(10)))  # gambar pivot sebagai bulatan kecil
             # bobs
-            Color(0.9,0.2,0.2,1); Ellipse(pos=(x1-dp(12),y1-dp(12)), size=(dp(24),dp(24)))  # bob pertama (merah-ish)
-            Color(0.18,0.45,0.85,1); Ellipse(pos=(x2-dp(12),y2-dp(12)), size=(dp(24),dp(24)))  # bob kedua (biru-ish)
+            for i, (x, y) in enumerate(xy):               # bob pertama merah-ish → bob terakhir biru-ish (gradasi di antaranya)
+                f = i / (n - 1); Color(0.9 - 0.72*f, 0.2 + 0.25*f, 0.2 + 0.65*f, 1); Ellipse(pos=(x-r,y-r), size=(2*r,2*r))
             # trail
             if getattr(App.get_running_app(), 'show_trail', True) and len(pend.trail)>2:  # jika opsi trail aktif dan ada jejak
                 Color(self.neon_color[0], self.neon_color[1], self.neon_color[2], 0.18)  # warna trail dengan alpha rendah
                 pts=[]                                       # kumpulkan titik trail
-                for px,py in pend.trail[-900:]:              # ambil sampai 900 titik terakhir untuk performa
+                for px,py in zip(*self._trail_points(pend.trail, scale, App.get_running_app().model_lock())):  # titik trail setelah LOD (sampai trail_window sampel terakhir)
                     pts += [cx + px*scale, cy + py*scale]    # konversi ke koordinat layar
                 if len(pts)>=4: Line(points=pts, width=1.3)  # gambar line trail jika cukup titik
+                verts += len(pts) // 2                      # titik trail yang dikirim ke GPU
+            self.vertex_count = verts                       # untuk profiler
+
+# ---- Analytics panel (drawer) ----
+class AnalyticsPanel(BoxLayout):                          # ringkasan + irisan Poincaré + spektrum θ1/θ2 + histogram ruang fase, dari Analytics.snapshot()
+    SPECTRUM_FMAX = 5.0                                   # batas frekuensi yang ditampilkan (Hz)
+    SPECTRUM_DECADES = 6.0                                # rentang dinamis sumbu daya (dekade di bawah puncak)
+
+    def __init__(self, **kwargs):
+        super().__init__(orientation='vertical', size_hint=(1,None), height=0, opacity=0, spacing=dp(4), **kwargs)  # tersembunyi sampai tombol ANALYTICS ditekan
+        self.info = Label(text="", font_size=dp(11), halign='left', valign='top', size_hint=(1,None), height=dp(56))
+        self.info.bind(size=lambda l, s: setattr(l, 'text_size', s)); self.add_widget(self.info)
+        self.plots = Widget(size_hint=(1,None), height=dp(330)); self.add_widget(self.plots)
+        self._static_key = None; self._tex = [None, None]  # geometri terakhir instruksi statis; tekstur histogram (dibuat ulang bila jumlah bin berubah)
+
+    def _caption(self, text, x, y):                       # teks kecil statis di atas tiap plot
+        lab = CoreLabel(text=text, font_size=dp(10)); lab.refresh()
+        Rectangle(texture=lab.texture, pos=(x, y), size=lab.texture.size)
+
+    def _build_static(self):                              # latar, caption dan slot dinamis; hanya saat posisi/ukuran berubah
+        w = self.plots; w.canvas.clear()
+        x, y = w.pos; W, H = w.size; cap = dp(14); gap = dp(6)
+        hd = dp(96); hs = dp(80); hp = H - hd - hs - 3 * cap - 2 * gap  # tinggi histogram, spektrum, Poincaré
+        dw = (W - gap) / 2.0
+        self._dens_box = [(x, y, dw, hd), (x + dw + gap, y, dw, hd)]
+        self._spec_box = (x, y + hd + cap + gap, W, hs)
+        self._pc_box = (x, y + hd + hs + 2 * (cap + gap), W, hp)
+        with w.canvas:
+            Color(0, 0, 0, 0.25)
+            for bx, by, bw, bh in [self._pc_box, self._spec_box] + self._dens_box: Rectangle(pos=(bx, by), size=(bw, bh))
+            Color(1, 1, 1, 0.85)
+            self._caption("Poincaré θ1=0, ω1>0: (θ2, ω2)", self._pc_box[0], self._pc_box[1] + hp)
+            self._caption(f"PSD θ1 / θ2, 0–{self.SPECTRUM_FMAX:g} Hz (log)", self._spec_box[0], self._spec_box[1] + hs)
+            self._caption("ρ(θ1, ω1)", self._dens_box[0][0], y + hd); self._caption("ρ(θ2, ω2)", self._dens_box[1][0], y + hd)
+            Color(0.12, 0.65, 0.95, 1); self._pc = Point(points=[], pointsize=dp(1))  # titik irisan
+            Color(0.85, 0.2, 0.2, 1); self._sp1 = Line(points=[], width=1.1)         # spektrum θ1
+            Color(0.15, 0.45, 0.85, 1); self._sp2 = Line(points=[], width=1.1)       # spektrum θ2
+            Color(0.12, 0.65, 0.95, 1); self._dens = [Rectangle(pos=b[:2], size=b[2:], texture=None) for b in self._dens_box]  # luminance × warna neon
+        self._static_key = (tuple(w.pos), tuple(w.size))
+
+    def show(self, snap):                                 # perbarui panel dari snapshot (None = analitik tidak tersedia untuk model ini)
+        if snap is None:
+            self.info.text = "Analitik tidak tersedia (mulai simulasi live; replay tidak dianalisis)."
+            self.plots.canvas.clear(); self._static_key = None; return 0
+        if self._static_key != (tuple(self.plots.pos), tuple(self.plots.size)): self._build_static()
+        s = snap["summary"]
+        first = f"{s['first_flip']:.2f} s" if s["first_flip"] is not None else "-"
+        peaks = (f"puncak θ1 {s['peak1']:.2f} Hz  θ2 {s['peak2']:.2f} Hz" if s["peak1"] is not None
+                 else "spektrum: butuh numpy" if snap["spectrum"] is None else "spektrum: mengisi jendela…")
+        self.info.text = (f"sejak t={s['since'] or 0.0:.1f} s  langkah {s['steps']}\n"
+                          f"crossing {s['crossings']}  flip θ1 {s['flips1']}  θ2 {s['flips2']}  (pertama {first})\n{peaks}")
+        verts = self._draw_poincare(snap["poincare"], snap["omega_max"][1]) + self._draw_spectrum(snap["spectrum"])
+        for i, counts in enumerate(snap["density"]): self._draw_density(i, counts, snap["bins"])
+        return verts
+
+    def _draw_poincare(self, data, omega_max):            # data = (t, θ2, ω2) interleaved → titik layar
+        bx, by, bw, bh = self._pc_box
+        kx = bw / (2.0 * math.pi); ky = bh / (2.0 * omega_max); cx = bx + bw / 2.0; cy = by + bh / 2.0
+        pts = []
+        for i in range(0, len(data), 3):
+            w = max(-omega_max, min(omega_max, data[i + 2]))
+            pts += (cx + data[i + 1] * kx, cy + w * ky)
+        self._pc.points = pts
+        return len(pts) // 2
+
+    def _draw_spectrum(self, spec):                       # log10 daya, dinormalisasi ke puncak bersama; hanya bin <= SPECTRUM_FMAX
+        if spec is None: self._sp1.points = []; self._sp2.points = []; return 0
+        freqs, power = spec
+        n = int(np.searchsorted(freqs, self.SPECTRUM_FMAX, side='right'))
+        if not power[:, 1:n].any(): self._sp1.points = []; self._sp2.points = []; return 0  # belum ada sampel
+        logp = np.log10(power[:, 1:n] + 1e-30)            # tanpa bin DC (rata-rata dibuang)
+        top = float(logp.max()) if logp.size else 0.0
+        bx, by, bw, bh = self._spec_box
+        xs = bx + freqs[1:n] * (bw / self.SPECTRUM_FMAX)
+        ys = by + np.clip((logp - top) / self.SPECTRUM_DECADES + 1.0, 0.0, 1.0) * bh
+        for line, row in ((self._sp1, ys[0]), (self._sp2, ys[1])): line.points = np.column_stack((xs, row)).ravel().tolist()
+        return 2 * (n - 1)
+
+    def _draw_density(self, i, counts, bins):             # histogram → tekstur luminance (baris 0 = ω minimum, di bawah)
+        tex = self._tex[i]
+        if tex is None or tex.size != (bins, bins):
+            tex = self._tex[i] = Texture.create(size=(bins, bins), colorfmt='luminance'); tex.mag_filter = 'nearest'
+            self._dens[i].texture = tex
+        tex.blit_buffer(levels(counts), colorfmt='luminance', bufferfmt='ubyte')
+        self._dens[i].texture = tex                       # tetapkan ulang agar canvas menggambar isi baru
 
 # ---- Setup screen (unchanged structure, minimal) ----
 class SetupScreen(Screen):                               # layar setup tempat user memilih parameter simulasi
+    MAX_LINKS = 64                                        # rantai terpanjang yang masih real time (batas slider & input Links N, lihat README)
+    MAX_ENSEMBLE = 2000                                   # batas Ensemble N: Mesh batang ensemble (2N+1 vertex) harus muat indeks unsigned short (≤ 65535)
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs); self.name='setup'     # inisialisasi screen dan beri nama 'setup'
         root = BoxLayout(orientation='horizontal', padding=dp(12), spacing=dp(12))  # root layout horizontal
@@ -219,8 +339,9 @@ class SetupScreen(Screen):                               # layar setup tempat us
         params = [                                         # daftar parameter (label, default string)
             ("Mass 1 (kg)", "1.00"), ("Mass 2 (kg)", "1.00"),
             ("Length 1 (m)", "1.00"), ("Length 2 (m)", "1.00"),
-            ("Gravity (m/s^2)", "9.81"), ("Initial θ1 (rad)", "1.00"),
-            ("Initial θ2 (rad)", "2.00")]
+            ("Links N", "2"), ("Gravity (m/s^2)", "9.81"), ("Initial θ1 (rad)", "1.00"),
+            ("Initial θ2 (rad)", "2.00"), ("Ensemble N", "1"),
+            ("Spread Δθ (rad)", "0.001")]
         self.inputs={}                                    # dictionary untuk menyimpan pasangan TextInput dan Slider
         for label_text, default in params:                # loop membuat baris input untuk tiap parameter
             grid.add_widget(Label(text=label_text+':', size_hint_y=None, height=dp(32)))  # label parameter
@@ -230,9 +351,13 @@ class SetupScreen(Screen):                               # layar setup tempat us
             if "Mass" in label_text: sl_min, sl_max = 0.01, 200.0  # jika Mass, ubah rentang slider
             if "Length" in label_text: sl_min, sl_max = 0.01, 10.0  # jika Length, ubah rentang slider
             if "Gravity" in label_text: sl_min, sl_max = 0.01, 50.0  # jika Gravity, ubah rentang slider
-            sl = Slider(min=sl_min, max=sl_max, value=float(default), step=0.01)  # buat slider dengan rentang yg ditentukan
-            def make_on_slide(ti_ref): return lambda inst,val: setattr(ti_ref,'text',f"{val:.3f}")  # factory: sinkronisasi slider -> TextInput
-            sl.bind(value=make_on_slide(ti))                  # bind slider value perubahan ke TextInput
+            step, fmt = 0.01, "{:.3f}"                          # resolusi slider dan format teks default
+            if "Links" in label_text: sl_min, sl_max, step, fmt = 2, self.MAX_LINKS, 1, "{:.0f}"  # jumlah link rantai (2 = double pendulum)
+            if "Ensemble" in label_text: sl_min, sl_max, step, fmt = 1, self.MAX_ENSEMBLE, 1, "{:.0f}"  # jumlah pendulum (1 = mode tunggal)
+            if "Spread" in label_text: sl_min, sl_max, step, fmt = 0.0, 0.1, 0.0001, "{:.4f}"  # amplitudo gangguan sudut ensemble
+            sl = Slider(min=sl_min, max=sl_max, value=float(default), step=step)  # buat slider dengan rentang yg ditentukan
+            def make_on_slide(ti_ref, fmt): return lambda inst,val: setattr(ti_ref,'text',fmt.format(val))  # factory: sinkronisasi slider -> TextInput
+            sl.bind(value=make_on_slide(ti, fmt))             # bind slider value perubahan ke TextInput
             def make_on_text(sl_ref):                         # factory: sinkronisasi TextInput -> slider
                 def fn(inst,val):
                     try:
@@ -253,6 +378,13 @@ class SetupScreen(Screen):                               # layar setup tempat us
         self.theme_blue = ToggleButton(text="Blue", group="theme")    # toggle Blue
         theme_box.add_widget(self.theme_dark); theme_box.add_widget(self.theme_light); theme_box.add_widget(self.theme_blue)  # tambahkan toggles
         form_panel.add_widget(theme_box)                       # tambahkan theme_box ke form_panel
+        integ_box = BoxLayout(orientation='horizontal', size_hint=(1,None), height=dp(36), spacing=dp(6))  # box pilihan integrator
+        integ_box.add_widget(Label(text="Integrator:", size_hint=(None,1), width=dp(70)))  # label integrator
+        self.integ_rk4 = ToggleButton(text="RK4", group="integrator", state='down')  # RK4 langkah tetap (default)
+        self.integ_rk45 = ToggleButton(text="RK45 adaptive", group="integrator")     # Dormand–Prince adaptif
+        self.integ_mid = ToggleButton(text="Symplectic", group="integrator")         # implicit midpoint (energi terjaga)
+        integ_box.add_widget(self.integ_rk4); integ_box.add_widget(self.integ_rk45); integ_box.add_widget(self.integ_mid)  # tambahkan toggles
+        form_panel.add_widget(integ_box)                       # tambahkan integ_box ke form_panel
         ctrl_box = BoxLayout(orientation='horizontal', size_hint=(1,None), height=dp(44), spacing=dp(8))  # box kontrol bawah (tombol)
         start_btn = Button(text="Start Simulation", size_hint=(0.55,1)); start_btn.bind(on_press=self.start_simulation)  # tombol Start
         rand_btn = Button(text="Randomize Angles", size_hint=(0.35,1)); rand_btn.bind(on_press=self.randomize_angles)  # tombol random sudut
@@ -270,16 +402,32 @@ class SetupScreen(Screen):                               # layar setup tempat us
 
     def start_simulation(self, inst):                         # dipanggil saat user menekan Start Simulation
         app = App.get_running_app()                            # ambil instance aplikasi
+        if app.sim: app.sim.stop_recording(); app.sim.side_replay.text = "REPLAY: OFF"  # run baru: tutup rekaman & keluar dari replay
         try:
             m1=float(self.inputs["Mass 1 (kg)"][0].text); m2=float(self.inputs["Mass 2 (kg)"][0].text)  # baca m1, m2 dari TextInput
             l1=float(self.inputs["Length 1 (m)"][0].text); l2=float(self.inputs["Length 2 (m)"][0].text)  # baca l1, l2
             g=float(self.inputs["Gravity (m/s^2)"][0].text)  # baca gravitasi
             th1=float(self.inputs["Initial θ1 (rad)"][0].text); th2=float(self.inputs["Initial θ2 (rad)"][0].text)  # baca sudut awal
+            links=min(self.MAX_LINKS, max(2, int(float(self.inputs["Links N"][0].text))))  # jumlah link 2..64 seperti slider (link 2..N memakai Mass 2 / Length 2 / θ2)
         except:
-            m1,m2,l1,l2,g,th1,th2 = 1.0,1.0,1.0,1.0,9.81,1.0,2.0  # fallback ke nilai default kalau parsing gagal
-        app.pendulum = DoublePendulum(m1=m1,m2=m2,l1=l1,l2=l2,g=g)  # buat instance DoublePendulum baru dengan parameter yang dibaca
-        app.pendulum.state[0]=th1; app.pendulum.state[2]=th2  # set sudut awal pada state model
-        app.pendulum.history=[(0.0,th1,th2)]; app.pendulum.trail=[]  # reset history dan trail
+            m1,m2,l1,l2,g,th1,th2,links = 1.0,1.0,1.0,1.0,9.81,1.0,2.0,2  # fallback ke nilai default kalau parsing gagal
+        try:
+            n_ens=min(self.MAX_ENSEMBLE, max(1, int(float(self.inputs["Ensemble N"][0].text)))); spread=abs(float(self.inputs["Spread Δθ (rad)"][0].text))  # ukuran ensemble
+        except:
+            n_ens, spread = 1, 1e-3
+        if links == 2: app.pendulum = DoublePendulum(m1=m1,m2=m2,l1=l1,l2=l2,g=g)  # buat instance DoublePendulum baru dengan parameter yang dibaca
+        else: app.pendulum = ChainPendulum([m1] + [m2]*(links-1), [l1] + [l2]*(links-1), g)  # rantai N link (solver tegangan O(N))
+        app.pendulum.state = [th1, 0.0] + [th2, 0.0]*(links-1)  # set sudut awal pada state model
+        if self.integ_rk45.state == 'down': app.pendulum.set_integrator('rk45')  # integrator adaptif bila dipilih
+        elif self.integ_mid.state == 'down':                   # integrator simplektik bila dipilih (hanya double pendulum)
+            if 'midpoint' in app.pendulum.INTEGRATORS: app.pendulum.set_integrator('midpoint')
+            else: Logger.warning("Integrator: symplectic hanya untuk 2 link, memakai RK4")
+        app.pendulum.enable_energy_monitor()                   # pantau drift energi (ditampilkan di drawer)
+        app.pendulum.checkpointer = Checkpointer()             # checkpoint tiap 10 s simulasi (untuk SEEK)
+        app.pendulum.analytics = Analytics(app.pendulum)       # analitik streaming untuk panel ANALYTICS (direset oleh reset_buffers)
+        app.pendulum.reset_buffers(0.0)                           # reset history dan trail (ring buffer, tanpa realokasi)
+        app.ensemble = app.make_ensemble(app.pendulum, n_ens, spread)  # N pendulum dengan sudut sedikit berbeda (None bila N = 1)
+        if app.physics: app.physics.set_pendulum(app.pendulum, app.ensemble)  # thread fisika beralih ke model baru
         app.sim_running=True; app.show_trail=True                # set flag simulasi running dan tampilkan trail
         if self.theme_light.state == 'down': app.request_theme('Light')  # jika toggle Light aktif, request theme Light
         elif self.theme_blue.state == 'down': app.request_theme('Blue')  # jika Blue aktif, request theme Blue
@@ -312,23 +460,38 @@ class SimulationScreen(Screen):                             # layar simulasi uta
         self.toggle_btn.bind(on_press=self.toggle_drawer); self._add_fade(self.toggle_btn)  # bind aksi toggle + tambahkan efek fade
         hdr.add_widget(Label()); hdr.add_widget(self.toggle_btn)  # tambahkan toggle ke header (dengan spacer label)
         self.drawer.add_widget(hdr)                            # tambahkan header ke drawer
+        body = BoxLayout(orientation='vertical', size_hint=(1,None), spacing=dp(8))  # isi drawer (digulir bila lebih tinggi dari layar)
+        body.bind(minimum_height=body.setter('height'))
+        scroll = ScrollView(do_scroll_x=False, bar_width=dp(4)); scroll.add_widget(body); self.drawer.add_widget(scroll)
         # buttons grid
-        grid = GridLayout(cols=2, spacing=dp(8), size_hint=(1,None), height=dp(220))  # grid tombol di drawer
+        grid = GridLayout(cols=2, spacing=dp(8), size_hint=(1,None), height=dp(364))  # grid tombol di drawer
         self.side_resume = Button(text="RESUME"); self._add_fade(self.side_resume); self.side_resume.bind(on_press=self.toggle_pause)  # resume/pause
         self.side_restart = Button(text="RESTART"); self._add_fade(self.side_restart); self.side_restart.bind(on_press=self.reset_sim)  # restart
         self.side_back = Button(text="BACK TO SETUP"); self._add_fade(self.side_back); self.side_back.bind(on_press=self.back_to_setup)  # kembali ke setup
         self.side_trail = Button(text="TRAIL: OFF"); self._add_fade(self.side_trail); self.side_trail.bind(on_press=self.toggle_trail)  # toggle trail on/off
         self.side_clear = Button(text="CLEAR GRAPH"); self._add_fade(self.side_clear); self.side_clear.bind(on_press=self.clear_graph)  # clear graph
         self.side_theme = Button(text="THEME"); self._add_fade(self.side_theme); self.side_theme.bind(on_press=self.cycle_theme)  # cycle theme button
+        self.side_record = Button(text="REC: OFF"); self._add_fade(self.side_record); self.side_record.bind(on_press=self.toggle_record)  # rekam trajektori ke file
+        self.side_replay = Button(text="REPLAY: OFF"); self._add_fade(self.side_replay); self.side_replay.bind(on_press=self.toggle_replay)  # putar ulang rekaman terakhir
         grid.add_widget(self.side_resume); grid.add_widget(self.side_restart)  # tambahkan tombol ke grid (row1)
         grid.add_widget(self.side_back); grid.add_widget(self.side_trail)     # row2
         grid.add_widget(self.side_clear); grid.add_widget(self.side_theme)    # row3
-        self.drawer.add_widget(grid)                           # tambahkan grid tombol ke drawer
+        self.side_prof = Button(text="PROFILER: OFF"); self._add_fade(self.side_prof); self.side_prof.bind(on_press=self.toggle_profiler)  # overlay profiler
+        self.side_metrics = Button(text="METRICS: OFF"); self._add_fade(self.side_metrics); self.side_metrics.bind(on_press=self.toggle_metrics)  # ekspor metrik ke file
+        grid.add_widget(self.side_record); grid.add_widget(self.side_replay)  # row4
+        grid.add_widget(self.side_prof); grid.add_widget(self.side_metrics)   # row5
+        body.add_widget(grid)                                  # tambahkan grid tombol ke drawer
         # time display
         timebox = BoxLayout(orientation='vertical', size_hint=(1,None), height=dp(100))  # box untuk menampilkan waktu simulasi
         timebox.add_widget(Label(text="TIME", size_hint=(1,None), height=dp(18)))  # label TIME
         self.big_time = Label(text="00:00:00", font_size=dp(20)); timebox.add_widget(self.big_time)  # label besar untuk menampilkan waktu
-        self.drawer.add_widget(timebox)                        # tambahkan timebox ke drawer
+        self.energy_label = Label(text="ΔE/E: -", size_hint=(1,None), height=dp(18)); timebox.add_widget(self.energy_label)  # drift energi relatif
+        body.add_widget(timebox)                               # tambahkan timebox ke drawer
+        # seek ke waktu simulasi (restore checkpoint terdekat + fast-forward)
+        seekbox = BoxLayout(orientation='horizontal', size_hint=(1,None), height=dp(36), spacing=dp(8))
+        self.seek_input = TextInput(hint_text="t (s)", multiline=False, input_filter='float'); self.seek_input.bind(on_text_validate=self.seek_to)
+        self.side_seek = Button(text="SEEK", size_hint=(None,1), width=dp(80)); self._add_fade(self.side_seek); self.side_seek.bind(on_press=self.seek_to)
+        seekbox.add_widget(self.seek_input); seekbox.add_widget(self.side_seek); body.add_widget(seekbox)
         # speed slider + value (value below)
         speedbox = BoxLayout(orientation='vertical', size_hint=(1,None), height=dp(120))  # box untuk speed control
         speedbox.add_widget(Label(text="SPEED", size_hint=(1,None), height=dp(20)))  # label SPEED
@@ -336,7 +499,16 @@ class SimulationScreen(Screen):                             # layar simulasi uta
         self.speed_slider.bind(value=self.on_speed_change); self._add_fade(self.speed_slider)  # bind perubahan nilai ke handler
         speedbox.add_widget(self.speed_slider)                # tambahkan slider ke speedbox
         self.speed_value = Label(text="1.00x", size_hint=(1,None), height=dp(20)); speedbox.add_widget(self.speed_value)  # label menunjukkan nilai speed
-        self.drawer.add_widget(speedbox)                       # tambahkan speedbox ke drawer
+        body.add_widget(speedbox)                              # tambahkan speedbox ke drawer
+        # profiler overlay (tersembunyi sampai tombol PROFILER ditekan)
+        self.prof_label = Label(text="", font_size=dp(11), halign='left', valign='top', size_hint=(1,None), height=0, opacity=0)
+        self.prof_label.bind(size=lambda l, s: setattr(l, 'text_size', s)); body.add_widget(self.prof_label)
+        self._prof_next = 0.0                                  # waktu refresh teks overlay berikutnya (4 Hz cukup untuk dibaca)
+        # panel analitik streaming (Poincaré, spektrum, flip, histogram ruang fase)
+        self.side_analytics = Button(text="ANALYTICS: OFF", size_hint=(1,None), height=dp(40)); self._add_fade(self.side_analytics)
+        self.side_analytics.bind(on_press=self.toggle_analytics); body.add_widget(self.side_analytics)
+        self.analytics_panel = AnalyticsPanel(); body.add_widget(self.analytics_panel)
+        self._an_next = 0.0                                    # refresh panel analitik berikutnya (4 Hz)
         row.add_widget(self.drawer)                            # tambahkan drawer ke row (kanan)
         root.add_widget(row)                                   # tambahkan row (visual + drawer) ke root vertikal
         # graph at bottom
@@ -389,27 +561,123 @@ class SimulationScreen(Screen):                             # layar simulasi uta
         elif app.theme_name == 'Light': app.request_theme('Blue')  # Light -> Blue
         else: app.request_theme('Dark')                         # Blue -> Dark
 
+    def toggle_profiler(self, instance):                       # tampilkan/sembunyikan overlay profiler di drawer
+        show = self.prof_label.opacity == 0
+        self.prof_label.height = dp(150) if show else 0; self.prof_label.opacity = 1 if show else 0
+        if not show: self.prof_label.text = ""
+        self._prof_next = 0.0; self.side_prof.text = "PROFILER: ON" if show else "PROFILER: OFF"
+
+    def toggle_analytics(self, instance):                      # tampilkan/sembunyikan panel analitik di drawer
+        show = self.analytics_panel.opacity == 0
+        self.analytics_panel.height = dp(390) if show else 0; self.analytics_panel.opacity = 1 if show else 0
+        self._an_next = 0.0; self.side_analytics.text = "ANALYTICS: ON" if show else "ANALYTICS: OFF"
+
+    def _refresh_analytics(self, app):                        # salin snapshot di bawah lock model (murah), gambar di luar lock
+        a = getattr(app.pendulum, 'analytics', None)
+        if a is None: return self.analytics_panel.show(None)
+        with app.model_lock(): snap = a.snapshot()
+        return self.analytics_panel.show(snap)
+
+    def toggle_metrics(self, instance):                        # stream metrik profiler ke metrics/metrics-<waktu>.jsonl
+        prof = App.get_running_app().profiler
+        if prof.exporting: prof.stop_export(); self.side_metrics.text = "METRICS: OFF"; return
+        os.makedirs("metrics", exist_ok=True)
+        prof.start_export(os.path.join("metrics", time.strftime("metrics-%Y%m%d-%H%M%S.jsonl")))
+        self.side_metrics.text = "METRICS: ON"
+
+    def _redraw(self, prof, name, fn):                         # redraw satu canvas: diukur, error dihitung & di-log (UI tetap jalan)
+        try:
+            with prof.measure(name): fn()
+        except Exception as e:
+            if prof.error(name, e): Logger.exception(f"Redraw: {name} gagal")
+
     def update(self, dt):                                      # dipanggil tiap frame oleh Clock.schedule_interval
         app = App.get_running_app()
-        if hasattr(app,'pendulum'):
-            app.pendulum.dt = app.pendulum.base_dt * getattr(app,'speed',1.0)  # atur dt model berdasarkan multiplier speed
-        if getattr(app,'sim_running',False) and not self.paused and hasattr(app,'pendulum'):
-            sub = max(1, int(max(1.0, getattr(app,'speed',1.0)) * 2))  # tentukan berapa sub-step update untuk kestabilan saat speed tinggi
-            for _ in range(sub): app.pendulum.update()              # jalankan beberapa update fisika per frame bila perlu
+        prof = app.profiler; prof.frame(dt)                     # interval frame → fps dan frame drop
+        w = getattr(app, 'physics', None)                       # fisika berjalan di thread PhysicsWorker, bukan di callback render ini
+        if w is not None:
+            w.speed = getattr(app,'speed',1.0)                  # multiplier speed → dt dan jumlah sub-step di worker
+            w.running = getattr(app,'sim_running',False) and not self.paused  # jeda/lanjut
         if hasattr(app,'pendulum'):
             self.big_time.text = time.strftime("%H:%M:%S", time.gmtime(app.pendulum.time))  # tampilkan waktu simulasi dalam format HH:MM:SS (GMT based)
+            mon = app.pendulum.energy_monitor
+            if mon: self.energy_label.text = f"ΔE/E: {mon.drift:+.2e}"  # drift energi relatif terhadap awal run
         # update canvases' background via app animated colors
-        try:
-            self.pendulum_canvas.redraw(); self.graph.redraw()  # panggil redraw untuk canvas visual dan graph
-        except Exception:
-            pass                                              # jika terjadi error saat redraw, ignore agar UI tidak crash
+        self._redraw(prof, "pendulum", self.pendulum_canvas.redraw); self._redraw(prof, "graph", self.graph.redraw)
+        prof.gauge("graph", self.graph.vertex_count); prof.gauge("trail", self.pendulum_canvas.vertex_count)
+        prof.poll()                                            # baris ekspor metrik (bila aktif)
+        now = time.perf_counter()
+        if self.prof_label.opacity and now >= self._prof_next:
+            self.prof_label.text = prof.overlay_text(); self._prof_next = now + 0.25
+        if self.analytics_panel.opacity and now >= self._an_next:
+            self._an_next = now + 0.25
+            self._redraw(prof, "analytics", lambda: prof.gauge("analytics", self._refresh_analytics(app)))
 
     def reset_sim(self, instance):                             # fungsi restart/reset state dinamika (tetap pada sudut awal)
         app = App.get_running_app()
         if hasattr(app,'pendulum'):
-            p = app.pendulum; p.state[1]=0.0; p.state[3]=0.0; p.time=0.0  # set omega ke 0 dan waktu ke 0
-            p.history=[(0.0,p.state[0],p.state[2])]; p.trail=[]           # reset history dan trail
-            self.graph.clear_graph()                        # clear graph juga
+            with app.model_lock():                          # ubah model saat thread fisika tidak sedang tick
+                p = app.pendulum; p.state[1::2] = [0.0] * (len(p.state) // 2); p.time=0.0  # set semua omega ke 0 dan waktu ke 0
+                p.reset_buffers(0.0)                                          # reset history dan trail
+                if app.ensemble is not None and not isinstance(p, ReplayPendulum):              # bangun ulang ensemble di sekitar state referensi yang baru
+                    app.ensemble = app.make_ensemble(p, len(app.ensemble), app.ensemble.spread)
+                    if app.physics: app.physics.set_pendulum(p, app.ensemble)
+                self.graph.clear_graph()                    # clear graph juga
+                if p.recorder: self.stop_recording(); self.start_recording()  # waktu kembali ke 0 → rekaman baru
+
+    def start_recording(self):                                 # mulai merekam model live ke recordings/run-<waktu>.dptraj
+        app = App.get_running_app(); p = app.pendulum
+        if p is None or isinstance(p, ReplayPendulum): return
+        os.makedirs("recordings", exist_ok=True)
+        path = os.path.join("recordings", time.strftime("run-%Y%m%d-%H%M%S.dptraj"))
+        with app.model_lock():
+            p.recorder = TrajectoryWriter(path, p); p.recorder.record(p)  # record awal = state sekarang
+        app.last_recording = path; self.side_record.text = "REC: ON"
+
+    def stop_recording(self):                                  # flush dan tutup rekaman aktif
+        app = App.get_running_app(); p = app.pendulum
+        if p is not None and getattr(p, 'recorder', None):
+            with app.model_lock():
+                p.recorder.close(); p.recorder = None
+        self.side_record.text = "REC: OFF"
+
+    def toggle_record(self, instance):                         # tombol REC
+        p = App.get_running_app().pendulum
+        if p is not None and p.recorder: self.stop_recording()
+        else: self.start_recording()
+
+    def toggle_replay(self, instance):                         # tombol REPLAY: putar rekaman terakhir lewat canvas & worker, atau kembali ke live
+        app = App.get_running_app()
+        if isinstance(app.pendulum, ReplayPendulum):           # kembali ke model live
+            app.pendulum = app.live_pendulum
+            if app.physics: app.physics.set_pendulum(app.pendulum, app.ensemble)  # ensemble live ikut kembali
+            self.side_replay.text = "REPLAY: OFF"; return
+        self.stop_recording()                                  # pastikan rekaman yang sedang berjalan ter-flush
+        paths = sorted(glob.glob(os.path.join("recordings", "*.dptraj")), key=os.path.getmtime)
+        path = app.last_recording or (paths[-1] if paths else None)
+        if not path or not os.path.exists(path): return
+        reader = TrajectoryReader(path)
+        if not len(reader): return
+        app.live_pendulum = app.pendulum; app.pendulum = ReplayPendulum(reader)  # canvas membaca rekaman lewat memmap
+        if app.physics: app.physics.set_pendulum(app.pendulum)  # worker memutar rekaman dengan pacing yang sama seperti live
+        self.side_replay.text = "REPLAY: ON"
+
+    def seek_to(self, instance):                               # tombol SEEK: lompat ke waktu pada input (live: checkpoint + fast-forward, replay: index rekaman)
+        app = App.get_running_app(); p = app.pendulum
+        try:
+            t = max(0.0, float(self.seek_input.text))
+        except ValueError:
+            return
+        replay = isinstance(p, ReplayPendulum)
+        if p is None or not replay and p.checkpointer is None: return
+        with app.model_lock(), app.profiler.measure("seek"):
+            recording = not replay and p.recorder is not None
+            if recording: self.stop_recording()             # waktu melompat → rekaman lama ditutup, rekaman baru dimulai setelah seek
+            p.seek(t)
+            if not replay and app.ensemble is not None:     # ensemble dibangun ulang di sekitar state hasil seek
+                app.ensemble = app.make_ensemble(p, len(app.ensemble), app.ensemble.spread)
+            if app.physics: app.physics.set_pendulum(p, None if replay else app.ensemble)  # publikasikan state baru ke render
+            if recording: self.start_recording()
 
     def back_to_setup(self, instance):                         # kembali ke layar setup
         App.get_running_app().root.current = 'setup'           # ubah screen manager ke 'setup'
@@ -423,6 +691,11 @@ class DoublePendulumApp(App):                               # kelas utama aplika
     show_trail = BooleanProperty(True)                       # property boolean untuk menampilkan trail
     theme_name = StringProperty("Dark")                      # nama theme saat ini
     pendulum = None                                          # placeholder untuk instance DoublePendulum
+    profiler = None                                          # Profiler: metrik per-tahap (fisika, redraw, animasi theme)
+    physics = None                                           # PhysicsWorker yang menjalankan pendulum di thread latar
+    last_recording = None                                    # path rekaman trajektori terakhir (untuk REPLAY)
+    live_pendulum = None                                     # model live yang disimpan selama replay
+    ensemble = None                                          # BatchPendulum mode ensemble (None = satu pendulum)
     sim_running = False                                      # flag apakah simulasi sedang berjalan
 
     current_dark_bg = ListProperty([0.06,0.06,0.06,1])       # properti warna latar gelap saat ini (rgba)
@@ -437,6 +710,7 @@ class DoublePendulumApp(App):                               # kelas utama aplika
 
     def build(self):                                         # dipanggil ketika aplikasi dibangun (sebelum on_start)
         self.title = "Double Pendulum - Drawer UI"          # set judul window aplikasi
+        self.profiler = Profiler()                          # dibuat sebelum screen agar hook update/redraw langsung bisa mencatat
         sm = ScreenManager(); self.setup = SetupScreen(); self.sim = SimulationScreen()  # buat screen manager dan screen
         sm.add_widget(self.setup); sm.add_widget(self.sim)   # tambahkan screen ke screen manager
         pal = self.THEMES.get(self.theme_name, self.THEMES['Dark'])  # ambil palet warna awal berdasarkan theme_name
@@ -446,6 +720,23 @@ class DoublePendulumApp(App):                               # kelas utama aplika
 
     def on_start(self):                                     # dipanggil saat aplikasi selesai build dan mulai berjalan
         self.pendulum = DoublePendulum(); self.sim_running = False; self.speed = 1.0; self.theme_name='Dark'  # inisialisasi model dan flags
+        self.physics = PhysicsWorker(self.pendulum); self.physics.profiler = self.profiler
+        self.physics.start()                                 # thread fisika dengan laju tick tetap (terpisah dari render 60 Hz)
+
+    def on_stop(self):                                      # dipanggil saat aplikasi ditutup
+        if self.physics: self.physics.stop()                # hentikan thread fisika
+        self.profiler.stop_export()                          # tutup stream metrik
+        if self.pendulum is not None and getattr(self.pendulum, 'recorder', None): self.pendulum.recorder.close()  # flush rekaman
+
+    def make_ensemble(self, pendulum, n, spread):           # BatchPendulum di sekitar pendulum referensi, atau None bila N = 1 / tanpa numpy
+        if n <= 1: return None
+        try:
+            return BatchPendulum.around(pendulum, n, spread)
+        except (ImportError, ValueError) as e:            # tanpa numpy, rantai N > 2, atau integrator selain RK4: mode tunggal
+            Logger.warning(f"Ensemble: {e}"); return None
+
+    def model_lock(self):                                   # lock untuk mengubah model dari UI tanpa bentrok dengan tick fisika
+        return self.physics.lock if self.physics else contextlib.nullcontext()
 
     def request_theme(self, new_theme, duration=0.25):      # fungsi untuk mengubah tema dengan transisi animasi
         if new_theme not in self.THEMES: return             # jika tema tidak valid, abaikan
@@ -454,6 +745,8 @@ class DoublePendulumApp(App):                               # kelas utama aplika
         start_light = list(self.current_light_bg); end_light = list(self.THEMES[new_theme]['light_bg'])  # untuk light_bg
         steps = max(6, int(60 * duration)); step = {'i':0}  # hitung jumlah langkah interpolasi berdasarkan durasi animasi
         def stepper(dt):
+            with self.profiler.measure("theme"): return advance()  # satu langkah animasi tema, diukur profiler
+        def advance():
             i = step['i'] + 1; t = i / steps               # progres t di antara 0..1
             def lerp(a,b,t): return a + (b-a) * t          # linear interpolation helper
             self.current_dark_bg = [lerp(start_dark[j], end_dark[j], t) for j in range(4)]  # interpolasi warna dark_bg
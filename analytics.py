@@ -0,0 +1,192 @@
+# analytics.py — analitik streaming yang dipasang di DoublePendulum.update(): irisan Poincaré, spektrum bergulir, hitungan flip, histogram ruang fase
+import math                                               # wrap sudut, floor (hitungan flip), log (skala histogram)
+from array import array                                   # histogram sebagai array integer datar (memori tetap)
+from physics import RingBuffer                            # titik Poincaré di ring buffer kapasitas tetap
+try:
+    import numpy as np                                    # opsional: hanya untuk spektrum (sliding DFT)
+except ImportError:
+    np = None                                             # tanpa numpy: Poincaré, flip dan histogram tetap jalan
+
+TWO_PI = 2.0 * math.pi
+
+def wrap(a):                                              # sudut ke [-π, π)
+    return (a + math.pi) % TWO_PI - math.pi
+
+def omega_bounds(p):                                      # batas |ω1|, |ω2| dari energi: T >= ½ m1 l1² ω1² dan T >= ½ m1 m2 l2²/(m1+m2) ω2² (berlaku juga untuk rantai N link)
+    kin, pot = p.energy()
+    room = kin + pot + p.potential_depth()                # energi kinetik maksimum = E − V_min
+    room = 1.05 * max(room, 1e-9)                         # sedikit ruang untuk drift energi integrator
+    (m1, m2), (l1, l2) = p.masses[:2], p.lengths[:2]      # hanya dua link pertama yang dianalisis
+    w1 = math.sqrt(2.0 * room / (m1 * l1 * l1))
+    w2 = math.sqrt(2.0 * room * (m1 + m2) / (m1 * m2 * l2 * l2))
+    return max(1.0, w1), max(1.0, w2)                     # minimal ±1 rad/s agar histogram tidak degenerate saat diam
+
+# ---- Poincaré: θ1 melewati 0 (mod 2π) dengan ω1 > 0; (θ2, ω2) diinterpolasi linear ke irisan ----
+class Poincare:
+    def __init__(self, capacity=4096):
+        self.points = RingBuffer(capacity, 3)             # (t, θ2 ter-wrap, ω2); titik tertua tertimpa
+        self.count = 0                                    # jumlah crossing sepanjang run (tidak dibatasi kapasitas)
+
+    def clear(self):
+        self.points.clear(); self.count = 0
+
+    def add(self, t0, y0, t1, y1):                        # periksa langkah (t0, y0) → (t1, y1)
+        n = TWO_PI * round(y0[0] / TWO_PI)                # kelipatan 2π terdekat titik awal; kedua ujung langkah relatif terhadapnya
+        a = y0[0] - n; b = y1[0] - n                      # bukan wrap(): wrap(−1e−17) = 0.0 → crossing tepat di sampel terlewat; b langkah ini == a langkah berikutnya
+        if a < 0.0 <= b:
+            f = -a / (b - a)                              # posisi irisan di dalam langkah (0..1)
+            if y0[1] + f * (y1[1] - y0[1]) > 0.0:         # arah crossing: ω1 > 0
+                self.points.append(t0 + f * (t1 - t0), wrap(y0[2] + f * (y1[2] - y0[2])), y0[3] + f * (y1[3] - y0[3]))
+                self.count += 1
+
+# ---- flip: θ lengan melewati kelipatan ganjil π (lewat atas pivot) ----
+class FlipCounter:
+    def __init__(self):
+        self.counts = [0, 0]; self.first = None           # flip per lengan, waktu flip pertama
+        self._lo = [0.0, 0.0]; self._hi = [0.0, 0.0]      # batas putaran sekarang [(2k−1)π, (2k+1)π) per lengan; cukup dibandingkan tiap langkah
+
+    def clear(self):
+        self.counts = [0, 0]; self.first = None
+
+    def _bounds(self, i, a):                              # indeks putaran k dari sudut a → perbarui batas, kembalikan k
+        k = math.floor((a + math.pi) / TWO_PI)
+        self._lo[i] = k * TWO_PI - math.pi; self._hi[i] = self._lo[i] + TWO_PI
+        return k
+
+    def rebase(self, y):                                  # awal segmen: batas dari state sekarang (tanpa menghitung flip)
+        self._bounds(0, y[0]); self._bounds(1, y[2])
+
+    def add(self, t, y):
+        for i, a in ((0, y[0]), (1, y[2])):
+            if not self._lo[i] <= a < self._hi[i]:        # keluar dari putaran sekarang (jarang) → hitung berapa kali melewati ±π
+                k0 = round((self._lo[i] + math.pi) / TWO_PI)
+                self.counts[i] += abs(self._bounds(i, a) - k0)
+                if self.first is None: self.first = t
+
+# ---- histogram 2D ruang fase (θ ter-wrap, ω) dengan rentang tetap; ω di luar rentang dijepit ke bin tepi ----
+class PhaseHistogram:
+    def __init__(self, bins=64):
+        self.bins = bins
+        self._si = bins / TWO_PI                          # bin per radian (θ)
+        self.clear(1.0)
+
+    def clear(self, omega_max):
+        self.counts = array('q', bytes(8 * self.bins * self.bins))  # baris = bin ω (bawah → atas), kolom = bin θ (−π → π)
+        self.omega_max = omega_max; self._sj = self.bins / (2.0 * omega_max)  # bin per rad/s (ω)
+        self.total = 0; self.clipped = 0                  # sampel, sampel di luar rentang ω
+
+    def add(self, theta, omega):
+        n = self.bins
+        v = (omega + self.omega_max) * self._sj
+        if 0.0 <= v < n: j = int(v)
+        else: j = 0 if v < 0.0 else n - 1; self.clipped += 1
+        i = int((theta + math.pi) % TWO_PI * self._si)
+        if i >= n: i = n - 1                              # pembulatan tepat di +π
+        self.counts[j * n + i] += 1; self.total += 1
+
+def levels(counts):                                       # hitungan histogram → intensitas 0..255 per bin (skala log) sebagai bytes, baris demi baris
+    peak = max(counts)
+    if not peak: return bytes(len(counts))
+    s = 255.0 / math.log1p(peak); lut = {}                # banyak bin berbagi nilai hitungan kecil → cache log
+    out = bytearray(len(counts))
+    for k, c in enumerate(counts):
+        if c:
+            v = lut.get(c)
+            if v is None: v = lut[c] = int(math.log1p(c) * s)
+            out[k] = v
+    return bytes(out)
+
+# ---- spektrum daya bergulir θ1, θ2: sampel tiap sample_dt detik simulasi, sliding DFT O(size) per sampel ----
+class Spectrum:
+    def __init__(self, size=256, sample_dt=0.05):
+        if np is None: raise ImportError("Spectrum membutuhkan numpy (pip install numpy)")
+        self.size = size; self.sample_dt = sample_dt      # jendela = size · sample_dt detik (default 12.8 s, resolusi ±0.08 Hz)
+        k = np.arange(size // 2 + 1)
+        self.twiddle = np.exp(2j * np.pi * k / size)      # faktor rotasi sliding DFT per bin
+        self.freqs = k / (size * sample_dt)               # frekuensi tiap bin (Hz)
+        self.window = np.zeros((2, size)); self.X = np.zeros((2, k.size), dtype=complex)
+        self.clear()
+
+    def clear(self):
+        self.pos = 0; self.n = 0; self.next_t = None      # n = sampel sejak clear (spektrum valid setelah n >= size)
+        self.window[:] = 0.0; self.X[:] = 0.0
+
+    @property
+    def ready(self): return self.n >= self.size
+
+    def rebase(self, t):                                  # awal segmen: sampel berikutnya tepat di t
+        self.next_t = t
+
+    def add(self, t0, y0, t1, y1):                        # sampel seragam di dalam langkah (t0, t1] via interpolasi linear
+        while self.next_t <= t1:
+            f = (self.next_t - t0) / (t1 - t0) if t1 > t0 else 1.0
+            self._push(y0[0] + f * (y1[0] - y0[0]), y0[2] + f * (y1[2] - y0[2]))
+            self.next_t += self.sample_dt
+
+    def _push(self, a, b):
+        w = self.window
+        if self.n == 0:                                   # sampel pertama mengisi jendela (tanpa lompatan dari nol)
+            w[0] = a; w[1] = b; self.X = np.fft.rfft(w, axis=1)
+        else:
+            d0 = a - w[0, self.pos]; d1 = b - w[1, self.pos]; w[0, self.pos] = a; w[1, self.pos] = b
+            X = self.X; X[0] += d0; X[1] += d1; X *= self.twiddle  # S_k ← (S_k + x_baru − x_lama)·e^{2πik/N}
+        self.pos += 1; self.n += 1
+        if self.pos == self.size:                         # jendela kembali terurut (tertua → terbaru): resinkron untuk membuang drift pembulatan
+            self.pos = 0; self.X = np.fft.rfft(w, axis=1)
+
+    def power(self):                                      # (frekuensi (K,), daya (2, K)) — jendela Hann via konvolusi 3-tap di domain frekuensi, rata-rata dibuang
+        X = self.X.copy(); X[:, 0] = 0.0
+        lo = np.concatenate((np.conj(X[:, 1:2]), X[:, :-1]), axis=1)   # X[k−1] (X[−1] = conj X[1] untuk sinyal real)
+        hi = np.concatenate((X[:, 1:], np.conj(X[:, -2:-1])), axis=1)  # X[k+1] (X[N/2+1] = conj X[N/2−1])
+        H = 0.5 * X - 0.25 * (lo + hi)
+        return self.freqs, (H.real ** 2 + H.imag ** 2) * (2.0 * self.sample_dt / (0.375 * self.size))  # PSD satu sisi (rad²/Hz)
+
+    def peaks(self):                                      # frekuensi dominan (Hz) θ1 dan θ2, tanpa bin DC
+        f, P = self.power()
+        return tuple(float(f[1 + int(np.argmax(row[1:]))]) for row in P)
+
+# ---- Analytics: dipasang di DoublePendulum.analytics, observe() dipanggil tiap update() ----
+class Analytics:                                          # semua struktur berukuran tetap; kerja per langkah O(1) (spektrum: O(size) per sample_dt)
+    def __init__(self, pendulum, bins=64, capacity=4096, fft_size=256, sample_dt=0.05):
+        self.poincare = Poincare(capacity); self.flips = FlipCounter()
+        self.density = (PhaseHistogram(bins), PhaseHistogram(bins))  # (θ1, ω1) dan (θ2, ω2)
+        self.spectrum = Spectrum(fft_size, sample_dt) if np is not None else None
+        self.reset(pendulum)
+
+    def reset(self, p):                                   # run baru / state diubah dari luar: mulai dari nol, rentang ω dari energi sekarang
+        w1, w2 = omega_bounds(p)
+        self.density[0].clear(w1); self.density[1].clear(w2)
+        self.poincare.clear(); self.flips.clear()
+        if self.spectrum is not None: self.spectrum.clear()
+        self.steps = 0; self.since = None                 # since = awal data (setelah seek: awal ekor fast-forward)
+        self._rebase(p.time, p.state)
+
+    def _rebase(self, t, y):                              # awal segmen kontinu (setelah reset / lompatan waktu)
+        self._t = t; self._y = tuple(y)
+        if not self.steps: self.since = t
+        self.flips.rebase(y)
+        if self.spectrum is not None: self.spectrum.rebase(t)
+
+    def observe(self, p):                                 # satu langkah baru: (t_lama, y_lama) → (p.time, p.state)
+        t1 = p.time; y1 = p.state; t0 = self._t; y0 = self._y
+        if not 0.0 < t1 - t0 <= 2.0 * p.dt:               # bukan langkah berurutan (restore checkpoint, state diubah): segmen baru
+            self._rebase(t1, y1); return
+        self.poincare.add(t0, y0, t1, y1)
+        self.flips.add(t1, y1)
+        self.density[0].add(y1[0], y1[1]); self.density[1].add(y1[2], y1[3])
+        if self.spectrum is not None: self.spectrum.add(t0, y0, t1, y1)
+        self._t = t1; self._y = y1; self.steps += 1         # step() selalu membuat list state baru → referensi aman disimpan
+
+    def summary(self):                                    # ringkasan skalar (label drawer, headless)
+        s = {"time": self._t, "since": self.since, "steps": self.steps, "crossings": self.poincare.count,
+             "flips1": self.flips.counts[0], "flips2": self.flips.counts[1], "first_flip": self.flips.first,
+             "clipped": self.density[0].clipped + self.density[1].clipped, "peak1": None, "peak2": None}
+        if self.spectrum is not None and self.spectrum.ready: s["peak1"], s["peak2"] = self.spectrum.peaks()
+        return s
+
+    def snapshot(self):                                   # salinan untuk UI (panggil di bawah PhysicsWorker.lock, jadi hanya salinan murah; levels() di luar lock)
+        spec = self.spectrum.power() if self.spectrum is not None else None  # None = tanpa numpy (bukan "belum ada sampel")
+        return {"summary": self.summary(),
+                "poincare": array('d', self.poincare.points.view()),  # (t, θ2, ω2) interleaved
+                "density": tuple(array('q', h.counts) for h in self.density), "omega_max": tuple(h.omega_max for h in self.density),
+                "bins": self.density[0].bins, "spectrum": spec}
@@ -0,0 +1,222 @@
+# bench.py — benchmark reproducible untuk hot path: integrator, update model (history/trail), LOD, redraw canvas, dan rasterizer export
+import argparse, contextlib, itertools, json, math, platform, sys, time  # modul standar: CLI, baseline JSON, info mesin, timer
+import physics                                            # model fisika (tanpa Kivy)
+from physics import DoublePendulum, derivatives, rk4_step # hot path skalar
+from lod import MinMaxLOD, DistanceLOD                    # LOD yang dipakai redraw canvas
+
+BENCHMARKS = []                                           # registry: (nama, grup, unit operasi, fungsi setup)
+DEFAULT_GROUPS = ("integrator", "batch", "model", "lod", "export")  # grup 'canvas' butuh Kivy dengan window provider → opt-in
+
+def bench(name, group, unit):                            # dekorator: setup() mengembalikan (fungsi yang diukur, jumlah operasi per panggilan)
+    def deco(setup):
+        BENCHMARKS.append((name, group, unit, setup)); return setup
+    return deco
+
+def _measure(fn, ops, min_time=0.2, repeat=5):           # waktu terbaik per operasi (detik) — kalibrasi jumlah loop seperti timeit
+    loops = 1
+    while True:                                           # kalibrasi: perbesar loop sampai satu pengukuran >= min_time/repeat
+        t0 = time.perf_counter()
+        for _ in range(loops): fn()
+        dt = time.perf_counter() - t0
+        if dt >= min_time / repeat: break
+        loops *= 2
+    best = dt
+    for _ in range(repeat - 1):
+        t0 = time.perf_counter()
+        for _ in range(loops): fn()
+        best = min(best, time.perf_counter() - t0)
+    return best / (loops * ops)
+
+def _pendulum(**kw):                                      # pendulum dengan kondisi awal tetap (hasil reproducible)
+    p = DoublePendulum(**kw); p.state = [1.0, 0.0, 2.0, 0.0]; p.reset_buffers(0.0)
+    return p
+
+# ---- integrator ----
+@bench("derivatives", "integrator", "call")
+def _b_derivatives():
+    p = _pendulum(); y = p.state
+    return (lambda: derivatives(p, y)), 1
+
+@bench("rk4_step", "integrator", "step")
+def _b_rk4():
+    p = _pendulum(); box = [p.state]
+    def run():
+        box[0] = rk4_step(p, box[0], 0.005)
+    return run, 1
+
+def _model_steps(integrator, n=200, kernel="auto"):      # DoublePendulum.step() untuk integrator/kernel tertentu, n langkah per panggilan
+    p = _pendulum(kernel=kernel)
+    if integrator != "rk4": p.set_integrator(integrator)
+    def run():
+        for _ in range(n): p.step()
+    return run, n
+
+for _k in ("generic", "closure", "numba"):
+    bench(f"step[rk4,kernel={_k}]", "integrator", "step")(lambda k=_k: _model_steps("rk4", kernel=k))
+bench("step[rk45]", "integrator", "step")(lambda: _model_steps("rk45"))
+bench("step[midpoint]", "integrator", "step")(lambda: _model_steps("midpoint"))
+
+def _chain(links, n=20):                                  # ChainPendulum.step() (rk4_step + chain_derivatives O(N)), n langkah per panggilan
+    p = physics.ChainPendulum([1.0] * links, [1.0] * links); p.state = [1.0, 0.0] + [2.0, 0.0] * (links - 1); p.reset_buffers(0.0)
+    def run():
+        for _ in range(n): p.step()
+    return run, n
+
+for _n in (2, 10, 50):
+    bench(f"step[chain,N={_n}]", "integrator", "step")(lambda n=_n: _chain(n))
+
+# ---- batch ----
+def _batch(n):                                            # rk4_step_batch untuk n pendulum; satu operasi = satu pendulum-step
+    b = physics.BatchPendulum([1.0 + 1e-3 * i / n for i in range(n)], 2.0)
+    return (lambda: b.update()), n
+
+for _n in (1000, 100000):
+    bench(f"rk4_step_batch[N={_n}]", "batch", "pendulum-step")(lambda n=_n: _batch(n))
+
+# ---- model update (history/trail maintenance) ----
+def _update(max_history, analytics=False):                # latensi update() saat buffer sudah penuh (kondisi steady-state)
+    p = _pendulum(max_history=max_history)
+    if analytics:
+        from analytics import Analytics
+        p.analytics = Analytics(p)                        # Poincaré, flip, histogram fase, spektrum (bila numpy ada)
+    for i in range(max_history):                          # isi buffer dengan sampel sintetis (lebih cepat daripada simulasi)
+        p.history.append(-1.0, 0.0, 0.0); p.trail.append(0.0, 0.0)
+    def run():
+        for _ in range(100): p.update()
+    return run, 100
+
+for _m in (5000, 100000, 1000000):
+    bench(f"update[max_history={_m}]", "model", "update")(lambda m=_m: _update(m))
+bench("update[analytics]", "model", "update")(lambda: _update(5000, analytics=True))
+
+# ---- LOD ----
+def _series(n, dt=0.005):                                 # seri sintetis (t, sudut) yang deterministik
+    ts = [i * dt for i in range(n)]
+    return ts, [2.0 * math.sin(1.3 * t) + 0.5 * math.sin(7.1 * t) for t in ts]
+
+@bench("MinMaxLOD.add", "lod", "sample")
+def _b_minmax():
+    ts, vs = _series(20000)
+    def run():
+        lod = MinMaxLOD(10.0 / 700); lod.extend(ts, vs)
+    return run, len(ts)
+
+@bench("DistanceLOD.add", "lod", "sample")
+def _b_distance():
+    ts, vs = _series(20000)
+    xs = [math.sin(v) for v in vs]; ys = [-math.cos(v) for v in vs]
+    def run():
+        lod = DistanceLOD(0.005)
+        for i in range(len(xs)): lod.add(i, xs[i], ys[i])
+    return run, len(xs)
+
+# ---- canvas (Kivy) ----
+class _BenchApp:                                          # pengganti App yang sedang berjalan: hanya atribut yang dibaca canvas
+    current_graph_bg = [0.95, 0.95, 0.95, 1]; current_dark_bg = [0.06, 0.06, 0.06, 1]
+    show_trail = True; physics = None
+
+    def model_lock(self):                                 # sama seperti DoublePendulumApp.model_lock
+        return self.physics.lock if self.physics else contextlib.nullcontext()
+
+def _canvas(kind, max_history):                           # redraw canvas terhadap history sintetis; satu operasi = satu frame
+    from kivy.app import App
+    import DoublePendulum as ui                           # impor UI hanya di grup canvas (membuat Window Kivy)
+    app = _BenchApp(); app.pendulum = p = _pendulum(max_history=max_history)
+    ts, vs = _series(max_history, p.dt)
+    for t, v in zip(ts, vs):                              # history & trail sintetis penuh
+        p.history.append(t, v, -v); p.trail.append(math.sin(v), -math.cos(v))
+    p.time = ts[-1]                                       # lanjutkan dari akhir history sintetis (waktu tetap monoton)
+    App._running_app = app                                # canvas memakai App.get_running_app()
+    w = ui.GraphCanvas() if kind == "graph" else ui.PendulumCanvas()
+    w.size = (900, 170) if kind == "graph" else (900, 600)
+    def run():
+        for _ in range(2): p.update()                     # sampel baru per frame seperti pacing 1x
+        w.redraw()
+    return run, 1
+
+for _m in (5000, 100000):
+    bench(f"GraphCanvas.redraw[history={_m}]", "canvas", "frame")(lambda m=_m: _canvas("graph", m))
+    bench(f"PendulumCanvas.redraw[history={_m}]", "canvas", "frame")(lambda m=_m: _canvas("pendulum", m))
+
+def _ensemble(n):                                         # tick worker (pendulum + ensemble N) lalu redraw PendulumCanvas; satu operasi = satu frame
+    from kivy.app import App
+    import DoublePendulum as ui
+    from worker import PhysicsWorker
+    app = _BenchApp(); app.pendulum = p = _pendulum()
+    app.physics = wk = PhysicsWorker(p); wk.set_pendulum(p, physics.BatchPendulum.around(p, n, seed=0)); wk.running = True  # tanpa thread
+    App._running_app = app
+    w = ui.PendulumCanvas(); w.size = (900, 600)
+    def run():
+        wk.tick(); w.redraw()
+    return run, 1
+
+for _n in (500, 2000):
+    bench(f"PendulumCanvas.redraw[ensemble={_n}]", "canvas", "frame")(lambda n=_n: _ensemble(n))
+
+# ---- export (rasterizer offscreen, numpy) ----
+def _export(kind):                                        # satu frame 1080p dari run 60 s; render = rasterisasi, png = encode saja
+    import export
+    r = export.FrameRenderer(export.simulate(60.0), 1920, 1080)
+    if kind == "render":
+        ts = itertools.cycle(r.frame_times(30))           # frame berurutan (trail/plot berubah tiap frame)
+        return (lambda: r.render(next(ts))), 1
+    img = r.render(30.0)
+    return (lambda: export.png_bytes(img)), 1
+
+bench("export.render[1920x1080]", "export", "frame")(lambda: _export("render"))
+bench("export.png_bytes[1920x1080]", "export", "frame")(lambda: _export("png"))
+
+def run(groups=DEFAULT_GROUPS, pattern=None, min_time=0.2, out=sys.stderr):  # jalankan benchmark terpilih → dict hasil
+    results = {}
+    for name, group, unit, setup in BENCHMARKS:
+        if group not in groups or (pattern and pattern not in name): continue
+        if (group in ("batch", "export") or "ensemble" in name) and physics.np is None:
+            print(f"  skip {name} (numpy tidak terpasang)", file=out); continue
+        if "kernel=numba" in name and physics.numba is None:
+            print(f"  skip {name} (numba tidak terpasang)", file=out); continue
+        fn, ops = setup()
+        per_op = _measure(fn, ops, min_time)
+        results[name] = {"group": group, "unit": unit, "seconds_per_op": per_op, "ops_per_second": 1.0 / per_op}
+        print(f"  {name:<40} {per_op * 1e6:12.3f} µs/{unit:<14} {1.0 / per_op:14,.0f} {unit}/s", file=out)
+    return results
+
+def environment():                                        # info mesin agar baseline bisa dibandingkan dengan jujur
+    env = {"python": platform.python_version(), "implementation": platform.python_implementation(),
+           "machine": platform.machine(), "platform": platform.platform()}
+    if physics.np is not None: env["numpy"] = physics.np.__version__
+    return env
+
+def compare(results, baseline, threshold):               # bandingkan dengan baseline; kembalikan daftar regresi
+    regressions = []
+    print(f"\n  {'benchmark':<40} {'baseline':>12} {'now':>12} {'change':>8}", file=sys.stderr)
+    for name, r in results.items():
+        old = baseline["results"].get(name)
+        if old is None: continue
+        change = r["seconds_per_op"] / old["seconds_per_op"] - 1.0  # positif = lebih lambat
+        flag = "  REGRESSION" if change > threshold else ""
+        print(f"  {name:<40} {old['seconds_per_op'] * 1e6:10.3f}µs {r['seconds_per_op'] * 1e6:10.3f}µs {change:+8.1%}{flag}", file=sys.stderr)
+        if flag: regressions.append(name)
+    return regressions
+
+def main(argv=None):                                      # entry point CLI: python bench.py --save bench_baseline.json
+    ap = argparse.ArgumentParser(description="Benchmark integrator, model update, LOD and canvas redraw hot paths.")
+    ap.add_argument("--groups", default=",".join(DEFAULT_GROUPS), help="daftar grup dipisah koma (tersedia: integrator,batch,model,lod,export,canvas)")
+    ap.add_argument("-k", dest="pattern", help="hanya benchmark yang namanya memuat teks ini")
+    ap.add_argument("--min-time", type=float, default=0.2, help="waktu minimal pengukuran per benchmark (s)")
+    ap.add_argument("--save", help="tulis hasil sebagai baseline JSON")
+    ap.add_argument("--compare", help="bandingkan dengan baseline JSON; exit 1 bila ada regresi")
+    ap.add_argument("--threshold", type=float, default=0.10, help="ambang regresi relatif (default 10%%)")
+    args = ap.parse_args(argv)
+    results = run(tuple(args.groups.split(",")), args.pattern, args.min_time)
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump({"environment": environment(), "created": time.time(), "results": results}, f, indent=2)
+    if args.compare:
+        with open(args.compare) as f: baseline = json.load(f)
+        if baseline.get("environment") != environment():
+            print("  peringatan: baseline dibuat di lingkungan berbeda", file=sys.stderr)
+        if compare(results, baseline, args.threshold): return 1
+    return 0
+
+if __name__ == '__main__':                                 # jalankan sebagai script
+    sys.exit(main())
@@ -0,0 +1,74 @@
+# checkpoint.py — checkpoint ringan (state, waktu, dt, ekor history/trail) + seek deterministik ke waktu simulasi mana pun
+import bisect, copy                                       # pencarian checkpoint terdekat; salinan state integrator adaptif / monitor
+from array import array                                   # ekor buffer disimpan sebagai float64 datar
+from collections import namedtuple
+
+Checkpoint = namedtuple("Checkpoint", "time state dt history trail adaptive monitor")  # cukup untuk melanjutkan run secara bit-identik
+
+class Checkpointer:                                       # dipasang di DoublePendulum.checkpointer; diambil oleh update() sebelum langkah
+    def __init__(self, interval=10.0, tail=2000, keep_tails=8, max_count=256):
+        self.interval = float(interval)                   # jarak antar checkpoint (detik simulasi)
+        self.tail = int(tail)                             # jumlah sampel history/trail terakhir yang ikut disimpan
+        self.keep_tails = max(1, int(keep_tails))         # hanya K checkpoint terbaru yang menyimpan ekor buffer; yang lebih tua cukup state
+        self.max_count = max(self.keep_tails + 3, int(max_count))  # batas jumlah checkpoint: lewat batas → checkpoint tua dijarangkan (memori tetap)
+        self.checkpoints = []; self.times = []            # terurut menurut waktu (times untuk bisect)
+        self.clear()
+
+    def __len__(self):
+        return len(self.checkpoints)
+
+    def clear(self):                                      # run baru / state diubah dari luar: checkpoint lama tidak berlaku
+        del self.checkpoints[:]; del self.times[:]
+        self.next_time = float("-inf"); self.dt = None    # → checkpoint pertama diambil pada update() berikutnya
+
+    def due(self, p):                                     # jatuh tempo, atau dt berubah (speed): dt antar checkpoint selalu konstan
+        return p.time >= self.next_time or p.dt != self.dt
+
+    def take(self, p):                                    # simpan state sekarang; checkpoint di masa depan timeline lama dibuang (fork)
+        i = bisect.bisect_left(self.times, p.time)
+        del self.checkpoints[i:]; del self.times[i:]
+        n = min(self.tail, len(p.history)); m = min(self.tail, len(p.trail))
+        ck = Checkpoint(p.time, tuple(p.state), p.dt,
+                        array('d', p.history.view(len(p.history) - n)), array('d', p.trail.view(len(p.trail) - m)),
+                        copy.copy(p._adaptive), copy.copy(p.energy_monitor))  # salinan dangkal cukup: field-nya diganti, bukan dimutasi
+        self.checkpoints.append(ck); self.times.append(ck.time)
+        self.next_time = p.time + self.interval; self.dt = p.dt
+        self._bound()
+        return ck
+
+    def _bound(self):                                     # memori tetap untuk run sepanjang apa pun: lepas ekor lama, jarangkan checkpoint tua
+        cks = self.checkpoints
+        for i in range(len(cks) - self.keep_tails):
+            if len(cks[i].history) or len(cks[i].trail):  # restore tetap bit-identik; ekor diisi ulang oleh fast-forward seek()
+                cks[i] = cks[i]._replace(history=array('d'), trail=array('d'))
+        if len(cks) > self.max_count:                     # buang checkpoint yang celah gabungannya paling kecil relatif terhadap umurnya → jarak ∝ umur (geometris)
+            ts = self.times; now = ts[-1]
+            j = min(range(1, len(cks) - self.keep_tails), key=lambda i: (ts[i + 1] - ts[i - 1]) / (now - ts[i - 1]))
+            del cks[j]; del ts[j]                         # checkpoint pertama (awal run) dan K terbaru tidak pernah dibuang
+
+    def nearest(self, t):                                 # checkpoint terakhir dengan waktu <= t (atau yang pertama bila t lebih awal)
+        if not self.checkpoints: raise ValueError("belum ada checkpoint")
+        return self.checkpoints[max(0, bisect.bisect_right(self.times, t) - 1)]
+
+    def restore(self, p, ck):                             # kembalikan model persis ke checkpoint (termasuk ekor buffer)
+        p.state = list(ck.state); p.time = ck.time; p.dt = ck.dt
+        p._adaptive = copy.copy(ck.adaptive); p.energy_monitor = copy.copy(ck.monitor)
+        for buf, flat in ((p.history, ck.history), (p.trail, ck.trail)):
+            buf.clear(); w = buf.width
+            for i in range(0, len(flat), w): buf.append(*flat[i:i + w])
+        self.next_time = ck.time + self.interval; self.dt = ck.dt  # timeline berlanjut dari sini
+
+    def seek(self, p, t):                                 # restore checkpoint terdekat lalu fast-forward headless ke t; → jumlah langkah
+        if not self.checkpoints or self.times[-1] < p.time <= t: self.take(p)  # state sekarang lebih dekat dari checkpoint mana pun
+        ck = self.nearest(t); self.restore(p, ck)
+        n = max(0, int((t - ck.time) / ck.dt + 0.5))      # langkah ke sampel terdekat dengan t
+        bulk = max(0, n - self.tail)                      # bagian awal tanpa history/trail (hanya integrasi)
+        rec, p.recorder = p.recorder, None                # fast-forward tidak ditulis ke rekaman
+        try:
+            for _ in range(bulk):
+                if self.due(p): self.take(p)              # seek melewati checkpoint terakhir → checkpoint baru untuk seek berikutnya
+                p.step()
+            for _ in range(n - bulk): p.update()          # ekor: isi history/trail seperti run live
+        finally:
+            p.recorder = rec
+        return n
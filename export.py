@@ -0,0 +1,276 @@
+# export.py — ekspor video / frame PNG offscreen tanpa Kivy/GPU: rasterisasi numpy (batang, bob, trail, plot sudut), paralel, ke pipe encoder atau PNG berurutan
+import argparse, math, os, shlex, shutil, struct, subprocess, sys, time, zlib  # modul standar: CLI, encoder PNG, pipe ffmpeg
+from collections import deque, namedtuple                # antrean future (urutan frame) dan data trajektori
+from concurrent.futures import ProcessPoolExecutor       # frame dirender paralel di semua core
+import numpy as np                                        # wajib untuk rasterisasi vektor
+from physics import DoublePendulum, KERNELS               # simulasi headless bila sumbernya parameter (bukan rekaman)
+from recording import TrajectoryReader                    # sumber rekaman .dptraj (memmap)
+
+Trajectory = namedtuple("Trajectory", "t theta1 theta2 xs ys lengths")  # t/θ1/θ2: float64 (n,); xs/ys: posisi bob (N, n); panjang tali per link
+
+THEMES = {                                                # palet sama seperti DoublePendulumApp.THEMES (RGB 0..1)
+    'Dark': {'dark_bg': (0.06, 0.06, 0.06), 'graph_bg': (0.95, 0.95, 0.95)},
+    'Light': {'dark_bg': (1.0, 1.0, 1.0), 'graph_bg': (0.97, 0.97, 0.97)},
+    'Blue': {'dark_bg': (0.02, 0.03, 0.08), 'graph_bg': (0.03, 0.05, 0.1)},
+}
+ROD = (0.22, 0.22, 0.22); PIVOT = (0.0, 0.0, 0.0); BOB1 = (0.9, 0.2, 0.2); BOB2 = (0.18, 0.45, 0.85)  # warna seperti PendulumCanvas
+TRAIL = (0.12, 0.65, 0.95); GRID = (0.85, 0.85, 0.85); AXIS = (0.12, 0.12, 0.12)
+CURVE1 = (0.85, 0.2, 0.2); CURVE2 = (0.15, 0.45, 0.85)    # warna kurva seperti GraphCanvas
+
+# ---- sumber trajektori ----
+def load_recording(path):                                 # rekaman .dptraj (double pendulum atau rantai N link) → Trajectory (kolom disalin dari memmap)
+    r = TrajectoryReader(path)
+    try:
+        a = r.as_array(); h = r.header
+        lengths = h.get("lengths", [h["l1"], h["l2"]]); n = len(lengths)
+        col = lambda name: np.array(a[:, r.field(name)])
+        cols = [col(k) for k in ("t", "theta1", "theta2")]
+        xs = np.array(a[:, [r.field(f"x{i}") for i in range(1, n + 1)]].T); ys = np.array(a[:, [r.field(f"y{i}") for i in range(1, n + 1)]].T)
+        del a                                             # view numpy harus dilepas sebelum mmap bisa ditutup
+        return Trajectory(*cols, xs, ys, lengths)
+    finally:
+        r.close()
+
+def simulate(duration, theta1=1.0, theta2=2.0, dt=0.005, integrator="rk4", kernel="auto", **params):  # run headless → Trajectory
+    p = DoublePendulum(kernel=kernel, **params); p.state = [theta1, 0.0, theta2, 0.0]; p.dt = dt
+    if integrator != "rk4": p.set_integrator(integrator)
+    n = int(round(duration / dt)) + 1
+    out = np.empty((3, n)); out[:, 0] = (0.0, theta1, theta2)
+    for i in range(1, n):
+        p.step(); out[0, i] = p.time; out[1, i] = p.state[0]; out[2, i] = p.state[2]
+    t, th1, th2 = out
+    x1 = p.l1 * np.sin(th1); y1 = -p.l1 * np.cos(th1)     # posisi dihitung vektor sekali untuk seluruh run
+    return Trajectory(t, th1, th2, np.stack((x1, x1 + p.l2 * np.sin(th2))), np.stack((y1, y1 - p.l2 * np.cos(th2))), [p.l1, p.l2])
+
+# ---- primitif raster (gambar uint8 (H, W, 3), y ke bawah; blending float hanya di bounding box) ----
+def _blend(img, x0, y0, cov, color):                      # img[y0:, x0:] ← campuran warna dengan coverage cov (h, w) 0..1
+    h, w = cov.shape
+    region = img[y0:y0 + h, x0:x0 + w].astype(np.float32)
+    region += (np.asarray(color, np.float32) * 255.0 - region) * cov[..., None]
+    img[y0:y0 + h, x0:x0 + w] = region + 0.5              # pembulatan ke uint8
+
+def _segment(img, ax, ay, bx, by, r, color):              # segmen tebal (radius r) antialiased via jarak piksel ke segmen
+    H, W = img.shape[:2]
+    x0 = max(0, int(min(ax, bx) - r - 1)); x1 = min(W, int(max(ax, bx) + r + 2))
+    y0 = max(0, int(min(ay, by) - r - 1)); y1 = min(H, int(max(ay, by) + r + 2))
+    if x0 >= x1 or y0 >= y1: return
+    px = np.arange(x0, x1, dtype=np.float32) + 0.5; py = (np.arange(y0, y1, dtype=np.float32) + 0.5)[:, None]
+    dx = bx - ax; dy = by - ay; ll = dx * dx + dy * dy
+    u = np.clip(((px - ax) * dx + (py - ay) * dy) / ll, 0.0, 1.0) if ll > 0 else 0.0
+    d = np.hypot(px - (ax + u * dx), py - (ay + u * dy))
+    _blend(img, x0, y0, np.clip(r + 0.5 - d, 0.0, 1.0), color)
+
+def _disc(img, cx, cy, r, color):                         # lingkaran penuh antialiased
+    _segment(img, cx, cy, cx, cy, r, color)
+
+def _polyline(img, xs, ys, color, alpha=1.0, fade=False, clip=None):  # polyline tipis: sampel tiap 0.5 px + splat bilinear (vektor penuh)
+    if len(xs) < 2: return
+    H, W = img.shape[:2]; cx0, cy0, cx1, cy1 = clip or (0, 0, W, H)
+    seg = np.hypot(np.diff(xs), np.diff(ys))
+    n = np.maximum(1, np.ceil(seg * 2.0).astype(np.int64))  # jumlah sampel per segmen
+    idx = np.repeat(np.arange(len(seg)), n)
+    f = (np.arange(n.sum()) - np.repeat(np.cumsum(n) - n, n)) / np.repeat(n, n)  # posisi relatif di dalam segmen
+    px = xs[idx] + (xs[idx + 1] - xs[idx]) * f - 0.5; py = ys[idx] + (ys[idx + 1] - ys[idx]) * f - 0.5
+    w = np.full(len(px), 0.5 * alpha) if not fade else 0.5 * alpha * (idx + f) / len(seg)  # fade: tertua → transparan
+    ix = np.floor(px).astype(np.int64); iy = np.floor(py).astype(np.int64); fx = px - ix; fy = py - iy
+    keep = (ix >= cx0) & (ix < cx1 - 1) & (iy >= cy0) & (iy < cy1 - 1)
+    if not keep.any(): return
+    ix, iy, fx, fy, w = ix[keep], iy[keep], fx[keep], fy[keep], w[keep]
+    x0, y0 = ix.min(), iy.min(); bw = ix.max() - x0 + 2; bh = iy.max() - y0 + 2
+    flat = (iy - y0) * bw + (ix - x0)
+    acc = np.bincount(np.concatenate((flat, flat + 1, flat + bw, flat + bw + 1)),  # bobot bilinear ke 4 piksel tetangga
+                      np.concatenate((w * (1 - fx) * (1 - fy), w * fx * (1 - fy), w * (1 - fx) * fy, w * fx * fy)), bh * bw)
+    nz = np.flatnonzero(acc)                              # hanya piksel yang tersentuh garis yang di-blend (bukan seluruh bounding box)
+    gy = nz // bw + y0; gx = nz % bw + x0
+    pix = img[gy, gx].astype(np.float32); cov = np.minimum(acc[nz], 1.0).astype(np.float32)
+    pix += (np.asarray(color, np.float32) * 255.0 - pix) * cov[:, None]
+    img[gy, gx] = pix + 0.5
+
+def _bob_color(j, n):                                     # warna bob ke-j dari n: BOB1 (pertama) → BOB2 (terakhir), interpolasi linear di antaranya
+    if j == 1: return BOB1
+    if j == n: return BOB2
+    f = (j - 1) / (n - 1); return tuple(c1 + (c2 - c1) * f for c1, c2 in zip(BOB1, BOB2))
+
+def _nice_ceil(v):                                        # 1, 2, 5 × 10^k terdekat ke atas (skala sumbu y plot)
+    if v <= 0: return 1.0
+    e = 10 ** math.floor(math.log10(v))
+    for m in (1, 2, 5, 10):
+        if v <= m * e: return m * e
+    return 10 * e
+
+# ---- renderer satu frame ----
+class FrameRenderer:                                      # layout mengikuti UI: area pendulum di atas, plot sudut 10 s di bawah
+    def __init__(self, traj, width=1920, height=1080, theme="Dark", trail_seconds=4.5, window=10.0):
+        self.traj = traj; self.width = int(width); self.height = int(height)
+        pal = THEMES.get(theme, THEMES['Dark']); self.bg = pal['dark_bg']; self.graph_bg = pal['graph_bg']
+        self.trail_seconds = trail_seconds; self.window = window  # panjang trail dan jendela plot (detik simulasi)
+        k = self.k = self.height / 760.0                  # skala ukuran relatif terhadap jendela UI 1200×760
+        self.plot_h = int(170 * k); top_h = self.height - self.plot_h  # tinggi plot dan area pendulum
+        self.pivot = (self.width / 2.0, 90 * k)            # pivot (koordinat gambar, y ke bawah)
+        avail_r = max(10.0, min(self.width * 0.95 / 2.0, (top_h - 90 * k) * 0.95))
+        self.scale = avail_r / max(1e-6, sum(traj.lengths))  # piksel per meter
+        self.bob_r = min(12.0, 0.35 * min(traj.lengths) * self.scale / k)  # rantai panjang: bob mengecil agar tidak saling menutupi
+        self.plot = (int(60 * k), top_h + int(12 * k), self.width - int(16 * k), self.height - int(30 * k))  # (x0, y0, x1, y1) area kurva
+        self._template = self._static()
+
+    def _static(self):                                    # latar + grid plot (sama untuk semua frame) — disalin tiap frame
+        img = np.empty((self.height, self.width, 3), np.uint8)
+        top_h = self.height - self.plot_h
+        img[:top_h] = np.round(np.asarray(self.bg) * 255); img[top_h:] = np.round(np.asarray(self.graph_bg) * 255)
+        x0, y0, x1, y1 = self.plot; cy = (y0 + y1) // 2
+        for i in range(11):                               # grid vertikal tiap 1/10 jendela
+            x = x0 + (x1 - x0 - 1) * i // 10; img[y0:y1, x] = np.round(np.asarray(GRID) * 255)
+        for y in (y0, (y0 + cy) // 2, (cy + y1) // 2, y1 - 1): img[y, x0:x1] = np.round(np.asarray(GRID) * 255)
+        img[y0:y1, x0] = np.round(np.asarray(AXIS) * 255); img[cy, x0:x1] = np.round(np.asarray(AXIS) * 255)  # sumbu y dan garis nol
+        return img
+
+    def index_at(self, t):                                # sampel terakhir dengan waktu <= t
+        return max(0, int(np.searchsorted(self.traj.t, t, side="right")) - 1)
+
+    def render(self, t):                                  # frame RGB (H, W, 3) uint8 pada waktu simulasi t
+        tr = self.traj; img = self._template.copy(); k = self.k
+        i = self.index_at(t); px, py = self.pivot; s = self.scale
+        # trail (fade menurut umur)
+        a = max(0, int(np.searchsorted(tr.t, tr.t[i] - self.trail_seconds)))
+        if i - a >= 2:
+            _polyline(img, px + tr.xs[-1, a:i + 1] * s, py - tr.ys[-1, a:i + 1] * s, TRAIL, alpha=0.9, fade=True,
+                      clip=(0, 0, self.width, self.height - self.plot_h))
+        # batang, pivot, bob (warna bob bergradasi BOB1 → BOB2 sepanjang rantai)
+        bx = np.concatenate(([px], px + tr.xs[:, i] * s)); by = np.concatenate(([py], py - tr.ys[:, i] * s)); n = len(bx) - 1
+        for j in range(n): _segment(img, bx[j], by[j], bx[j + 1], by[j + 1], 2.5 * k, ROD)
+        _disc(img, px, py, 5 * k, PIVOT)
+        for j in range(1, n + 1): _disc(img, bx[j], by[j], self.bob_r * k, _bob_color(j, n))
+        # plot sudut vs waktu (jendela `window` detik terakhir)
+        x0, y0, xe, ye = self.plot; cy = (y0 + ye) / 2.0; t1 = tr.t[i]; t0 = max(tr.t[0], t1 - self.window)
+        a = max(0, int(np.searchsorted(tr.t, t0)) - 1)
+        if i - a >= 1:
+            ts = tr.t[a:i + 1]; v1 = tr.theta1[a:i + 1]; v2 = tr.theta2[a:i + 1]
+            ky = (ye - y0) / 2.0 / _nice_ceil(max(np.abs(v1).max(), np.abs(v2).max()))  # skala y: kelipatan 1/2/5 agar tidak melompat tiap frame
+            xs = x0 + (ts - t0) * ((xe - x0) / self.window)  # awal run: kurva mulai dari kiri seperti GraphCanvas
+            for v, c in ((v1, CURVE1), (v2, CURVE2)): _polyline(img, xs, cy - v * ky, c, clip=self.plot)
+        return img
+
+    def frame_times(self, fps, start=None, end=None):     # waktu simulasi tiap frame
+        t0 = self.traj.t[0] if start is None else start; t1 = self.traj.t[-1] if end is None else end
+        return t0 + np.arange(int(math.floor((t1 - t0) * fps)) + 1) / fps
+
+# ---- output ----
+def png_bytes(img, level=1):                              # encoder PNG minimal (stdlib zlib): RGB 8-bit, filter 0 per baris
+    h, w = img.shape[:2]
+    raw = np.empty((h, w * 3 + 1), np.uint8); raw[:, 0] = 0; raw[:, 1:] = img.reshape(h, w * 3)
+    chunk = lambda tag, data: struct.pack(">I", len(data)) + tag + data + struct.pack(">I", zlib.crc32(tag + data) & 0xffffffff)
+    return (b"\x89PNG\r\n\x1a\n" + chunk(b"IHDR", struct.pack(">IIBBBBB", w, h, 8, 2, 0, 0, 0))
+            + chunk(b"IDAT", zlib.compress(raw.tobytes(), level)) + chunk(b"IEND", b""))
+
+def encoder_command(path, width, height, fps):            # perintah ffmpeg untuk file video (rawvideo rgb24 dari stdin)
+    ffmpeg = shutil.which("ffmpeg")
+    if ffmpeg is None: raise RuntimeError("ffmpeg tidak ditemukan di PATH; gunakan direktori (PNG) atau --pipe")
+    return [ffmpeg, "-y", "-loglevel", "error", "-f", "rawvideo", "-pix_fmt", "rgb24", "-s", f"{width}x{height}",
+            "-r", str(fps), "-i", "-", "-pix_fmt", "yuv420p", path]
+
+# ---- worker pool ----
+_renderer = None; _job = None                             # state per proses worker (diisi initializer)
+
+def _init(traj, width, height, theme, trail_seconds, window, job):  # dijalankan sekali per proses: bangun renderer (template statis)
+    global _renderer, _job
+    _renderer = FrameRenderer(traj, width, height, theme, trail_seconds, window); _job = job
+
+def _render_chunk(first, times):                          # render satu chunk frame; PNG ditulis langsung oleh worker, raw dikembalikan
+    out = []
+    for j, t in enumerate(times):
+        img = _renderer.render(t)
+        if _job["mode"] == "png":
+            with open(os.path.join(_job["out"], f"frame_{first + j:06d}.png"), "wb") as f: f.write(png_bytes(img, _job["level"]))
+        else:
+            out.append(img.tobytes())
+    return out
+
+def export(traj, out, width=1920, height=1080, fps=30, theme="Dark", start=None, end=None, trail_seconds=4.5, window=10.0,
+           workers=None, chunk=8, png_level=1, pipe=None, progress=None):  # ekspor frame → PNG (direktori), video (ffmpeg) atau raw stdout ('-')
+    width -= width % 2; height -= height % 2               # yuv420p butuh dimensi genap
+    times = FrameRenderer(traj, width, height, theme, trail_seconds, window).frame_times(fps, start, end)
+    video = pipe is not None or out == "-" or os.path.splitext(out)[1].lower() in (".mp4", ".mkv", ".webm", ".mov", ".avi", ".gif")
+    job = {"mode": "raw" if video else "png", "out": out, "level": png_level}
+    proc = None; sink = None
+    if video:
+        if out == "-" and pipe is None: sink = sys.stdout.buffer  # raw rgb24 ke stdout (mis. | ffmpeg -f rawvideo ...)
+        else:
+            cmd = shlex.split(pipe.format(w=width, h=height, fps=fps, out=out)) if pipe else encoder_command(out, width, height, fps)
+            proc = subprocess.Popen(cmd, stdin=subprocess.PIPE); sink = proc.stdin
+    else:
+        os.makedirs(out, exist_ok=True)
+    chunks = [(s, times[s:s + chunk]) for s in range(0, len(times), chunk)]
+    done = 0
+    try:
+        if workers == 1:                                  # tanpa pool (debug / mesin satu core)
+            _init(traj, width, height, theme, trail_seconds, window, job)
+            results = (_render_chunk(s, ts) for s, ts in chunks)
+            for (s, ts), frames in zip(chunks, results):
+                for b in frames: sink.write(b)
+                done += len(ts)
+                if progress: progress(done, len(times))
+        else:
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init,
+                                     initargs=(traj, width, height, theme, trail_seconds, window, job)) as pool:
+                pending = deque(); limit = 2 * (workers or os.cpu_count() or 1)  # batasi frame di memori
+                for s, ts in chunks:
+                    pending.append((len(ts), pool.submit(_render_chunk, s, ts)))
+                    while len(pending) >= limit or (pending and pending[0][1].done()):
+                        n, fut = pending.popleft()
+                        for b in fut.result(): sink.write(b)   # urutan frame dijaga: future diambil sesuai urutan submit
+                        done += n
+                        if progress: progress(done, len(times))
+                while pending:
+                    n, fut = pending.popleft()
+                    for b in fut.result(): sink.write(b)
+                    done += n
+                    if progress: progress(done, len(times))
+    finally:
+        if proc is not None:
+            proc.stdin.close(); proc.wait()
+        elif sink is not None:
+            sink.flush()
+    if proc is not None and proc.returncode: raise RuntimeError(f"encoder keluar dengan kode {proc.returncode}")
+    return len(times)
+
+def build_parser():                                       # definisi argumen command-line
+    ap = argparse.ArgumentParser(description="Offscreen CPU export of a run to a PNG sequence or video (via an encoder pipe).")
+    ap.add_argument("out", help="direktori (PNG frame_000000.png ...), file video (.mp4/.mkv/... via ffmpeg), atau '-' (raw rgb24 ke stdout)")
+    ap.add_argument("--recording", help="rekaman .dptraj sebagai sumber (default: simulasi dari parameter di bawah)")
+    ap.add_argument("--duration", type=float, default=60.0, help="durasi simulasi bila tanpa --recording (s)")
+    ap.add_argument("--theta1", type=float, default=1.0); ap.add_argument("--theta2", type=float, default=2.0)  # sudut awal (rad)
+    ap.add_argument("--m1", type=float, default=1.0); ap.add_argument("--m2", type=float, default=1.0)  # massa
+    ap.add_argument("--l1", type=float, default=1.0); ap.add_argument("--l2", type=float, default=1.0)  # panjang tali
+    ap.add_argument("--g", type=float, default=9.81)     # gravitasi
+    ap.add_argument("--dt", type=float, default=0.005)
+    ap.add_argument("--integrator", choices=("rk4", "rk45", "midpoint"), default="rk4")
+    ap.add_argument("--kernel", choices=KERNELS, default="auto")
+    ap.add_argument("--size", default="1920x1080", help="resolusi WxH")
+    ap.add_argument("--fps", type=float, default=30.0)
+    ap.add_argument("--start", type=float, default=None); ap.add_argument("--end", type=float, default=None)  # potongan waktu simulasi
+    ap.add_argument("--theme", choices=tuple(THEMES), default="Dark")
+    ap.add_argument("--trail", type=float, default=4.5, help="panjang trail (s)")
+    ap.add_argument("--workers", type=int, default=None, help="jumlah proses render (default: semua core; 1 = tanpa pool)")
+    ap.add_argument("--png-level", type=int, default=1, help="level kompresi zlib PNG (0-9)")
+    ap.add_argument("--pipe", default=None, help="perintah encoder kustom yang membaca rgb24 dari stdin; placeholder {w} {h} {fps} {out}")
+    return ap
+
+def main(argv=None):                                      # entry point CLI: python export.py frames/ --duration 600 --size 1920x1080
+    args = build_parser().parse_args(argv)
+    width, height = (int(v) for v in args.size.lower().split("x"))
+    t0 = time.perf_counter()
+    if args.recording: traj = load_recording(args.recording)
+    else:
+        traj = simulate(args.duration, args.theta1, args.theta2, args.dt, args.integrator, args.kernel,
+                        m1=args.m1, m2=args.m2, l1=args.l1, l2=args.l2, g=args.g)
+    t1 = time.perf_counter()
+    def progress(i, n): print(f"\r{i}/{n} frames", end="", file=sys.stderr, flush=True)
+    n = export(traj, args.out, width, height, args.fps, args.theme, args.start, args.end, args.trail,
+               workers=args.workers, png_level=args.png_level, pipe=args.pipe, progress=progress)
+    wall = time.perf_counter() - t1; span = n / args.fps
+    print(f"\n{n} frames ({span:.1f}s of simulation) in {wall:.1f}s ({n / max(wall, 1e-9):.1f} fps, {span / max(wall, 1e-9):.2f}x realtime; "
+          f"trajectory {t1 - t0:.1f}s) → {args.out}", file=sys.stderr)
+    return 0
+
+if __name__ == '__main__':                                 # jalankan sebagai script
+    sys.exit(main())
@@ -0,0 +1,68 @@
+# headless.py — runner simulasi tanpa UI: hanya mengimpor physics, berjalan secepat CPU, menulis hasil ke disk
+import argparse, csv, sys, time                           # modul standar: argumen CLI, penulisan CSV, waktu
+from physics import DoublePendulum, ChainPendulum, KERNELS  # model fisika (tanpa Kivy), rantai N link + pilihan kernel RK4
+from analytics import Analytics                           # analitik streaming opsional (--analytics)
+
+def run_headless(pendulum, duration, sample_every=1, out=None):  # jalankan simulasi `duration` detik; tulis tiap `sample_every` langkah
+    steps = int(round(duration / pendulum.dt))            # jumlah langkah total dari durasi dan dt
+    writer = csv.writer(out) if out is not None else None # writer CSV bila ada file output
+    if writer:
+        n = len(pendulum.state) // 2                      # jumlah link (2 untuk double pendulum)
+        writer.writerow(["t"] + [f"{k}{i}" for i in range(1, n + 1) for k in ("theta", "omega")] + [f"x{n}", f"y{n}"])  # header kolom
+    def emit():                                           # tulis satu sampel (waktu, state, posisi bob terakhir)
+        x, y = pendulum.get_positions()[-1]               # posisi bob terakhir
+        writer.writerow([repr(pendulum.time)] + [repr(v) for v in pendulum.state] + [repr(x), repr(y)])  # repr → presisi penuh float
+    if writer: emit()                                     # sampel awal t = 0
+    an = pendulum.analytics                               # step() tidak mengisi analitik (hanya update()) → diumpankan di sini
+    for i in range(1, steps + 1):                         # loop integrasi tanpa pacing wall-clock
+        pendulum.step()                                   # satu langkah RK4 (tanpa history/trail)
+        if an is not None: an.observe(pendulum)
+        if writer and i % sample_every == 0: emit()       # tulis sampel sesuai stride
+    return steps                                          # kembalikan jumlah langkah yang dijalankan
+
+def build_parser():                                       # definisi argumen command-line
+    ap = argparse.ArgumentParser(description="Headless double pendulum simulation (tanpa Kivy).")
+    ap.add_argument("--m1", type=float, default=1.0); ap.add_argument("--m2", type=float, default=1.0)  # massa
+    ap.add_argument("--l1", type=float, default=1.0); ap.add_argument("--l2", type=float, default=1.0)  # panjang tali
+    ap.add_argument("--g", type=float, default=9.81)     # gravitasi
+    ap.add_argument("--links", type=int, default=2, help="jumlah link rantai; link 2..N memakai m2/l2/theta2/omega2")
+    ap.add_argument("--theta1", type=float, default=1.0); ap.add_argument("--theta2", type=float, default=2.0)  # sudut awal (rad)
+    ap.add_argument("--omega1", type=float, default=0.0); ap.add_argument("--omega2", type=float, default=0.0)  # kecepatan sudut awal
+    ap.add_argument("--dt", type=float, default=0.005, help="langkah waktu integrator (s); untuk rk45 = interval sampel")
+    ap.add_argument("--integrator", choices=("rk4", "rk45", "midpoint"), default="rk4", help="rk4 langkah tetap, rk45 adaptif (Dormand–Prince) atau midpoint simplektik")
+    ap.add_argument("--kernel", choices=KERNELS, default="auto", help="kernel RK4: auto (numba bila terpasang, selain itu closure), numba, closure, generic")
+    ap.add_argument("--rtol", type=float, default=None, help="toleransi relatif rk45 (default: 1e-6 untuk 2 link, 1e-4 untuk rantai)")
+    ap.add_argument("--atol", type=float, default=1e-9)  # toleransi absolut rk45
+    ap.add_argument("--duration", type=float, default=10.0, help="durasi simulasi (s)")
+    ap.add_argument("--every", type=int, default=1, help="tulis satu sampel tiap N langkah")
+    ap.add_argument("-o", "--out", default="-", help="file CSV output ('-' = stdout)")
+    ap.add_argument("--analytics", action="store_true", help="hitung crossing Poincaré, flip dan frekuensi dominan selama run (ringkasan ke stderr)")
+    return ap
+
+def main(argv=None):                                      # entry point CLI: python headless.py --duration 60 -o run.csv
+    ap = build_parser(); args = ap.parse_args(argv)       # parse argumen
+    if args.links < 2: ap.error("--links minimal 2")
+    n = args.links - 1                                     # link setelah link pertama
+    if args.links == 2: p = DoublePendulum(m1=args.m1, m2=args.m2, l1=args.l1, l2=args.l2, g=args.g, kernel=args.kernel)  # buat model
+    else: p = ChainPendulum([args.m1] + [args.m2] * n, [args.l1] + [args.l2] * n, args.g)  # rantai N link (rk4_step + chain_derivatives)
+    p.state = [args.theta1, args.omega1] + [args.theta2, args.omega2] * n  # set kondisi awal
+    p.base_dt = p.dt = args.dt                            # set langkah waktu
+    if args.integrator not in p.INTEGRATORS: ap.error(f"--integrator {args.integrator} hanya untuk --links 2")
+    if args.integrator != 'rk4': p.set_integrator(args.integrator, rtol=args.rtol, atol=args.atol)  # integrator adaptif / simplektik
+    mon = p.enable_energy_monitor()                       # pantau drift energi selama run
+    if args.analytics: p.analytics = Analytics(p)         # analitik streaming (O(1) per langkah)
+    out = sys.stdout if args.out == "-" else open(args.out, "w", newline="")  # tujuan output
+    t0 = time.perf_counter()                              # mulai ukur waktu wall-clock
+    try:
+        steps = run_headless(p, args.duration, max(1, args.every), out)  # jalankan simulasi
+    finally:
+        if out is not sys.stdout: out.close()             # tutup file output
+    wall = max(1e-9, time.perf_counter() - t0)            # durasi wall-clock
+    print(f"{steps} steps in {wall:.3f}s ({steps / wall:.0f} steps/s, kernel {p.kernel})", file=sys.stderr)  # ringkasan throughput ke stderr
+    if p.integrator_stats(): print(p.integrator_stats(), file=sys.stderr)  # langkah diterima/ditolak dan evaluasi derivatives
+    print(f"energy drift: final {mon.drift:+.3e}, max {mon.max_drift:+.3e}", file=sys.stderr)  # drift energi relatif
+    if p.analytics: print(p.analytics.summary(), file=sys.stderr)  # crossing, flip, waktu flip pertama, frekuensi dominan
+    return 0
+
+if __name__ == '__main__':                                 # jalankan sebagai script
+    sys.exit(main())
@@ -0,0 +1,56 @@
+# lod.py — level-of-detail untuk polyline: decimation min/max per kolom piksel (plot sudut) dan jarak minimum (trail)
+import math, bisect                                       # floor untuk indeks bucket, bisect untuk memotong jendela
+
+class MinMaxLOD:                                          # satu seri (x, y) direduksi ke min & max per bucket selebar `bucket` (satuan x)
+    def __init__(self, bucket):
+        self.bucket = bucket                              # lebar bucket dalam satuan x (mis. detik per piksel)
+        self.xs = []; self.ys = []                        # titik hasil decimation, urut x
+        self.last_x = -math.inf                           # x sampel terakhir yang sudah masuk (untuk catch-up inkremental)
+        self._key = None; self._lo = self._hi = None; self._tail = 0  # bucket aktif: indeks, titik min/max, jumlah titik ekor yang boleh ditulis ulang
+
+    def add(self, x, y):                                  # masukkan satu sampel, O(1)
+        self.last_x = x
+        k = math.floor(x / self.bucket)                   # indeks bucket absolut (selaras kelipatan bucket, stabil saat scroll)
+        if k != self._key:                                # bucket baru: ekor bucket sebelumnya menjadi final
+            self._key = k; self._lo = self._hi = (x, y); self._tail = 1
+            self.xs.append(x); self.ys.append(y); return
+        if y < self._lo[1]: self._lo = (x, y)             # perbarui minimum bucket
+        elif y > self._hi[1]: self._hi = (x, y)           # perbarui maksimum bucket
+        else: return                                      # sampel di antara min & max tidak mengubah output
+        del self.xs[-self._tail:]; del self.ys[-self._tail:]  # tulis ulang ekor bucket aktif
+        a, b = (self._lo, self._hi) if self._lo[0] <= self._hi[0] else (self._hi, self._lo)  # urutkan menurut x agar polyline maju
+        self.xs += (a[0], b[0]); self.ys += (a[1], b[1]); self._tail = 2
+
+    def extend(self, xs, ys):                             # masukkan banyak sampel sekaligus
+        for x, y in zip(xs, ys): self.add(x, y)
+
+    def trim(self, x_min):                                # buang titik sebelum x_min (sisakan satu di tepi), amortized O(1)
+        i = min(bisect.bisect_left(self.xs, x_min) - 1, len(self.xs) - self._tail)
+        if i > 1024 and i > len(self.xs) // 2:
+            del self.xs[:i]; del self.ys[:i]
+
+    def window(self, x_min):                              # (xs, ys) mulai satu titik sebelum x_min — ukuran ≈ 2 titik per bucket terlihat
+        i = max(0, bisect.bisect_left(self.xs, x_min) - 1)
+        return self.xs[i:], self.ys[i:]
+
+class DistanceLOD:                                        # decimation polyline: buang titik yang lebih dekat dari min_dist ke titik terakhir yang disimpan
+    def __init__(self, min_dist):
+        self.min_dist2 = min_dist * min_dist              # kuadrat jarak minimum (hindari sqrt)
+        self.xs = []; self.ys = []; self.ids = []         # titik yang disimpan beserta nomor sampel aslinya
+        self.last_id = -1                                 # nomor sampel terakhir yang sudah diproses
+
+    def add(self, i, x, y):                               # masukkan sampel ke-i, O(1)
+        self.last_id = i
+        if self.xs:
+            dx = x - self.xs[-1]; dy = y - self.ys[-1]
+            if dx*dx + dy*dy < self.min_dist2: return    # terlalu dekat: tidak menambah detail di layar
+        self.xs.append(x); self.ys.append(y); self.ids.append(i)
+
+    def trim(self, id_min):                               # buang titik dengan nomor < id_min, amortized O(1)
+        i = bisect.bisect_left(self.ids, id_min)
+        if i > 1024 and i > len(self.ids) // 2:
+            del self.xs[:i]; del self.ys[:i]; del self.ids[:i]
+
+    def window(self, id_min):                             # (xs, ys) untuk titik dengan nomor >= id_min
+        i = bisect.bisect_left(self.ids, id_min)
+        return self.xs[i:], self.ys[i:]
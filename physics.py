@@ -0,0 +1,545 @@
+# physics.py — model fisika double pendulum tanpa ketergantungan Kivy (bisa dipakai headless / server batch)
+import math, bisect                                       # import modul standar math (sin, cos, pi) dan bisect (pencarian biner)
+from array import array                                   # array.array: buffer float64 kontigu tanpa boxing per elemen
+try:
+    import numpy as np                                    # numpy opsional: hanya dibutuhkan untuk mesin batch (BatchPendulum)
+except ImportError:
+    np = None                                             # tanpa numpy, jalur skalar tetap jalan
+try:
+    import numba                                          # numba opsional: kernel RK4 terkompilasi (lihat make_numba_kernel)
+except ImportError:
+    numba = None
+
+# ---- Physics integrator (RK4) ----
+def derivatives(pendulum, y):                             # fungsi menghitung turunan state untuk sistem double pendulum
+    theta1, omega1, theta2, omega2 = y                    # unpack state: sudut dan kecepatan angular untuk dua massa
+    m1, m2 = pendulum.m1, pendulum.m2                     # ambil massa dari objek pendulum
+    l1, l2 = pendulum.l1, pendulum.l2                     # ambil panjang tali dari objek pendulum
+    g = pendulum.g                                        # ambil percepatan gravitasi dari objek pendulum
+    delta = theta2 - theta1                               # difference antar sudut (θ2 - θ1)
+    cos_d = math.cos(delta); sin_d = math.sin(delta)      # hitung cos dan sin dari delta (dipakai berkali-kali)
+    denom1 = (m1 + m2) * l1 - m2 * l1 * cos_d * cos_d     # denominator untuk rumus domega1 (menghindari pembagian nol)
+    if abs(denom1) < 1e-12: denom1 = 1e-12 if denom1 >= 0 else -1e-12  # proteksi numeric: kalau hampir nol, ganti nilai kecil
+    denom2 = (l2 / l1) * denom1                           # denominator untuk domega2 berdasarkan denom1
+    if abs(denom2) < 1e-12: denom2 = 1e-12 if denom2 >= 0 else -1e-12  # proteksi numeric untuk denom2
+    domega1 = (                                          # hitung turunan omega1 (akses rumus dinamika)
+        m2 * l1 * omega1 * omega1 * sin_d * cos_d +      # bagian inersia/kinetik terkait omega1 dan omega2
+        m2 * g * math.sin(theta2) * cos_d +             # bagian gaya gravitasi dari massa kedua yang dikopel
+        m2 * l2 * omega2 * omega2 * sin_d -             # kontribusi gerak massa kedua terhadap massa pertama
+        (m1 + m2) * g * math.sin(theta1)                # gaya gravitasi pada massa pertama
+    ) / denom1                                           # bagi oleh denom1 untuk mendapatkan domega1
+    domega2 = (                                          # hitung turunan omega2 (rumus dinamika untuk massa kedua)
+        - m2 * l2 * omega2 * omega2 * sin_d * cos_d +   # kontribusi inersia massa kedua
+        (m1 + m2) * g * math.sin(theta1) * cos_d -      # gaya gravitasi massa pertama di-coupling ke massa kedua
+        (m1 + m2) * l1 * omega1 * omega1 * sin_d -      # kontribusi gerak massa pertama
+        (m1 + m2) * g * math.sin(theta2)                # gaya gravitasi langsung pada massa kedua
+    ) / denom2                                           # bagi oleh denom2 untuk mendapatkan domega2
+    return [omega1, domega1, omega2, domega2]            # kembalikan turunan state sebagai list [dθ1/dt, dω1/dt, dθ2/dt, dω2/dt]
+
+def chain_derivatives(chain, y):                          # turunan state rantai N link (θ1, ω1, …, θN, ωN) dalam O(N), tanpa membentuk/menginvers matriks massa N×N
+    ms, ls, g = chain.masses, chain.lengths, chain.g      # massa titik & panjang batang per link
+    n = len(ms); th = y[0::2]; om = y[1::2]               # sudut dan kecepatan sudut per link
+    inv = [1.0 / m for m in ms]                           # 1/m_i
+    cd = [0.0] * n; sd = [0.0] * n                        # cos/sin(θ_{i+1} − θ_i); elemen terakhir 0 (T_{N+1} = 0: ujung bebas)
+    for i in range(n - 1):
+        d = th[i + 1] - th[i]; cd[i] = math.cos(d); sd[i] = math.sin(d)
+    # tegangan batang T_i dari kendala panjang tetap: sistem tridiagonal simetris positif-definit → eliminasi Thomas tanpa pivot
+    cp = [0.0] * n; T = [0.0] * n                         # koefisien sapuan maju (T berisi ruas kanan tereduksi, lalu solusi)
+    cp[0] = -cd[0]; T[0] = (ls[0] * om[0] * om[0] + g * math.cos(th[0])) * ms[0]  # baris batang pertama (pivot diam, gravitasi)
+    for i in range(1, n):
+        lo = -cd[i - 1] * inv[i - 1]                      # kopling ke T_{i−1} (simetris dengan kopling T_{i−1} → T_i)
+        den = inv[i] + inv[i - 1] - lo * cp[i - 1]
+        cp[i] = -cd[i] * inv[i] / den; T[i] = (ls[i] * om[i] * om[i] - lo * T[i - 1]) / den  # gravitasi saling hapus pada batang dalam
+    for i in range(n - 2, -1, -1): T[i] -= cp[i] * T[i + 1]  # substitusi balik
+    # percepatan sudut: komponen normal gaya batang tetangga (+ gravitasi pada link pertama)
+    dy = [0.0] * (2 * n); prev = g * math.sin(th[0])      # prev = suku dari batang di atas (T_{i−1} sin(θ_i − θ_{i−1}) / m_{i−1})
+    for i in range(n):
+        nxt = T[i + 1] * sd[i] * inv[i] if i < n - 1 else 0.0
+        dy[2 * i] = om[i]; dy[2 * i + 1] = (nxt - prev) / ls[i]
+        prev = T[i] * sd[i] * inv[i]
+    return dy
+
+def chain_positions(lengths, state):                      # posisi pivot + tiap bob rantai (world coords relatif pivot), bob dijumlah kumulatif
+    x = y = 0.0; pts = [(0.0, 0.0)]
+    for i, l in enumerate(lengths):
+        a = state[2 * i]; x += l * math.sin(a); y -= l * math.cos(a); pts.append((x, y))
+    return pts
+
+def rk4_step(pendulum, y, dt, f=derivatives):            # fungsi integrator Runge-Kutta 4 untuk satu langkah waktu dt (f = fungsi turunan model, panjang state bebas)
+    n = range(len(y))                                    # 4 untuk double pendulum, 2N untuk rantai
+    k1 = f(pendulum, y)                                  # k1 = f(y)
+    y2 = [y[i] + 0.5 * dt * k1[i] for i in n]            # sementara y untuk menghitung k2 (y + dt/2 * k1)
+    k2 = f(pendulum, y2)                                 # k2 = f(y2)
+    y3 = [y[i] + 0.5 * dt * k2[i] for i in n]            # sementara y untuk k3
+    k3 = f(pendulum, y3)                                 # k3 = f(y3)
+    y4 = [y[i] + dt * k3[i] for i in n]                  # sementara y untuk k4 (y + dt * k3)
+    k4 = f(pendulum, y4)                                 # k4 = f(y4)
+    return [ y[i] + (dt / 6.0) * (k1[i] + 2.0*k2[i] + 2.0*k3[i] + k4[i]) for i in n ]  # rumus kombinasi RK4
+
+# ---- Kernel RK4 terspesialisasi (closure dengan konstanta terikat, atau Numba bila terpasang) ----
+KERNELS = ('auto', 'numba', 'closure', 'generic')         # 'generic' = rk4_step (membaca atribut pendulum tiap evaluasi)
+
+def make_rk4_kernel(m1, m2, l1, l2, g):                   # langkah RK4 fused untuk satu set parameter: kernel(θ1, ω1, θ2, ω2, dt) -> tuple
+    M = m1 + m2; Ml1 = M * l1; Mg = M * g                # konstanta dihitung sekali saat model dibangun
+    m2l1 = m2 * l1; m2l2 = m2 * l2; nm2l2 = -m2 * l2; m2g = m2 * g; r = l2 / l1  # (urutan operasi sama dgn derivatives → hasil bit-identik)
+    sin = math.sin; cos = math.cos
+    def f(t1, w1, t2, w2):                               # dω1/dt, dω2/dt; sin θ1 / sin θ2 dihitung sekali
+        d = t2 - t1; c = cos(d); s = sin(d); st1 = sin(t1); st2 = sin(t2)
+        den1 = Ml1 - m2l1 * c * c
+        if abs(den1) < 1e-12: den1 = 1e-12 if den1 >= 0 else -1e-12
+        den2 = r * den1
+        if abs(den2) < 1e-12: den2 = 1e-12 if den2 >= 0 else -1e-12
+        return ((m2l1 * w1 * w1 * s * c + m2g * st2 * c + m2l2 * w2 * w2 * s - Mg * st1) / den1,
+                (nm2l2 * w2 * w2 * s * c + Mg * st1 * c - Ml1 * w1 * w1 * s - Mg * st2) / den2)
+    def kernel(y0, y1, y2, y3, dt):                       # RK4 tanpa list sementara: stage sebagai skalar lokal
+        h2 = 0.5 * dt; h6 = dt / 6.0
+        a1, b1 = f(y0, y1, y2, y3)
+        p0 = y0 + h2 * y1; p1 = y1 + h2 * a1; p2 = y2 + h2 * y3; p3 = y3 + h2 * b1
+        a2, b2 = f(p0, p1, p2, p3)
+        q0 = y0 + h2 * p1; q1 = y1 + h2 * a2; q2 = y2 + h2 * p3; q3 = y3 + h2 * b2
+        a3, b3 = f(q0, q1, q2, q3)
+        s0 = y0 + dt * q1; s1 = y1 + dt * a3; s2 = y2 + dt * q3; s3 = y3 + dt * b3
+        a4, b4 = f(s0, s1, s2, s3)
+        return (y0 + h6 * (y1 + 2.0*p1 + 2.0*q1 + s1), y1 + h6 * (a1 + 2.0*a2 + 2.0*a3 + a4),
+                y2 + h6 * (y3 + 2.0*p3 + 2.0*q3 + s3), y3 + h6 * (b1 + 2.0*b2 + 2.0*b3 + b4))
+    return kernel
+
+if numba is not None:
+    @numba.njit(cache=True)
+    def _nb_f(t1, w1, t2, w2, Ml1, m2l1, m2l2, nm2l2, m2g, Mg, r):  # rumus identik dengan f di make_rk4_kernel (konstanta sebagai argumen)
+        d = t2 - t1; c = math.cos(d); s = math.sin(d); st1 = math.sin(t1); st2 = math.sin(t2)
+        den1 = Ml1 - m2l1 * c * c
+        if abs(den1) < 1e-12: den1 = 1e-12 if den1 >= 0 else -1e-12
+        den2 = r * den1
+        if abs(den2) < 1e-12: den2 = 1e-12 if den2 >= 0 else -1e-12
+        return ((m2l1 * w1 * w1 * s * c + m2g * st2 * c + m2l2 * w2 * w2 * s - Mg * st1) / den1,
+                (nm2l2 * w2 * w2 * s * c + Mg * st1 * c - Ml1 * w1 * w1 * s - Mg * st2) / den2)
+
+    @numba.njit(cache=True)
+    def _nb_rk4(y0, y1, y2, y3, dt, Ml1, m2l1, m2l2, nm2l2, m2g, Mg, r):  # dikompilasi sekali (cache di disk) untuk semua set parameter
+        h2 = 0.5 * dt; h6 = dt / 6.0
+        a1, b1 = _nb_f(y0, y1, y2, y3, Ml1, m2l1, m2l2, nm2l2, m2g, Mg, r)
+        p0 = y0 + h2 * y1; p1 = y1 + h2 * a1; p2 = y2 + h2 * y3; p3 = y3 + h2 * b1
+        a2, b2 = _nb_f(p0, p1, p2, p3, Ml1, m2l1, m2l2, nm2l2, m2g, Mg, r)
+        q0 = y0 + h2 * p1; q1 = y1 + h2 * a2; q2 = y2 + h2 * p3; q3 = y3 + h2 * b2
+        a3, b3 = _nb_f(q0, q1, q2, q3, Ml1, m2l1, m2l2, nm2l2, m2g, Mg, r)
+        s0 = y0 + dt * q1; s1 = y1 + dt * a3; s2 = y2 + dt * q3; s3 = y3 + dt * b3
+        a4, b4 = _nb_f(s0, s1, s2, s3, Ml1, m2l1, m2l2, nm2l2, m2g, Mg, r)
+        return (y0 + h6 * (y1 + 2.0*p1 + 2.0*q1 + s1), y1 + h6 * (a1 + 2.0*a2 + 2.0*a3 + a4),
+                y2 + h6 * (y3 + 2.0*p3 + 2.0*q3 + s3), y3 + h6 * (b1 + 2.0*b2 + 2.0*b3 + b4))
+
+def make_numba_kernel(m1, m2, l1, l2, g):                 # kernel Numba dengan antarmuka sama seperti make_rk4_kernel
+    if numba is None: raise ImportError("kernel 'numba' membutuhkan numba (pip install numba)")
+    M = m1 + m2; c = (M * l1, m2 * l1, m2 * l2, -m2 * l2, m2 * g, M * g, l2 / l1)
+    def kernel(y0, y1, y2, y3, dt): return _nb_rk4(y0, y1, y2, y3, dt, *c)
+    return kernel
+
+# ---- Adaptive integrator (Dormand–Prince RK45, dense output) ----
+_DP_C = (0.0, 1/5, 3/10, 4/5, 8/9, 1.0, 1.0)              # node c_i tableau Dormand–Prince
+_DP_A = (                                                 # koefisien a_ij (baris stage 2..7)
+    (1/5,),
+    (3/40, 9/40),
+    (44/45, -56/15, 32/9),
+    (19372/6561, -25360/2187, 64448/6561, -212/729),
+    (9017/3168, -355/33, 46732/5247, 49/176, -5103/18656),
+    (35/384, 0.0, 500/1113, 125/192, -2187/6784, 11/84))  # baris terakhir = bobot solusi orde 5 (FSAL)
+_DP_E = (71/57600, 0.0, -71/16695, 71/1920, -17253/339200, 22/525, -1/40)  # selisih bobot orde 5 − orde 4 (estimasi error)
+_DP_D = (-12715105075/11282082432, 0.0, 87487479700/32700410799, -10690763975/1880347072,
+         701980252875/199316789632, -1453857185/822651844, 69997945/29380423)  # koefisien dense output (Hairer)
+
+class DormandPrince:                                      # integrator RK45 dengan kontrol error (atol/rtol) dan dense output
+    def __init__(self, pendulum, t, y, rtol=1e-6, atol=1e-9, h_max=0.1):
+        self.pendulum = pendulum                         # model yang dipakai untuk pendulum.rhs (derivatives / chain_derivatives)
+        self.rtol, self.atol, self.h_max = rtol, atol, h_max  # toleransi relatif/absolut dan batas langkah
+        self.accepted = 0; self.rejected = 0; self.nfev = 0  # statistik: langkah diterima/ditolak, evaluasi derivatives()
+        self.reset(t, y)
+
+    def reset(self, t, y):                                # mulai ulang dari (t, y) — dipakai saat state diubah dari luar
+        self.t0 = self.t1 = t; self.y0 = self.y1 = list(y)  # interval langkah terakhir [t0, t1] (kosong di awal)
+        self.f1 = self._f(self.y1)                        # turunan di ujung interval (FSAL)
+        self._k = None; self.h = self._initial_h()        # stage langkah terakhir (untuk dense) dan ukuran langkah berikutnya
+        self.last_t = t; self.last = list(y)              # waktu & state terakhir yang diserahkan ke model (deteksi perubahan dari luar)
+
+    def _f(self, y):                                      # evaluasi fungsi turunan model + hitung nfev
+        self.nfev += 1
+        return self.pendulum.rhs(self.pendulum, y)
+
+    def _norm(self, v, y0, y1):                           # norma RMS berbobot toleransi (Hairer)
+        s = 0.0; n = len(v)
+        for i in range(n):
+            sc = self.atol + self.rtol * max(abs(y0[i]), abs(y1[i]))
+            s += (v[i] / sc) ** 2
+        return math.sqrt(s / n)
+
+    def _initial_h(self):                                 # tebakan awal ukuran langkah dari besar state dan turunannya
+        d0 = self._norm(self.y1, self.y1, self.y1); d1 = self._norm(self.f1, self.y1, self.y1)
+        h = 1e-6 if d0 < 1e-5 or d1 < 1e-5 else 0.01 * d0 / d1
+        return min(h, self.h_max)
+
+    def _step(self):                                      # coba satu langkah dari t1; ulangi dengan h lebih kecil bila ditolak
+        y = self.y1; n = range(len(y))
+        while True:
+            h = self.h
+            k = [self.f1]                                 # k1 = f(y) (FSAL dari langkah sebelumnya)
+            for a in _DP_A:                               # stage 2..7
+                yi = [y[i] + h * sum(a[j] * k[j][i] for j in range(len(a))) for i in n]
+                k.append(self._f(yi))
+            y_new = yi                                    # stage 7 dievaluasi di solusi orde 5
+            err = self._norm([h * sum(_DP_E[j] * k[j][i] for j in range(7)) for i in n], y, y_new)
+            fac = min(5.0, max(0.2, 0.9 * (err if err > 0 else 1e-10) ** -0.2))  # faktor perubahan langkah (dibatasi)
+            self.h = min(self.h_max, h * fac)             # langkah berikutnya
+            if err <= 1.0: break                          # diterima
+            self.rejected += 1                            # ditolak: ulangi dengan h lebih kecil
+        self.accepted += 1
+        self.t0, self.y0 = self.t1, y; self.t1 = self.t1 + h; self.y1 = y_new  # geser interval
+        self._k = k; self.f1 = k[6]                       # simpan stage untuk dense output; FSAL
+
+    def dense(self, t):                                   # state pada waktu t di dalam langkah terakhir [t0, t1] tanpa evaluasi tambahan
+        if not self.t0 <= t <= self.t1: raise ValueError("t di luar langkah terakhir; panggil advance_to()")
+        if self._k is None or t == self.t1: return list(self.y1)
+        h = self.t1 - self.t0; th = (t - self.t0) / h; th1 = 1.0 - th
+        y0, y1, k = self.y0, self.y1, self._k
+        out = []
+        for i in range(len(y1)):                          # interpolan orde 4 kontinu (contd5)
+            r2 = y1[i] - y0[i]; r3 = h * k[0][i] - r2; r4 = r2 - h * k[6][i] - r3
+            r5 = h * sum(_DP_D[j] * k[j][i] for j in range(7))
+            out.append(y0[i] + th * (r2 + th1 * (r3 + th * (r4 + th1 * r5))))
+        return out
+
+    def advance_to(self, t):                              # ambil langkah adaptif seperlunya hingga t tercakup, lalu interpolasi
+        while self.t1 < t: self._step()
+        return self.dense(t)
+
+# ---- Symplectic integrator (implicit midpoint in (θ, p)) & energy ----
+def energy(pendulum, y):                                  # energi kinetik & potensial dari state (θ1, ω1, θ2, ω2)
+    theta1, omega1, theta2, omega2 = y
+    m1, m2, l1, l2, g = pendulum.m1, pendulum.m2, pendulum.l1, pendulum.l2, pendulum.g
+    kinetic = 0.5 * (m1 + m2) * l1 * l1 * omega1 * omega1 + 0.5 * m2 * l2 * l2 * omega2 * omega2 \
+        + m2 * l1 * l2 * omega1 * omega2 * math.cos(theta1 - theta2)  # T = ½ωᵀM(θ)ω
+    potential = - (m1 + m2) * g * l1 * math.cos(theta1) - m2 * g * l2 * math.cos(theta2)  # V relatif pivot
+    return kinetic, potential
+
+def chain_energy(chain, y):                               # (kinetik, potensial) rantai N link: kecepatan & kedalaman bob dijumlah kumulatif, O(N)
+    g = chain.g; vx = vy = h = 0.0; kinetic = potential = 0.0
+    for i, (m, l) in enumerate(zip(chain.masses, chain.lengths)):
+        a = y[2 * i]; w = l * y[2 * i + 1]; c = math.cos(a)
+        vx += w * c; vy += w * math.sin(a); h -= l * c   # v_k = Σ_{i≤k} l_i ω_i (cos θ_i, sin θ_i), y_k = −Σ_{i≤k} l_i cos θ_i
+        kinetic += 0.5 * m * (vx * vx + vy * vy); potential += m * g * h
+    return kinetic, potential
+
+def to_momenta(pendulum, y):                              # (θ1, ω1, θ2, ω2) → koordinat kanonik (θ1, p1, θ2, p2)
+    theta1, omega1, theta2, omega2 = y
+    m1, m2, l1, l2 = pendulum.m1, pendulum.m2, pendulum.l1, pendulum.l2
+    c = m2 * l1 * l2 * math.cos(theta1 - theta2)          # elemen off-diagonal matriks massa
+    return [theta1, (m1 + m2) * l1 * l1 * omega1 + c * omega2, theta2, m2 * l2 * l2 * omega2 + c * omega1]
+
+def hamiltonian_derivatives(pendulum, z):                 # persamaan Hamilton untuk z = (θ1, p1, θ2, p2); kembalikan (dz/dt, ω1, ω2)
+    theta1, p1, theta2, p2 = z
+    m1, m2, l1, l2, g = pendulum.m1, pendulum.m2, pendulum.l1, pendulum.l2, pendulum.g
+    s = math.sin(theta1 - theta2); c = m2 * l1 * l2 * math.cos(theta1 - theta2)
+    a = (m1 + m2) * l1 * l1; b = m2 * l2 * l2             # diagonal matriks massa
+    det = a * b - c * c                                   # = m2 l1² l2² (m1 + m2 sin²Δ) > 0
+    omega1 = (b * p1 - c * p2) / det; omega2 = (a * p2 - c * p1) / det  # ω = M⁻¹ p
+    k = m2 * l1 * l2 * s * omega1 * omega2                # ½ ωᵀ (∂M/∂θ) ω
+    return [omega1, - k - (m1 + m2) * g * l1 * math.sin(theta1), omega2, k - m2 * g * l2 * math.sin(theta2)], omega1, omega2
+
+def midpoint_step(pendulum, y, dt, tol=1e-13, max_iter=50):  # satu langkah implicit midpoint (simplektik) dalam (θ, p)
+    z0 = to_momenta(pendulum, y)
+    f, _, _ = hamiltonian_derivatives(pendulum, z0)
+    z1 = [z0[i] + dt * f[i] for i in range(4)]            # tebakan awal: Euler eksplisit
+    for _ in range(max_iter):                             # iterasi titik tetap z1 = z0 + dt·f((z0 + z1)/2)
+        f, omega1, omega2 = hamiltonian_derivatives(pendulum, [0.5 * (z0[i] + z1[i]) for i in range(4)])
+        z_new = [z0[i] + dt * f[i] for i in range(4)]
+        diff = max(abs(z_new[i] - z1[i]) for i in range(4)); z1 = z_new
+        if diff < tol * (1.0 + max(abs(v) for v in z1)): break
+    _, omega1, omega2 = hamiltonian_derivatives(pendulum, z1)  # ω di ujung langkah dari p baru
+    return [z1[0], omega1, z1[2], omega2]
+
+class EnergyMonitor:                                      # pemantau drift energi total, sampling tiap `every` langkah agar murah
+    def __init__(self, pendulum, every=50):
+        self.every = max(1, int(every)); self.reset(pendulum)
+
+    def reset(self, pendulum):                            # tetapkan energi acuan dari state sekarang
+        kinetic, potential = pendulum.energy()
+        self.e0 = kinetic + potential; self.kinetic, self.potential = kinetic, potential
+        self.scale = max(abs(self.e0), pendulum.potential_depth(), 1e-12)  # skala normalisasi (hindari E0 ≈ 0)
+        self.drift = 0.0; self.max_drift = 0.0; self._count = 0
+
+    def tick(self, pendulum):                             # dipanggil tiap langkah; hitung energi hanya tiap `every` langkah
+        self._count += 1
+        if self._count < self.every: return
+        self._count = 0
+        self.kinetic, self.potential = pendulum.energy()
+        self.drift = (self.kinetic + self.potential - self.e0) / self.scale  # drift relatif
+        if abs(self.drift) > abs(self.max_drift): self.max_drift = self.drift
+
+# ---- Ring buffer (history / trail) ----
+class RingBuffer:                                         # buffer melingkar kapasitas tetap, sampel berisi `width` float64
+    def __init__(self, capacity, width):                  # capacity = jumlah sampel maksimal, width = jumlah field per sampel
+        self.capacity = max(1, int(capacity)); self.width = int(width)  # simpan ukuran
+        self._slots = self.capacity + 1                   # satu slot cadangan: sampel baru ditulis di luar jendela yang terlihat
+        self._data = array('d', bytes(16 * self._slots * self.width))  # prealokasi 2x slot (mirror) agar jendela selalu kontigu
+        self._mv = memoryview(self._data)                 # memoryview untuk slicing zero-copy
+        self._start = 0; self._len = 0                    # slot sampel tertua dan jumlah sampel tersimpan
+        self.generation = 0                               # naik setiap clear(); konsumen inkremental memakai ini untuk mendeteksi reset
+        self.total = 0                                    # jumlah sampel yang pernah di-append sejak clear() (nomor sampel berikutnya)
+
+    def __len__(self):                                    # jumlah sampel yang tersimpan
+        return self._len
+
+    def append(self, *values):                            # tambah satu sampel, O(1); sampel tertua ditimpa bila penuh
+        w = self.width; n = self._slots; d = self._data
+        slot = self._start + self._len                    # slot setelah sampel terbaru (selalu di luar jendela yang terlihat)
+        if slot >= n: slot -= n
+        i = slot * w; j = i + n * w                       # posisi di paruh pertama dan salinan mirror di paruh kedua
+        for k in range(w):
+            d[i + k] = d[j + k] = values[k]              # tulis ke dua tempat agar invariant mirror terjaga
+        if self._len < self.capacity: self._len += 1      # publikasikan sampel setelah datanya lengkap (aman dibaca thread lain)
+        else: self._start = self._start + 1 if self._start + 1 < n else 0  # penuh: geser jendela, sampel tertua keluar
+        self.total += 1
+
+    def clear(self):                                      # kosongkan buffer tanpa dealokasi
+        self._start = 0; self._len = 0; self.total = 0; self.generation += 1
+
+    def _range(self, start, stop):                       # normalisasi indeks (mendukung negatif) → (a, b) logis
+        a, b, _ = slice(start, stop).indices(self._len)
+        return a, max(a, b)
+
+    def view(self, start=0, stop=None):                  # memoryview datar (interleaved) sampel [start, stop) — zero-copy
+        a, b = self._range(start, stop); w = self.width
+        return self._mv[(self._start + a) * w:(self._start + b) * w]  # berkat mirror, jendela apapun kontigu
+
+    def column(self, j, start=0, stop=None):              # memoryview ber-stride untuk field ke-j — zero-copy
+        return self.view(start, stop)[j::self.width]
+
+    def as_array(self, start=0, stop=None):              # view numpy (n, width) tanpa salinan; butuh numpy
+        return np.frombuffer(self.view(start, stop), dtype=np.float64).reshape(-1, self.width)
+
+    def bisect(self, value, j=0, right=False):            # indeks pertama dengan field j >= value (> value bila right), field harus monoton naik, O(log n)
+        return (bisect.bisect_right if right else bisect.bisect_left)(self.column(j), value)
+
+    def __getitem__(self, idx):                           # akses seperti list: buf[-1] → tuple, buf[a:b] → list of tuple (salinan)
+        if isinstance(idx, slice):
+            a, b = self._range(idx.start, idx.stop)
+            return list(zip(*(self.column(j, a, b) for j in range(self.width))))[::idx.step or 1]
+        if idx < 0: idx += self._len
+        if not 0 <= idx < self._len: raise IndexError("RingBuffer index out of range")
+        w = self.width; i = (self._start + idx) * w
+        return tuple(self._mv[i:i + w])
+
+    def __iter__(self):                                   # iterasi sampel dari tertua ke terbaru sebagai tuple
+        return zip(*(self.column(j) for j in range(self.width)))
+
+# ---- Chain / double pendulum model ----
+class ChainPendulum:                                      # rantai N link (N >= 2) massa titik, massa & panjang per link; state (θ1, ω1, …, θN, ωN)
+    rhs = staticmethod(chain_derivatives)                 # fungsi turunan model untuk rk4_step / DormandPrince
+    INTEGRATORS = ('rk4', 'rk45')                         # implicit midpoint (Hamiltonian closed-form) hanya untuk DoublePendulum
+    RK45_RTOL = 1e-4                                      # rtol default rk45: rantai link pendek dengan 1e-6 butuh ~1000 langkah/s (jauh dari real time)
+
+    def __init__(self, masses=(1.0, 1.0, 1.0), lengths=(1.0, 1.0, 1.0), g=9.81, max_history=5000):  # satu massa & panjang per link
+        if len(masses) != len(lengths) or len(masses) < 2: raise ValueError("rantai butuh >= 2 link dengan jumlah massa = jumlah panjang")
+        if min(masses) <= 0 or min(lengths) <= 0: raise ValueError("massa dan panjang link harus positif")
+        self.masses = [float(m) for m in masses]; self.lengths = [float(l) for l in lengths]; self.g = g  # simpan parameter fisik
+        self.state = [math.pi/2, 0.0] * len(self.masses)  # state awal: semua link horizontal, diam
+        self._rk4 = None; self.kernel = 'generic'          # tanpa kernel fused: rk4_step + chain_derivatives
+        self._setup(max_history)
+
+    def _setup(self, max_history):                        # state non-fisik bersama semua model rantai (dipanggil konstruktor)
+        self.time = 0.0                                  # waktu simulasi (counter)
+        self.base_dt = 0.005; self.dt = self.base_dt     # langkah waktu dasar (base_dt) dan dt yang aktif
+        self.integrator = 'rk4'; self._adaptive = None    # 'rk4' (langkah tetap), 'rk45' (Dormand–Prince adaptif) atau 'midpoint' (simplektik)
+        self.energy_monitor = None                       # EnergyMonitor opsional (lihat enable_energy_monitor)
+        self.recorder = None                             # TrajectoryWriter opsional (recording.py), diisi tiap update()
+        self.checkpointer = None                         # Checkpointer opsional (checkpoint.py): checkpoint berkala + seek()
+        self.analytics = None                            # Analytics opsional (analytics.py): Poincaré, spektrum, flip, histogram fase tiap update()
+        self.max_history = max_history                   # batas panjang history/trail (kapasitas ring buffer)
+        self.history = RingBuffer(max_history, 3)        # histori (t, θ1, θ2) untuk plot/analisis
+        self.trail = RingBuffer(max_history, 2)          # jejak posisi (x, y) bob terakhir untuk digambar (visual trail)
+        self.reset_buffers()                             # isi history dengan sampel awal
+
+    @property
+    def links(self):                                      # jumlah link N
+        return len(self.masses)
+
+    def reset_buffers(self, t0=None):                    # kosongkan history & trail lalu isi history dengan state sekarang
+        self.history.clear(); self.trail.clear()          # reset tanpa realokasi
+        self.history.append(self.time if t0 is None else t0, self.state[0], self.state[2])  # sampel awal
+        if self.energy_monitor: self.energy_monitor.reset(self)  # energi acuan baru untuk run baru
+        if self.checkpointer: self.checkpointer.clear()   # state diubah dari luar → timeline baru
+        if self.analytics: self.analytics.reset(self)     # analitik mulai dari nol untuk run baru
+
+    def clear_history(self):                             # kosongkan history grafik (sampel awal di waktu 0, trail tetap)
+        self.history.clear(); self.history.append(0.0, self.state[0], self.state[2])
+
+    def set_integrator(self, name, rtol=None, atol=1e-9, h_max=0.1):  # pilih integrator: 'rk4', 'rk45' (dengan toleransi; rtol None = RK45_RTOL) atau 'midpoint' (DoublePendulum)
+        if name not in self.INTEGRATORS: raise ValueError(f"integrator tidak dikenal untuk {type(self).__name__}: {name!r}")
+        self.integrator = name; rtol = self.RK45_RTOL if rtol is None else rtol
+        self._adaptive = DormandPrince(self, self.time, self.state, rtol, atol, h_max) if name == 'rk45' else None
+
+    def integrator_stats(self):                           # statistik integrator adaptif (langkah diterima/ditolak, evaluasi fungsi turunan)
+        a = self._adaptive
+        return {'accepted': a.accepted, 'rejected': a.rejected, 'nfev': a.nfev} if a else {}
+
+    def state_at(self, t):                                # sampel state di waktu t dalam langkah adaptif terakhir (dense output, tanpa langkah ekstra)
+        if self._adaptive is None: raise ValueError("dense output hanya tersedia untuk integrator 'rk45'")
+        return self._adaptive.dense(t)
+
+    def energy(self):                                     # (kinetik, potensial) dari state sekarang
+        return chain_energy(self, self.state)
+
+    def potential_depth(self):                            # −V minimum (rantai tergantung lurus) = g Σ l_i Σ_{k≥i} m_k — skala energi
+        ms = self.masses; tail = [0.0] * (len(ms) + 1)
+        for i in range(len(ms) - 1, -1, -1): tail[i] = tail[i + 1] + ms[i]  # massa di bawah batang i (dijumlah dari ujung)
+        return sum(tail[i] * self.g * l for i, l in enumerate(self.lengths))
+
+    def enable_energy_monitor(self, every=50):            # pasang pemantau drift energi (sampling tiap `every` langkah)
+        self.energy_monitor = EnergyMonitor(self, every)
+        return self.energy_monitor
+
+    def seek(self, t):                                    # lompat ke waktu simulasi t: restore checkpoint terdekat + fast-forward (bit-reproducible)
+        if self.checkpointer is None: raise ValueError("seek membutuhkan checkpointer (checkpoint.Checkpointer)")
+        if self.analytics: self.analytics.reset(self)     # timeline berpindah → analitik dihitung ulang dari ekor fast-forward
+        return self.checkpointer.seek(self, t)
+
+    def step(self):                                      # satu langkah integrasi saja (tanpa history/trail) — jalur cepat untuk headless
+        if self.integrator == 'midpoint':
+            self.state = midpoint_step(self, self.state, self.dt)  # implicit midpoint simplektik: energi tidak drift sekuler
+        elif self._adaptive is None:
+            k = self._rk4                                 # kernel fused dengan konstanta terikat (None = rk4_step generik)
+            self.state = list(k(*self.state, self.dt)) if k is not None else rk4_step(self, self.state, self.dt, self.rhs)  # integrasikan state menggunakan RK4
+        else:
+            a = self._adaptive; t = self.time + self.dt
+            if self.time != a.last_t or self.state != a.last: a.reset(self.time, self.state)  # state/time diubah dari luar (reset, setup)
+            self.state = a.last = a.advance_to(t); a.last_t = t  # langkah adaptif seperlunya + interpolasi ke waktu frame
+        self.time += self.dt                              # tambahkan waktu simulasi
+        if self.energy_monitor: self.energy_monitor.tick(self)  # cek drift energi (murah: hanya tiap N langkah)
+
+    def update(self):                                    # update satu langkah fisika: integrasi + menyimpan jejak
+        cp = self.checkpointer
+        if cp is not None and cp.due(self): cp.take(self)  # checkpoint berkala / saat dt berubah
+        self.step()                                       # integrasi satu langkah
+        self.history.append(self.time, self.state[0], self.state[2])  # simpan waktu dan dua sudut pertama ke history (O(1), sampel tertua tertimpa)
+        self.trail.append(*self.tip())                    # tambahkan posisi bob terakhir ke trail (O(1))
+        if self.analytics: self.analytics.observe(self)    # analitik streaming (O(1) per langkah)
+        if self.recorder: self.recorder.record(self)       # streaming ke file trajektori bila sedang merekam
+
+    def tip(self):                                        # posisi (x, y) bob terakhir
+        return chain_positions(self.lengths, self.state)[-1]
+
+    def get_positions(self, state=None):                  # posisi pivot lalu tiap bob (world coords relatif); state opsional (mis. hasil interpolasi)
+        return chain_positions(self.lengths, self.state if state is None else state)
+
+class DoublePendulum(ChainPendulum):                      # kelas model fisika double pendulum (rantai N = 2): rumus closed-form, kernel fused, midpoint
+    rhs = staticmethod(derivatives)
+    INTEGRATORS = ('rk4', 'rk45', 'midpoint')
+    RK45_RTOL = 1e-6                                      # double pendulum: toleransi ketat tetap jauh lebih cepat dari real time
+
+    def __init__(self, m1=1.0, m2=1.0, l1=1.0, l2=1.0, g=9.81, max_history=5000, kernel='auto'):  # konstruktor dengan parameter default
+        self.m1, self.m2, self.l1, self.l2, self.g = m1, m2, l1, l2, g  # simpan parameter fisik
+        self.state = [math.pi/2, 0.0, math.pi/2, 0.0]    # state awal: θ1, ω1, θ2, ω2 (default berdiri horizontal-ish)
+        self.set_kernel(kernel)                          # kernel RK4 terspesialisasi untuk parameter ini
+        self._setup(max_history)
+
+    masses = property(lambda self: [self.m1, self.m2])   # tampilan rantai (baca saja): parameter aslinya m1, m2, l1, l2
+    lengths = property(lambda self: [self.l1, self.l2])
+
+    def reset_buffers(self, t0=None):                    # kosongkan history & trail lalu isi history dengan state sekarang
+        super().reset_buffers(t0)
+        self.set_kernel(self.kernel)                     # parameter bisa saja diubah sebelum run baru → ikat ulang konstanta kernel
+
+    def set_kernel(self, name='auto'):                   # kernel RK4: 'auto' (numba bila terpasang, selain itu closure), 'numba', 'closure', 'generic'
+        if name not in KERNELS: raise ValueError(f"kernel tidak dikenal: {name!r}")
+        if name == 'auto': name = 'numba' if numba is not None else 'closure'
+        make = make_numba_kernel if name == 'numba' else make_rk4_kernel
+        self._rk4 = None if name == 'generic' else make(self.m1, self.m2, self.l1, self.l2, self.g)
+        self.kernel = name                               # nama kernel yang benar-benar dipakai
+
+    def energy(self):                                     # (kinetik, potensial) dari state sekarang
+        return energy(self, self.state)
+
+    def tip(self):                                        # posisi (x2, y2) bob kedua
+        theta1, _, theta2, _ = self.state                  # ambil sudut (abaikan omega)
+        x1 = self.l1 * math.sin(theta1); y1 = - self.l1 * math.cos(theta1)  # posisi (x1,y1) massa pertama relatif pivot
+        return x1 + self.l2 * math.sin(theta2), y1 - self.l2 * math.cos(theta2)  # posisi (x2,y2) massa kedua
+
+    def get_positions(self, state=None):                  # helper untuk mendapatkan posisi pivot, bob1, bob2 (world coords relatif)
+        theta1, _, theta2, _ = self.state if state is None else state  # ambil sudut dari state (atau state lain, mis. hasil interpolasi)
+        x1 = self.l1 * math.sin(theta1); y1 = - self.l1 * math.cos(theta1)  # hitung posisi bob1
+        x2 = x1 + self.l2 * math.sin(theta2); y2 = y1 - self.l2 * math.cos(theta2)  # hitung posisi bob2
+        return (0.0, 0.0), (x1, y1), (x2, y2)             # kembalikan pivot, bob1, bob2
+
+# ---- Batch integrator (vectorized RK4, numpy) ----
+def _clamp_denom(d):                                      # versi vektor dari proteksi pembagi hampir nol di derivatives()
+    return np.where(np.abs(d) < 1e-12, np.where(d >= 0, 1e-12, -1e-12), d)  # ganti elemen |d| < 1e-12 dengan ±1e-12
+
+def derivatives_batch(batch, y):                          # turunan state untuk N pendulum sekaligus; y berbentuk (4, N)
+    theta1, omega1, theta2, omega2 = y                    # unpack baris: tiap baris adalah array kontigu panjang N
+    m1, m2 = batch.m1, batch.m2                           # array massa (N,)
+    l1, l2 = batch.l1, batch.l2                           # array panjang tali (N,)
+    g = batch.g                                           # array gravitasi (N,)
+    delta = theta2 - theta1                               # selisih sudut per pendulum
+    cos_d = np.cos(delta); sin_d = np.sin(delta)          # cos/sin delta sekali untuk semua pendulum
+    denom1 = _clamp_denom((m1 + m2) * l1 - m2 * l1 * cos_d * cos_d)  # denominator domega1 (urutan operasi sama dgn versi skalar)
+    denom2 = _clamp_denom((l2 / l1) * denom1)             # denominator domega2
+    out = np.empty_like(y)                                # alokasi hasil (4, N) sekali per evaluasi
+    out[0] = omega1; out[2] = omega2                      # dθ/dt = ω
+    out[1] = (                                            # domega1, rumus identik dengan derivatives()
+        m2 * l1 * omega1 * omega1 * sin_d * cos_d +
+        m2 * g * np.sin(theta2) * cos_d +
+        m2 * l2 * omega2 * omega2 * sin_d -
+        (m1 + m2) * g * np.sin(theta1)
+    ) / denom1
+    out[3] = (                                            # domega2, rumus identik dengan derivatives()
+        - m2 * l2 * omega2 * omega2 * sin_d * cos_d +
+        (m1 + m2) * g * np.sin(theta1) * cos_d -
+        (m1 + m2) * l1 * omega1 * omega1 * sin_d -
+        (m1 + m2) * g * np.sin(theta2)
+    ) / denom2
+    return out                                            # kembalikan array turunan (4, N)
+
+def rk4_step_batch(batch, y, dt):                         # satu langkah RK4 untuk semua pendulum dalam satu panggilan vektor
+    k1 = derivatives_batch(batch, y)                      # k1 = f(y)
+    k2 = derivatives_batch(batch, y + 0.5 * dt * k1)      # k2 = f(y + dt/2 * k1)
+    k3 = derivatives_batch(batch, y + 0.5 * dt * k2)      # k3 = f(y + dt/2 * k2)
+    k4 = derivatives_batch(batch, y + dt * k3)            # k4 = f(y + dt * k3)
+    return y + (dt / 6.0) * (k1 + 2.0*k2 + 2.0*k3 + k4)   # kombinasi RK4 (urutan operasi sama dengan rk4_step)
+
+class BatchPendulum:                                      # model N double pendulum dalam array kontigu (structure-of-arrays)
+    def __init__(self, theta1, theta2, omega1=0.0, omega2=0.0, m1=1.0, m2=1.0, l1=1.0, l2=1.0, g=9.81):  # tiap argumen boleh skalar atau array (N,)
+        if np is None: raise ImportError("BatchPendulum membutuhkan numpy (pip install numpy)")  # numpy wajib untuk jalur batch
+        theta1 = np.atleast_1d(np.asarray(theta1, dtype=np.float64))  # sudut awal θ1 sebagai array float64
+        n = theta1.shape[0]                               # jumlah pendulum ditentukan dari θ1
+        col = lambda v: np.ascontiguousarray(np.broadcast_to(np.asarray(v, dtype=np.float64), (n,)))  # broadcast skalar/array ke (N,) kontigu
+        self.m1, self.m2, self.l1, self.l2, self.g = col(m1), col(m2), col(l1), col(l2), col(g)  # parameter fisik per pendulum
+        self.state = np.empty((4, n), dtype=np.float64)   # state (4, N): baris θ1, ω1, θ2, ω2
+        self.state[0] = theta1; self.state[1] = col(omega1)  # isi θ1 dan ω1
+        self.state[2] = col(theta2); self.state[3] = col(omega2)  # isi θ2 dan ω2
+        self.time = 0.0                                  # waktu simulasi bersama untuk semua pendulum
+        self.base_dt = 0.005; self.dt = self.base_dt     # langkah waktu sama seperti DoublePendulum
+
+    @classmethod
+    def around(cls, pendulum, n, spread=1e-3, seed=None):  # ensemble N pendulum di sekitar `pendulum` (double pendulum RK4): anggota 0 = referensi persis
+        if getattr(pendulum, 'links', 2) != 2: raise ValueError("ensemble hanya untuk double pendulum (2 link)")
+        if getattr(pendulum, 'integrator', 'rk4') != 'rk4':  # batch selalu RK4 → anggota 0 akan menyimpang dari referensi rk45/midpoint
+            raise ValueError(f"ensemble hanya untuk integrator RK4, bukan {pendulum.integrator!r}")
+        rng = np.random.default_rng(seed)
+        d = rng.uniform(-spread, spread, size=(2, n)); d[:, 0] = 0.0  # gangguan sudut kecil; anggota 0 tanpa gangguan
+        th1, om1, th2, om2 = pendulum.state
+        batch = cls(th1 + d[0], th2 + d[1], om1, om2, pendulum.m1, pendulum.m2, pendulum.l1, pendulum.l2, pendulum.g)
+        batch.time = pendulum.time; batch.base_dt = pendulum.base_dt; batch.dt = pendulum.dt
+        batch.spread = spread                             # disimpan agar ensemble bisa dibangun ulang (mis. RESTART)
+        return batch
+
+    def __len__(self):                                   # jumlah pendulum dalam batch
+        return self.state.shape[1]
+
+    def update(self, steps=1):                           # majukan semua pendulum sebanyak `steps` langkah RK4
+        for _ in range(steps):
+            self.state = rk4_step_batch(self, self.state, self.dt)  # satu panggilan vektor per langkah
+            self.time += self.dt                          # tambahkan waktu simulasi
+
+    def get_positions(self, state=None):                 # posisi bob1 dan bob2 untuk semua pendulum (array (N,)); state opsional (mis. interpolasi)
+        theta1, _, theta2, _ = self.state if state is None else state  # ambil baris sudut
+        x1 = self.l1 * np.sin(theta1); y1 = - self.l1 * np.cos(theta1)  # posisi bob1
+        x2 = x1 + self.l2 * np.sin(theta2); y2 = y1 - self.l2 * np.cos(theta2)  # posisi bob2
+        return (x1, y1), (x2, y2)                         # kembalikan pasangan array koordinat
@@ -0,0 +1,152 @@
+# profiler.py — profiler ringan per-tahap (fisika, redraw graph/pendulum, animasi theme) + ekspor metrik; bebas Kivy, aman dari thread fisika
+import time, json, csv, threading, contextlib             # jam monotonic, format ekspor, lock antar-thread
+from collections import deque                            # jendela sampel bergulir
+
+# ---- Stage: durasi satu tahap dalam jendela bergulir ----
+class Stage:
+    EDGES_MS = (0.1, 0.25, 0.5, 1.0, 2.0, 4.0, 8.0, 16.7, 33.3)  # batas bucket histogram (ms); bucket terakhir = di atas 33.3 ms
+
+    def __init__(self, window=600):
+        self.samples = deque(maxlen=window)              # durasi terakhir (detik); sampel lama terbuang otomatis
+        self.count = 0; self.total = 0.0                 # total sepanjang sesi (tidak ikut bergulir)
+
+    def add(self, seconds):
+        self.samples.append(seconds); self.count += 1; self.total += seconds
+
+    def histogram(self):                                 # jumlah sampel per bucket EDGES_MS dalam jendela
+        h = [0] * (len(self.EDGES_MS) + 1)
+        for s in self.samples:
+            ms = s * 1e3; i = 0
+            while i < len(self.EDGES_MS) and ms > self.EDGES_MS[i]: i += 1
+            h[i] += 1
+        return h
+
+    def summary(self):                                   # mean/p50/p95/max (ms) atas jendela bergulir
+        xs = sorted(self.samples)
+        if not xs: return {"n": 0, "mean": 0.0, "p50": 0.0, "p95": 0.0, "max": 0.0}
+        q = lambda f: xs[min(len(xs) - 1, int(f * len(xs)))] * 1e3
+        return {"n": self.count, "mean": sum(xs) / len(xs) * 1e3, "p50": q(0.5), "p95": q(0.95), "max": xs[-1] * 1e3}
+
+# ---- Counter: jumlah kumulatif + laju per detik ----
+class Counter:
+    def __init__(self, window=2.0):
+        self.value = 0; self.window = window             # laju dihitung atas `window` detik terakhir
+        self._marks = deque(maxlen=256)                  # (wall, value) untuk estimasi laju
+
+    def add(self, n, now):
+        self.value += n; self._marks.append((now, self.value))
+
+    def rate(self, now):
+        while len(self._marks) > 2 and now - self._marks[0][0] > self.window: self._marks.popleft()
+        if len(self._marks) < 2: return 0.0
+        (t0, v0), (t1, v1) = self._marks[0], self._marks[-1]
+        return (v1 - v0) / (t1 - t0) if t1 > t0 else 0.0
+
+# ---- Profiler ----
+class Profiler:
+    def __init__(self, stages=("physics", "graph", "pendulum", "theme"), counters=("frames", "dropped_frames", "sim_steps", "physics_dropped"),
+                 window=600, frame_budget=1.0 / 60.0):
+        self.window = window; self.frame_budget = frame_budget  # frame yang lebih lama dari budget dihitung sebagai drop
+        self.stages = {name: Stage(window) for name in stages}  # tahap yang sudah diketahui (urutan tampilan overlay tetap)
+        self.counters = {name: Counter() for name in counters}; self.gauges = {}  # counter kumulatif dan nilai sesaat (mis. jumlah vertex)
+        self.frame_time = Stage(window)                  # interval antar frame render
+        self.errors = {}; self.last_error = None         # jumlah error per tempat + pesan terakhir
+        self._lock = threading.Lock()                    # record() datang dari thread fisika, snapshot() dari UI
+        self._export = None; self._export_path = None; self._writer = None; self._next_export = 0.0
+        self.export_every = 1.0                          # interval baris ekspor (detik)
+
+    def record(self, name, seconds):                     # tambah satu durasi ke tahap `name`
+        with self._lock:
+            st = self.stages.get(name)
+            if st is None: st = self.stages[name] = Stage(self.window)
+            st.add(seconds)
+
+    @contextlib.contextmanager
+    def measure(self, name):                             # with profiler.measure("graph"): ... (tercatat juga bila melempar)
+        t0 = time.perf_counter()
+        try: yield
+        finally: self.record(name, time.perf_counter() - t0)
+
+    def count(self, name, n=1):
+        with self._lock:
+            c = self.counters.get(name)
+            if c is None: c = self.counters[name] = Counter()
+            c.add(n, time.perf_counter())
+
+    def gauge(self, name, value):
+        self.gauges[name] = value
+
+    def frame(self, dt):                                 # dipanggil sekali per frame dengan dt dari Clock
+        with self._lock: self.frame_time.add(dt)
+        self.count("frames")
+        late = int(dt / self.frame_budget + 0.5) - 1     # jumlah slot frame yang terlewat
+        if late > 0: self.count("dropped_frames", late)
+
+    def error(self, where, exc):                         # catat error (bukan telan diam-diam); True bila pesan ini baru
+        msg = f"{where}: {type(exc).__name__}: {exc}"
+        with self._lock:
+            self.errors[where] = self.errors.get(where, 0) + 1
+            new = msg != self.last_error; self.last_error = msg
+        return new
+
+    def snapshot(self):                                  # dict datar-bersarang untuk overlay/ekspor
+        now = time.perf_counter()
+        with self._lock:
+            return {
+                "wall": time.time(),
+                "stages": {k: st.summary() for k, st in self.stages.items()},
+                "hist": {k: st.histogram() for k, st in self.stages.items()},
+                "frame": self.frame_time.summary(),
+                "counters": {k: c.value for k, c in self.counters.items()},
+                "rates": {k: c.rate(now) for k, c in self.counters.items()},
+                "gauges": dict(self.gauges), "errors": dict(self.errors), "last_error": self.last_error}
+
+    def overlay_text(self, snap=None):                   # ringkasan multi-baris untuk label overlay
+        s = snap or self.snapshot(); r = s["rates"]; c = s["counters"]
+        lines = [f"fps {r.get('frames', 0.0):5.1f}  drop {c.get('dropped_frames', 0)}  tick-drop {c.get('physics_dropped', 0)}",
+                 f"steps/s {r.get('sim_steps', 0.0):7.0f}"]
+        for k, st in s["stages"].items():
+            if st["n"]: lines.append(f"{k:<8} {st['mean']:6.2f} p95 {st['p95']:6.2f} max {st['max']:6.2f} ms")
+        if s["gauges"]: lines.append("verts " + "  ".join(f"{k} {v}" for k, v in s["gauges"].items()))
+        if s["errors"]: lines.append("err " + "  ".join(f"{k}×{v}" for k, v in s["errors"].items()))
+        return "\n".join(lines)
+
+    # ---- ekspor: JSON Lines (.jsonl/.json) atau CSV (.csv), satu baris tiap export_every detik ----
+    @staticmethod
+    def flatten(snap):                                   # snapshot → dict satu level (kolom CSV)
+        row = {"wall": round(snap["wall"], 3)}
+        for k in ("mean", "p95", "max"): row[f"frame_{k}_ms"] = round(snap["frame"][k], 4)
+        for name, st in snap["stages"].items():
+            for k in ("mean", "p95", "max"): row[f"{name}_{k}_ms"] = round(st[k], 4)
+        for k, v in snap["rates"].items(): row[f"{k}_per_s"] = round(v, 2)
+        for k, v in snap["counters"].items(): row[k] = v
+        row.update(snap["gauges"]); row["errors"] = sum(snap["errors"].values())
+        return row
+
+    def start_export(self, path):
+        self.stop_export()
+        self._export = open(path, "w", newline=""); self._export_path = path
+        self._writer = None; self._next_export = 0.0     # baris pertama ditulis pada poll() berikutnya
+        return path
+
+    def stop_export(self):
+        if self._export is not None:
+            self._export.close(); self._export = None; self._writer = None
+
+    @property
+    def exporting(self): return self._export is not None
+
+    def poll(self, now=None):                            # tulis baris ekspor bila sudah waktunya (panggil dari loop UI)
+        if self._export is None: return
+        now = time.perf_counter() if now is None else now
+        if now < self._next_export: return
+        self._next_export = now + self.export_every
+        snap = self.snapshot()
+        if self._export_path.endswith(".csv"):
+            row = self.flatten(snap)
+            if self._writer is None:                      # kolom ditetapkan oleh baris pertama; kolom baru setelahnya diabaikan
+                self._writer = csv.DictWriter(self._export, fieldnames=list(row), extrasaction="ignore"); self._writer.writeheader()
+            self._writer.writerow(row)
+        else:
+            self._export.write(json.dumps(snap) + "\n")
+        self._export.flush()
@@ -0,0 +1,157 @@
+# recording.py — format trajektori biner append-only (header JSON + record float64) dan replay memory-mapped
+import bisect, json, mmap, os, struct, time              # modul standar: pencarian biner, header, memory-map, path
+from array import array                                   # buffer chunk untuk writer
+try:
+    import numpy as np                                    # opsional: view (n, fields) tanpa salinan
+except ImportError:
+    np = None
+from physics import chain_positions                      # posisi bob rantai dari state (replay + interpolasi)
+
+MAGIC = b"DPTRAJ01"                                       # penanda file + versi format
+_PREFIX = struct.Struct("<8sI")                           # magic + panjang header JSON (dipadding agar record sejajar 8 byte)
+
+def chain_fields(links):                                  # isi satu record rantai N link (float64 little-endian): t, (θi, ωi)…, (xi, yi)…
+    return ("t",) + sum(((f"theta{i}", f"omega{i}") for i in range(1, links + 1)), ()) + sum(((f"x{i}", f"y{i}") for i in range(1, links + 1)), ())
+
+FIELDS = chain_fields(2)                                  # ("t", "theta1", "omega1", "theta2", "omega2", "x1", "y1", "x2", "y2")
+
+class TrajectoryWriter:                                   # writer streaming: record dikumpulkan per chunk lalu di-append ke file
+    def __init__(self, path, pendulum, chunk=4096):
+        self.path = path; self.chunk = chunk              # path file dan jumlah record per chunk tulis
+        ms, ls = list(pendulum.masses), list(pendulum.lengths)
+        self.width = 1 + 4 * len(ms)                      # float per record
+        header = {"fields": list(chain_fields(len(ms))), "m1": ms[0], "m2": ms[1], "l1": ls[0], "l2": ls[1],  # m1..l2: pembaca format lama
+                  "masses": ms, "lengths": ls, "g": pendulum.g, "dt": pendulum.dt, "base_dt": pendulum.base_dt,
+                  "integrator": getattr(pendulum, "integrator", "rk4"), "created": time.time()}
+        raw = json.dumps(header).encode()
+        raw += b" " * (-(_PREFIX.size + len(raw)) % 8)    # padding: awal record sejajar 8 byte (view float64 langsung)
+        self._f = open(path, "wb")
+        self._f.write(_PREFIX.pack(MAGIC, len(raw)) + raw)
+        self._buf = array("d"); self.count = 0            # buffer chunk aktif dan jumlah record tertulis
+
+    def record(self, pendulum):                           # tambahkan state pendulum saat ini sebagai satu record (dipanggil dari loop update)
+        buf = self._buf
+        buf.append(pendulum.time); buf.extend(pendulum.state)
+        for x, y in pendulum.get_positions()[1:]: buf.append(x); buf.append(y)
+        self.count += 1
+        if len(buf) >= self.chunk * self.width: self.flush()  # chunk penuh: tulis ke disk
+
+    def flush(self):                                      # tulis chunk yang tertunda
+        if self._buf:
+            self._buf.tofile(self._f); self._buf = array("d")
+        self._f.flush()
+
+    def close(self):                                      # flush dan tutup file
+        if not self._f.closed:
+            self.flush(); self._f.close()
+
+class TrajectoryReader:                                   # reader memory-mapped: akses acak zero-copy tanpa memuat file ke RAM
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as f:
+            magic, hlen = _PREFIX.unpack(f.read(_PREFIX.size))
+            if magic != MAGIC: raise ValueError(f"{path}: bukan file trajektori ({magic!r})")
+            self.header = json.loads(f.read(hlen))
+            offset = _PREFIX.size + hlen; width = len(self.header["fields"])
+            size = os.fstat(f.fileno()).st_size
+            self.width = width
+            self.count = (size - offset) // (8 * width)   # record parsial di ujung (mis. crash saat menulis) diabaikan
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if self.count else None
+        self._mv = memoryview(self._mm)[offset:offset + self.count * 8 * width].cast("d") if self.count else memoryview(array("d"))
+
+    def __len__(self):
+        return self.count
+
+    def field(self, name):                                # indeks kolom dari nama field
+        return self.header["fields"].index(name)
+
+    def column(self, j, start=0, stop=None):              # memoryview ber-stride untuk kolom j, record [start, stop) — zero-copy
+        a, b, _ = slice(start, stop).indices(self.count)
+        return self._mv[a * self.width:max(a, b) * self.width][j::self.width]
+
+    def __getitem__(self, i):                             # satu record sebagai tuple
+        if i < 0: i += self.count
+        return tuple(self._mv[i * self.width:(i + 1) * self.width])
+
+    def as_array(self):                                   # view numpy (n, width) tanpa salinan; butuh numpy
+        return np.frombuffer(self._mv, dtype=np.float64).reshape(-1, self.width)
+
+    def index_at(self, t):                                # indeks record terakhir dengan waktu <= t (pencarian biner)
+        return max(0, bisect.bisect_right(self.column(0), t) - 1)
+
+    def close(self):
+        self._mv.release()
+        if self._mm is not None: self._mm.close()
+
+class _RecordView:                                        # antarmuka mirip RingBuffer atas record [floor, cursor] dari reader (untuk canvas)
+    def __init__(self, replay, fields):
+        self._r = replay; self._fields = fields           # replay pemilik cursor dan indeks kolom yang diekspos
+
+    def __len__(self):
+        return self._r.cursor + 1 - self._r.floor
+
+    generation = property(lambda self: self._r.generation)  # naik saat seek mundur / clear (konsumen inkremental reset)
+    total = property(lambda self: self._r.cursor + 1)       # nomor sampel berikutnya (monoton selama playback maju)
+
+    def column(self, j, start=0, stop=None):
+        a, b, _ = slice(start, stop).indices(len(self))
+        f = self._r.floor
+        return self._r.reader.column(self._fields[j], f + a, f + max(a, b))
+
+    def bisect(self, value, j=0, right=False):
+        return (bisect.bisect_right if right else bisect.bisect_left)(self.column(j), value)
+
+    def __getitem__(self, i):
+        n = len(self)
+        if i < 0: i += n
+        rec = self._r.reader[self._r.floor + i]
+        return tuple(rec[k] for k in self._fields)
+
+class ReplayPendulum:                                     # pengganti DoublePendulum / ChainPendulum untuk playback rekaman di canvas & PhysicsWorker
+    def __init__(self, reader):
+        self.reader = reader; h = reader.header
+        self.m1, self.m2, self.l1, self.l2, self.g = h["m1"], h["m2"], h["l1"], h["l2"], h["g"]
+        self.masses = h.get("masses", [self.m1, self.m2]); self.lengths = h.get("lengths", [self.l1, self.l2])  # rekaman lama: double pendulum
+        self.links = n = len(self.masses)
+        self.base_dt = self.dt = h.get("base_dt", h["dt"]); self.integrator = h.get("integrator", "rk4")
+        self.energy_monitor = None; self.recorder = None
+        self.cursor = 0; self.floor = 0; self.generation = 0  # record saat ini, awal history yang terlihat, generasi reset
+        self.history = _RecordView(self, (reader.field("t"), reader.field("theta1"), reader.field("theta2")))
+        self.trail = _RecordView(self, (reader.field(f"x{n}"), reader.field(f"y{n}")))  # bob terakhir
+
+    @property
+    def state(self):                                      # (θ1, ω1, …, θN, ωN) dari record saat ini (salinan baru)
+        r = self.reader[self.cursor]; return list(r[1:1 + 2 * self.links])
+
+    @state.setter
+    def state(self, value):                               # rekaman read-only: penugasan state diabaikan
+        pass
+
+    @property
+    def time(self):
+        return self.reader[self.cursor][0]
+
+    @time.setter
+    def time(self, t):                                    # set waktu = seek
+        self.seek(t)
+
+    def seek(self, t):                                    # lompat ke record terakhir dengan waktu <= t
+        i = self.reader.index_at(t)
+        if i < self.cursor: self.generation += 1; self.floor = min(self.floor, i)  # mundur: konsumen inkremental harus reset
+        self.cursor = i
+
+    def step(self):                                       # majukan satu record (berhenti di akhir rekaman)
+        if self.cursor + 1 < len(self.reader): self.cursor += 1
+
+    update = step                                         # PhysicsWorker memanggil update() dengan pacing yang sama seperti live
+
+    def reset_buffers(self, t0=None):                     # restart playback dari awal
+        self.seek(0.0 if t0 is None else t0); self.floor = self.cursor; self.generation += 1
+
+    def clear_history(self):                              # clear graph: tampilkan hanya record setelah posisi sekarang
+        self.floor = self.cursor; self.generation += 1
+
+    def get_positions(self, state=None):                  # posisi dari state (interpolasi) atau langsung dari record
+        if state is not None: return chain_positions(self.lengths, state)
+        r = self.reader[self.cursor]; a = 1 + 2 * self.links  # kolom x1 (setelah t dan pasangan θ/ω)
+        return [(0.0, 0.0)] + [(r[a + 2 * i], r[a + 2 * i + 1]) for i in range(self.links)]
@@ -0,0 +1,106 @@
+# sweep.py — peta chaos (flip-time & eksponen Lyapunov terbesar) di grid (θ1, θ2), paralel di semua core, output memmap yang bisa dilanjutkan
+import argparse, json, math, os, sys, time               # modul standar: CLI, metadata, path, waktu
+from concurrent.futures import ProcessPoolExecutor, as_completed  # pool proses untuk shard kerja
+import numpy as np                                        # wajib untuk sweep (batch vektor + memmap)
+from physics import BatchPendulum, rk4_step_batch         # integrator batch (RK4 vektor)
+
+def chaos_metrics(theta1, theta2, horizon, dt=0.005, params=None, lyapunov=True, d0=1e-8, renorm_every=20):  # metrik untuk satu batch sel
+    n = len(theta1); params = params or {}
+    if lyapunov:                                          # pendulum dasar + kembarannya (terganggu d0 pada θ1) dalam satu batch 2N
+        b = BatchPendulum(np.concatenate([theta1, theta1 + d0]), np.concatenate([theta2, theta2]), **params)
+    else:
+        b = BatchPendulum(theta1, theta2, **params)
+    flip = np.full(n, np.nan)                             # waktu flip pertama (|θ1| atau |θ2| melewati π), NaN bila tidak flip
+    log_sum = np.zeros(n)                                 # akumulasi log(d/d0) untuk Benettin
+    steps = int(round(horizon / dt)); y = b.state; t = 0.0
+    for k in range(1, steps + 1):
+        y = rk4_step_batch(b, y, dt); t = k * dt          # satu langkah RK4 vektor untuk seluruh chunk
+        flipped = (np.abs(y[0, :n]) > math.pi) | (np.abs(y[2, :n]) > math.pi)
+        new = flipped & np.isnan(flip)
+        if new.any(): flip[new] = t
+        if lyapunov and (k % renorm_every == 0 or k == steps):  # renormalisasi jarak kembaran (Benettin)
+            diff = y[:, n:] - y[:, :n]
+            d = np.sqrt((diff * diff).sum(axis=0)); d = np.where(d > 0, d, d0)
+            log_sum += np.log(d / d0)
+            y[:, n:] = y[:, :n] + diff * (d0 / d)
+    lyap = log_sum / max(steps * dt, 1e-12) if lyapunov else None  # rata-rata laju divergensi eksponensial
+    return flip, lyap
+
+def _grid(meta, lo, hi):                                  # sudut (θ1, θ2) untuk sel datar [lo, hi) — indeks sel = i2 * n1 + i1
+    (a1, b1, n1), (a2, b2, n2) = meta["theta1"], meta["theta2"]
+    idx = np.arange(lo, hi)
+    return np.linspace(a1, b1, n1)[idx % n1], np.linspace(a2, b2, n2)[idx // n1]
+
+def _run_chunk(out_dir, meta, chunk):                     # dijalankan di proses worker: hitung satu chunk dan tulis langsung ke memmap
+    lo = chunk * meta["chunk"]; hi = min(lo + meta["chunk"], meta["theta1"][2] * meta["theta2"][2])
+    th1, th2 = _grid(meta, lo, hi)
+    flip, lyap = chaos_metrics(th1, th2, meta["horizon"], meta["dt"], meta["params"], meta["lyapunov"])
+    maps = {"flip_time": flip, "lyapunov": lyap}
+    for name, vals in maps.items():
+        if vals is None: continue
+        mm = np.load(os.path.join(out_dir, name + ".npy"), mmap_mode="r+")  # buka memmap output (region chunk disjoint antar proses)
+        mm.reshape(-1)[lo:hi] = vals; mm.flush(); del mm
+    return chunk
+
+def _open_outputs(out_dir, meta):                         # buat (atau validasi untuk resume) file output memmap
+    os.makedirs(out_dir, exist_ok=True)
+    meta_path = os.path.join(out_dir, "meta.json")
+    shape = (meta["theta2"][2], meta["theta1"][2]); n_chunks = -(-shape[0] * shape[1] // meta["chunk"])
+    if os.path.exists(meta_path):                         # resume: konfigurasi harus identik
+        with open(meta_path) as f: old = json.load(f)
+        if old != json.loads(json.dumps(meta)): raise ValueError(f"konfigurasi sweep berbeda dengan {meta_path}; gunakan direktori output lain")
+    else:
+        names = ["flip_time"] + (["lyapunov"] if meta["lyapunov"] else [])
+        for name in names:
+            mm = np.lib.format.open_memmap(os.path.join(out_dir, name + ".npy"), mode="w+", dtype=np.float32, shape=shape)
+            mm[:] = np.nan; mm.flush(); del mm
+        np.lib.format.open_memmap(os.path.join(out_dir, "done.npy"), mode="w+", dtype=np.uint8, shape=(n_chunks,)).flush()
+        with open(meta_path, "w") as f: json.dump(meta, f, indent=2)  # metadata ditulis terakhir: direktori valid hanya bila lengkap
+    return np.load(os.path.join(out_dir, "done.npy"), mmap_mode="r+")
+
+def run_sweep(out_dir, theta1=(-math.pi, math.pi, 256), theta2=(-math.pi, math.pi, 256), horizon=20.0, dt=0.005,
+              params=None, lyapunov=True, chunk=4096, workers=None, progress=None):  # jalankan (atau lanjutkan) sweep ke out_dir
+    meta = {"theta1": list(theta1), "theta2": list(theta2), "horizon": horizon, "dt": dt,
+            "params": dict(params or {}), "lyapunov": bool(lyapunov), "chunk": int(chunk)}
+    done = _open_outputs(out_dir, meta)
+    pending = [int(c) for c in np.flatnonzero(done == 0)]  # chunk yang belum selesai (resume setelah interupsi)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(_run_chunk, out_dir, meta, c) for c in pending]
+        for i, fut in enumerate(as_completed(futures), 1):
+            c = fut.result(); done[c] = 1; done.flush()  # tandai selesai hanya setelah data chunk ter-flush
+            if progress: progress(i, len(pending))
+    return out_dir
+
+def load_sweep(out_dir):                                  # baca hasil sweep sebagai memmap read-only (tanpa memuat ke RAM)
+    with open(os.path.join(out_dir, "meta.json")) as f: meta = json.load(f)
+    maps = {name: np.load(os.path.join(out_dir, name + ".npy"), mmap_mode="r")
+            for name in ("flip_time", "lyapunov") if os.path.exists(os.path.join(out_dir, name + ".npy"))}
+    return meta, maps
+
+def build_parser():                                       # definisi argumen command-line
+    ap = argparse.ArgumentParser(description="Parallel flip-time / Lyapunov map over a (theta1, theta2) grid.")
+    ap.add_argument("out", help="direktori output (dibuat bila belum ada; jalankan ulang untuk melanjutkan)")
+    ap.add_argument("--theta1", type=float, nargs=3, metavar=("MIN", "MAX", "N"), default=[-math.pi, math.pi, 256])
+    ap.add_argument("--theta2", type=float, nargs=3, metavar=("MIN", "MAX", "N"), default=[-math.pi, math.pi, 256])
+    ap.add_argument("--horizon", type=float, default=20.0, help="durasi simulasi per sel (s)")
+    ap.add_argument("--dt", type=float, default=0.005)
+    ap.add_argument("--m1", type=float, default=1.0); ap.add_argument("--m2", type=float, default=1.0)  # massa
+    ap.add_argument("--l1", type=float, default=1.0); ap.add_argument("--l2", type=float, default=1.0)  # panjang tali
+    ap.add_argument("--g", type=float, default=9.81)     # gravitasi
+    ap.add_argument("--no-lyapunov", action="store_true", help="hanya flip-time (setengah biaya)")
+    ap.add_argument("--chunk", type=int, default=4096, help="jumlah sel per batch vektor")
+    ap.add_argument("--workers", type=int, default=None, help="jumlah proses (default: semua core)")
+    return ap
+
+def main(argv=None):                                      # entry point CLI: python sweep.py maps/run1 --theta1 -3.14 3.14 2048 ...
+    args = build_parser().parse_args(argv)
+    th1 = (args.theta1[0], args.theta1[1], int(args.theta1[2])); th2 = (args.theta2[0], args.theta2[1], int(args.theta2[2]))
+    params = {"m1": args.m1, "m2": args.m2, "l1": args.l1, "l2": args.l2, "g": args.g}
+    t0 = time.perf_counter()
+    def progress(i, n): print(f"\r{i}/{n} chunks", end="", file=sys.stderr, flush=True)
+    run_sweep(args.out, th1, th2, args.horizon, args.dt, params, not args.no_lyapunov, args.chunk, args.workers, progress)
+    print(f"\ndone in {time.perf_counter() - t0:.1f}s → {args.out}", file=sys.stderr)
+    return 0
+
+if __name__ == '__main__':                                 # jalankan sebagai script
+    sys.exit(main())
@@ -0,0 +1,39 @@
+# test_DoublePendulum.py — batas input layar setup (butuh Kivy dengan window provider; dilewati bila tidak ada)
+import os
+import pytest
+os.environ.setdefault("KIVY_NO_ARGS", "1")                # argumen pytest jangan diparse oleh Kivy
+pytest.importorskip("kivy")
+pytest.importorskip("numpy")                              # mode ensemble butuh numpy
+try:
+    import DoublePendulum as D                           # membuka Window saat import
+except Exception as e:                                    # tanpa window provider (mis. server tanpa display)
+    pytest.skip(f"Kivy window tidak tersedia: {e}", allow_module_level=True)
+from kivy.app import App
+
+@pytest.fixture
+def app():                                                # app lengkap tanpa main loop; thread fisika dihentikan di akhir
+    a = D.DoublePendulumApp(); App._running_app = a
+    a.root = a.build(); a.on_start()
+    yield a
+    a.on_stop(); App._running_app = None
+
+def _start(app, **fields):                                # isi TextInput layar setup lalu tekan Start Simulation
+    for name, text in fields.items(): app.setup.inputs[name][0].text = text
+    app.setup.start_simulation(None)
+
+def test_ensemble_n_clamped(app):                         # Ensemble N di atas batas slider dipotong; rod Mesh tetap muat indeks unsigned short
+    app.setup.inputs["Ensemble N"][0].text = "40000"      # slider → maksimum (sinkronisasi menulis ulang teks menjadi "2000")
+    _start(app, **{"Ensemble N": "40000"})                # slider sudah di maksimum → teks 40000 tetap di TextInput
+    assert app.setup.inputs["Ensemble N"][0].text == "40000"
+    assert len(app.ensemble) == D.SetupScreen.MAX_ENSEMBLE
+    assert 2 * D.SetupScreen.MAX_ENSEMBLE < 65536
+    canvas = app.sim.pendulum_canvas
+    canvas._draw_ensemble(app.ensemble, app.ensemble.state, 100.0, 100.0, 50.0)  # dulu: OverflowError untuk N > 32767
+    assert app.profiler.errors == {}
+
+def test_links_n_clamped(app):                           # Links N di atas batas slider dipotong ke rentang yang didokumentasikan (2–64)
+    app.setup.inputs["Links N"][0].text = "1000"
+    _start(app, **{"Links N": "1000"})                    # teks kedua tidak lagi diubah oleh slider (sudah di maksimum)
+    assert app.pendulum.links == D.SetupScreen.MAX_LINKS == 64
+    _start(app, **{"Links N": "0"})
+    assert app.pendulum.links == 2 and isinstance(app.pendulum, D.DoublePendulum)
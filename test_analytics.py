@@ -0,0 +1,53 @@
+# test_analytics.py — spektrum sliding DFT dan irisan Poincaré (jalankan: python -m pytest -q)
+import math
+import pytest
+from analytics import Poincare, Spectrum
+
+def _feed(spec, f1, f2, t_end, dt=0.005):                 # sinusoid murni θ1 = sin(2π f1 t), θ2 = 0.5 cos(2π f2 t) dalam langkah dt
+    y = lambda t: (math.sin(2 * math.pi * f1 * t), 0.0, 0.5 * math.cos(2 * math.pi * f2 * t), 0.0)
+    spec.rebase(0.0); t0 = 0.0
+    for k in range(1, int(round(t_end / dt)) + 1):
+        t1 = k * dt; spec.add(t0, y(t0), t1, y(t1)); t0 = t1
+
+def test_spectrum_dominant_frequency():                   # puncak di frekuensi sinusoid (tepat di bin dan di antara dua bin)
+    pytest.importorskip("numpy")
+    spec = Spectrum(size=256, sample_dt=0.05); df = spec.freqs[1]  # resolusi 0.078125 Hz
+    _feed(spec, 1.25, 0.9, 40.0)                          # 801 sampel: 3 resinkron FFT lalu 33 update sliding
+    assert spec.ready and spec.pos != 0
+    p1, p2 = spec.peaks()
+    assert p1 == pytest.approx(1.25) and abs(p2 - 0.9) <= df / 2
+
+def test_spectrum_matches_direct_hann_fft():              # sliding DFT + Hann di domain frekuensi == FFT langsung dari jendela terurut × Hann
+    np = pytest.importorskip("numpy")
+    spec = Spectrum(size=128, sample_dt=0.05)
+    _feed(spec, 0.7, 2.3, 23.0)                           # berhenti di tengah jendela (pos != 0) → X dari update sliding, bukan resinkron
+    assert spec.pos != 0
+    seq = np.roll(spec.window, -spec.pos, axis=1)          # tertua → terbaru
+    hann = 0.5 - 0.5 * np.cos(2 * np.pi * np.arange(spec.size) / spec.size)  # Hann periodik
+    H = np.fft.rfft(hann * (seq - seq.mean(axis=1, keepdims=True)), axis=1)
+    freqs, P = spec.power()
+    np.testing.assert_allclose(P, np.abs(H) ** 2 * (2.0 * spec.sample_dt / (0.375 * spec.size)), rtol=1e-9, atol=1e-12)
+    np.testing.assert_allclose(freqs, np.fft.rfftfreq(spec.size, spec.sample_dt))
+
+def test_poincare_only_upward_zero_crossings():           # hanya θ1 melewati 0 (mod 2π) dengan ω1 > 0; (t, θ2, ω2) diinterpolasi ke irisan
+    pc = Poincare()
+    pc.add(1.0, (-0.1, 2.0, 0.4, 1.0), 1.1, (0.3, 2.0, 0.8, 3.0))  # naik melewati 0: irisan di f = 0.25
+    pc.add(2.0, (0.1, -2.0, 0.0, 0.0), 2.1, (-0.1, -2.0, 0.0, 0.0))  # turun melewati 0 (ω1 < 0): diabaikan
+    pc.add(3.0, (3.1, 2.0, 0.0, 0.0), 3.1, (3.2, 2.0, 0.0, 0.0))     # melewati π, bukan 0: diabaikan
+    pc.add(4.0, (0.1, 2.0, 0.0, 0.0), 4.1, (0.2, 2.0, 0.0, 0.0))     # tidak melewati 0: diabaikan
+    pc.add(5.0, (6.2, 1.0, 3.0, 0.0), 5.1, (6.4, 1.0, 3.4, 0.0))     # melewati 2π: θ2 ter-wrap ke [-π, π)
+    pc.add(6.0, (-0.2, -1.0, 0.0, 0.0), 6.1, (0.2, 0.5, 0.0, 0.0))   # θ1 naik tetapi ω1 di irisan < 0: diabaikan
+    assert pc.count == 2 and len(pc.points) == 2
+    (t, th2, w2), (t5, th25, _) = list(pc.points)
+    assert (t, th2, w2) == pytest.approx((1.025, 0.5, 1.5))
+    f = (2 * math.pi - 6.2) / 0.2
+    assert t5 == pytest.approx(5.0 + 0.1 * f) and th25 == pytest.approx(3.0 + 0.4 * f - 2 * math.pi)
+
+def test_poincare_once_per_period():                      # osilasi kecil θ1 = A sin(2πt): satu crossing naik per periode, di t ≈ k (sampel tepat di θ1 ≈ −1e−16)
+    pc = Poincare(); dt = 0.01; A = 0.3
+    y = lambda t: (A * math.sin(2 * math.pi * t), 2 * math.pi * A * math.cos(2 * math.pi * t), 0.1 * t, 1.0)
+    t0 = 0.05
+    for k in range(1, 501):
+        t1 = 0.05 + k * dt; pc.add(t0, y(t0), t1, y(t1)); t0 = t1
+    assert pc.count == 5 and [round(p[0], 3) for p in pc.points] == [1.0, 2.0, 3.0, 4.0, 5.0]
+    assert all(p[1] == pytest.approx(0.1 * p[0], abs=1e-12) for p in pc.points)  # θ2 = 0.1 t diinterpolasi linear ke waktu irisan
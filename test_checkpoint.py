@@ -0,0 +1,30 @@
+# test_checkpoint.py — seek deterministik dan batas memori checkpoint (jalankan: python -m pytest -q)
+from physics import DoublePendulum
+from checkpoint import Checkpointer
+
+def _run(steps, every, **kw):                             # run live dengan checkpointer; → (pendulum, {waktu: (state, sampel history terakhir)})
+    p = DoublePendulum(kernel='closure'); p.state = [1.0, 0.0, 2.0, 0.0]
+    p.checkpointer = Checkpointer(**kw); p.reset_buffers(0.0)
+    ref = {}
+    for i in range(1, steps + 1):
+        p.update()
+        if i % every == 0: ref[i] = (list(p.state), p.time, p.history[-50:], p.trail[-50:])
+    return p, ref
+
+def test_seek_back_and_forth_reproducible():              # seek maju/mundur berulang → state, waktu dan ekor buffer bit-identik dengan run live
+    p, ref = _run(6000, 500, interval=2.0, tail=200)
+    for i in (1500, 500, 6000, 2500, 5500, 1000, 1500, 6000):
+        p.seek(i * p.dt)
+        assert (list(p.state), p.time, p.history[-50:], p.trail[-50:]) == ref[i]
+    p.seek(3000 * p.dt)                                   # lanjut live setelah seek sama dengan run yang tidak pernah di-seek
+    for _ in range(500): p.update()
+    assert (list(p.state), p.time) == ref[3500][:2]
+
+def test_checkpoint_memory_bounded():                     # run panjang: jumlah checkpoint dan ekor yang disimpan tetap terbatas, seek tetap tepat
+    p, ref = _run(20000, 4000, interval=0.5, tail=100, keep_tails=3, max_count=16)
+    cp = p.checkpointer
+    assert len(cp) <= 16 and cp.times == sorted(cp.times) and cp.times[0] == 0.0
+    assert sum(len(c.history) > 0 for c in cp.checkpoints) <= 3
+    for i in (4000, 20000, 8000):
+        p.seek(i * p.dt)
+        assert (list(p.state), p.time) == ref[i][:2]
@@ -0,0 +1,90 @@
+# test_physics.py — cek cepat model fisika (jalankan: python -m pytest -q)
+import pytest
+from physics import (RingBuffer, ChainPendulum, DoublePendulum, BatchPendulum, DormandPrince, derivatives, chain_derivatives, chain_energy, energy,
+                     rk4_step, rk4_step_batch, make_rk4_kernel)
+
+Y0 = [1.2, 0.3, -0.7, 0.1]                                 # state awal uji (θ1, ω1, θ2, ω2)
+
+def _mirror_ok(buf):                                      # invariant mirror: slot i di paruh pertama == slot i di paruh kedua
+    half = buf._slots * buf.width
+    return buf._data[:half] == buf._data[half:]
+
+def test_ringbuffer_wraparound():                         # setelah penuh, sampel tertua ditimpa dan urutan tetap tertua → terbaru
+    buf = RingBuffer(5, 2)
+    for i in range(13): buf.append(float(i), -float(i))
+    assert len(buf) == 5 and buf.total == 13
+    assert list(buf) == [(float(i), -float(i)) for i in range(8, 13)]
+    assert buf[0] == (8.0, -8.0) and buf[-1] == (12.0, -12.0) and buf[1:3] == [(9.0, -9.0), (10.0, -10.0)]
+    assert buf.column(0).tolist() == [8.0, 9.0, 10.0, 11.0, 12.0]  # jendela kontigu meski melewati akhir array
+    assert buf.bisect(10.0) == 2 and buf.bisect(10.0, right=True) == 3
+
+def test_ringbuffer_mirror_invariant():                   # tiap append menjaga mirror, di setiap posisi _start (termasuk setelah clear)
+    buf = RingBuffer(4, 3)
+    for i in range(23):
+        buf.append(i, i + 0.5, -i)
+        assert _mirror_ok(buf)
+        assert buf.view().tolist() == [v for s in buf[:] for v in s]  # view zero-copy == salinan sampel
+    gen = buf.generation; buf.clear()
+    assert len(buf) == 0 and buf.total == 0 and buf.generation == gen + 1
+    buf.append(1, 2, 3)
+    assert list(buf) == [(1.0, 2.0, 3.0)] and _mirror_ok(buf)
+
+def test_batch_matches_rk4_step():                       # batch vektor bit-identik dengan rk4_step, per pendulum dengan parameter berbeda
+    pytest.importorskip("numpy")
+    ps = [DoublePendulum(1.0, 1.0, 1.0, 1.0), DoublePendulum(1.3, 0.7, 1.1, 0.6, 9.0)]
+    b = BatchPendulum([Y0[0], Y0[0] + 0.1], Y0[2], Y0[1], Y0[3], m1=[p.m1 for p in ps], m2=[p.m2 for p in ps], l1=[p.l1 for p in ps], l2=[p.l2 for p in ps], g=[p.g for p in ps])
+    ys = [list(Y0), [Y0[0] + 0.1] + Y0[1:]]
+    for _ in range(2000):
+        b.state = rk4_step_batch(b, b.state, 0.005)
+        ys = [rk4_step(p, y, 0.005) for p, y in zip(ps, ys)]
+    assert [b.state[:, i].tolist() for i in range(2)] == ys
+
+def test_closure_kernel_matches_rk4_step():              # kernel fused (closure) bit-identik dengan rk4_step generik
+    p = DoublePendulum(1.3, 0.7, 1.1, 0.6, 9.0, kernel='generic'); q = DoublePendulum(1.3, 0.7, 1.1, 0.6, 9.0, kernel='closure')
+    assert q.kernel == 'closure'
+    k = make_rk4_kernel(p.m1, p.m2, p.l1, p.l2, p.g); y = list(Y0)
+    p.state = list(Y0); q.state = list(Y0)
+    for _ in range(2000):
+        p.step(); q.step(); y = list(k(*y, 0.005))
+    assert q.state == p.state and y == p.state
+
+def test_chain_n2_matches_closed_form():                 # rantai N = 2 (solver tegangan O(N)) sama dengan rumus closed-form double pendulum
+    c = ChainPendulum(masses=(1.3, 0.7), lengths=(1.1, 0.6), g=9.0); d = DoublePendulum(1.3, 0.7, 1.1, 0.6, 9.0)
+    for y in (Y0, [0.0, 0.0, 0.0, 0.0], [3.0, -4.0, -2.5, 6.0], [0.4, 1.0, 0.4, -1.0]):  # termasuk θ1 = θ2 (cos Δ = 1)
+        assert chain_derivatives(c, y) == pytest.approx(derivatives(d, y), rel=1e-12, abs=1e-12)
+        assert chain_energy(c, y) == pytest.approx(energy(d, y), rel=1e-12, abs=1e-12)
+    y = z = list(Y0)
+    for _ in range(1000): y = rk4_step(c, y, 0.005, chain_derivatives); z = rk4_step(d, z, 0.005)
+    assert y == pytest.approx(z, rel=1e-9, abs=1e-9)
+    assert [v for pt in c.get_positions(Y0) for v in pt] == pytest.approx([v for pt in d.get_positions(Y0) for v in pt])
+
+def _rk4_reference(p, y, t, dt=1e-4):                    # solusi acuan: RK4 langkah sangat kecil
+    for _ in range(int(round(t / dt))): y = rk4_step(p, y, dt)
+    return y
+
+def test_dormand_prince_matches_fine_rk4():              # advance_to(t) dalam toleransi terhadap RK4 halus; toleransi lebih ketat → lebih dekat
+    p = DoublePendulum(); y0 = [1.0, 0.0, 2.0, 0.0]
+    ref = _rk4_reference(p, y0, 5.0)
+    err = lambda y: max(abs(a - b) for a, b in zip(y, ref))
+    assert err(DormandPrince(p, 0.0, y0).advance_to(5.0)) < 1e-4
+    assert err(DormandPrince(p, 0.0, y0, rtol=1e-10, atol=1e-12).advance_to(5.0)) < 1e-7
+
+def test_dormand_prince_dense_endpoints():               # dense() tepat di ujung langkah terakhir = y0 / y1 persis; di luar langkah ditolak
+    dp = DormandPrince(DoublePendulum(), 0.0, Y0)
+    assert dp.dense(0.0) == Y0                            # sebelum langkah pertama: interval kosong [0, 0]
+    dp.advance_to(0.3)
+    assert dp.t0 < 0.3 <= dp.t1
+    assert dp.dense(dp.t0) == dp.y0 and dp.dense(dp.t1) == dp.y1
+    mid = dp.dense(0.5 * (dp.t0 + dp.t1))
+    assert mid == pytest.approx(_rk4_reference(DoublePendulum(), dp.y0, 0.5 * (dp.t1 - dp.t0), (dp.t1 - dp.t0) / 200), abs=1e-5)  # interpolan orde 4 di tengah langkah
+    with pytest.raises(ValueError): dp.dense(dp.t1 + 1e-3)
+
+def test_integrator_stats_counts_steps():                # statistik rk45 dari model: langkah diterima & ditolak, nfev konsisten (FSAL: 6 evaluasi per percobaan)
+    p = DoublePendulum(); p.state = [1.0, 0.0, 2.0, 0.0]; p.reset_buffers(0.0)
+    assert p.integrator_stats() == {}                     # rk4 langkah tetap: tidak ada statistik
+    p.set_integrator('rk45')
+    n0 = p.integrator_stats()['nfev']
+    for _ in range(1000): p.update()
+    s = p.integrator_stats()
+    assert s['accepted'] > 0 and s['rejected'] > 0
+    assert s['nfev'] - n0 == 6 * (s['accepted'] + s['rejected'])
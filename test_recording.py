@@ -0,0 +1,65 @@
+# test_recording.py — round-trip format .dptraj: writer → reader → replay (jalankan: python -m pytest -q)
+import json, time
+from array import array
+from physics import ChainPendulum, DoublePendulum
+from recording import FIELDS, MAGIC, _PREFIX, TrajectoryReader, TrajectoryWriter, ReplayPendulum, chain_fields
+
+def _record(p, path, steps, chunk=7):                     # run live sambil merekam; chunk kecil → beberapa flush di tengah run
+    p.reset_buffers(0.0); p.recorder = TrajectoryWriter(str(path), p, chunk=chunk)
+    expect = []
+    for _ in range(steps):
+        p.update()
+        expect.append((p.time, *p.state, *(v for xy in p.get_positions()[1:] for v in xy)))
+    p.recorder.close(); p.recorder = None
+    return expect
+
+def test_double_pendulum_round_trip(tmp_path):           # record bit-identik dengan state live; replay mengikuti rekaman
+    p = DoublePendulum(1.3, 0.7, 1.1, 0.6, 9.0); p.state = [1.0, 0.0, 2.0, 0.0]
+    expect = _record(p, tmp_path / "run.dptraj", 50)
+    r = TrajectoryReader(str(tmp_path / "run.dptraj"))
+    assert len(r) == 50 and r.width == 9 and tuple(r.header["fields"]) == FIELDS == chain_fields(2)
+    assert (r.header["m1"], r.header["l2"], r.header["masses"], r.header["lengths"]) == (1.3, 0.6, [1.3, 0.7], [1.1, 0.6])
+    assert [r[i] for i in range(len(r))] == expect and r[-1] == expect[-1]
+    assert r.column(r.field("theta2"), 10, 13).tolist() == [e[3] for e in expect[10:13]]
+    assert r.index_at(expect[20][0]) == 20 and r.index_at(-1.0) == 0
+    rp = ReplayPendulum(r)
+    assert rp.links == 2 and rp.masses == [1.3, 0.7] and rp.integrator == "rk4"
+    rp.seek(expect[30][0])
+    assert rp.time == expect[30][0] and rp.state == list(expect[30][1:5])
+    assert [c for xy in rp.get_positions()[1:] for c in xy] == list(expect[30][5:])
+    assert rp.history[-1] == (expect[30][0], expect[30][1], expect[30][3]) and rp.trail[-1] == expect[30][7:9]
+    gen = rp.generation; rp.seek(expect[5][0])             # seek mundur → generasi baru untuk konsumen inkremental
+    assert rp.cursor == 5 and rp.generation == gen + 1
+    for _ in range(100): rp.step()                        # berhenti di record terakhir
+    assert rp.cursor == 49
+    r.close()
+
+def test_chain_record_layout(tmp_path):                   # rantai N link: 1 + 4N float per record, urutan t, (θi, ωi)…, (xi, yi)…
+    c = ChainPendulum([1.0, 0.5, 0.8, 0.3], [1.0, 0.7, 0.5, 0.4]); c.state = [1.0, 0.1, 2.0, -0.2, 0.5, 0.0, -1.0, 0.3]
+    expect = _record(c, tmp_path / "chain.dptraj", 20)
+    r = TrajectoryReader(str(tmp_path / "chain.dptraj"))
+    assert r.width == 17 and r.header["fields"] == list(chain_fields(4))
+    assert r.header["fields"][:3] == ["t", "theta1", "omega1"] and r.header["fields"][9:] == ["x1", "y1", "x2", "y2", "x3", "y3", "x4", "y4"]
+    assert [r[i] for i in range(20)] == expect
+    rp = ReplayPendulum(r); rp.seek(expect[-1][0])
+    assert rp.links == 4 and rp.lengths == [1.0, 0.7, 0.5, 0.4] and rp.state == list(expect[-1][1:9])
+    assert rp.trail[-1] == expect[-1][15:17]               # trail = bob terakhir
+    assert rp.get_positions() == c.get_positions()
+    r.close()
+
+def test_reads_old_two_link_header(tmp_path):             # rekaman format lama: header tanpa masses/lengths/base_dt/integrator
+    header = {"fields": ["t", "theta1", "omega1", "theta2", "omega2", "x1", "y1", "x2", "y2"],
+              "m1": 1.0, "m2": 2.0, "l1": 1.5, "l2": 0.5, "g": 9.81, "dt": 0.01, "created": time.time()}
+    raw = json.dumps(header).encode(); raw += b" " * (-(_PREFIX.size + len(raw)) % 8)
+    recs = [(0.01 * i, 0.1 * i, 0.0, -0.1 * i, 0.0, 1.0, -1.0, 1.5, -0.5) for i in range(5)]
+    path = tmp_path / "old.dptraj"
+    with open(path, "wb") as f:
+        f.write(_PREFIX.pack(MAGIC, len(raw)) + raw); array("d", [v for rec in recs for v in rec]).tofile(f)
+        f.write(b"\0" * 12)                               # record parsial di ujung (crash saat menulis) diabaikan
+    r = TrajectoryReader(str(path))
+    assert len(r) == 5 and tuple(r.header["fields"]) == chain_fields(2)
+    rp = ReplayPendulum(r)
+    assert rp.links == 2 and rp.masses == [1.0, 2.0] and rp.lengths == [1.5, 0.5] and rp.dt == rp.base_dt == 0.01 and rp.integrator == "rk4"
+    rp.seek(0.03)
+    assert rp.state == list(recs[3][1:5]) and rp.get_positions() == [(0.0, 0.0), (1.0, -1.0), (1.5, -0.5)]
+    r.close()
@@ -0,0 +1,36 @@
+# test_sweep.py — resume dan validasi konfigurasi sweep (jalankan: python -m pytest -q)
+import os
+import pytest
+np = pytest.importorskip("numpy")                         # sweep wajib numpy
+from sweep import run_sweep, load_sweep
+
+CFG = dict(theta1=(-3.0, 3.0, 6), theta2=(-3.0, 3.0, 4), horizon=0.5, chunk=5, workers=2)  # 24 sel dalam 5 chunk (chunk terakhir tidak penuh)
+
+def test_sweep_resume(tmp_path):                          # chunk yang belum ditandai selesai dihitung ulang; hasil sama dengan run utuh
+    full = str(tmp_path / "full"); part = str(tmp_path / "part")
+    run_sweep(full, **CFG); run_sweep(part, **CFG)
+    _, ref = load_sweep(full)
+    done = np.load(os.path.join(part, "done.npy"), mmap_mode="r+")
+    assert done.tolist() == [1] * 5
+    for name in ("flip_time", "lyapunov"):                # simulasikan interupsi: chunk 1 dan 4 belum tertulis
+        mm = np.load(os.path.join(part, name + ".npy"), mmap_mode="r+")
+        mm.reshape(-1)[5:10] = np.nan; mm.reshape(-1)[20:] = np.nan; mm.flush(); del mm
+    done[1] = done[4] = 0; done.flush(); del done
+    calls = []
+    run_sweep(part, progress=lambda i, n: calls.append(n), **CFG)
+    assert calls == [2, 2]                                # hanya dua chunk yang dikerjakan ulang
+    meta, maps = load_sweep(part)
+    assert meta["theta1"] == [-3.0, 3.0, 6] and maps["lyapunov"].shape == (4, 6)
+    for name in ("flip_time", "lyapunov"):
+        np.testing.assert_array_equal(maps[name], ref[name])  # NaN (tidak flip) dianggap sama
+    assert not np.isnan(maps["lyapunov"]).any()
+
+def test_sweep_rejects_changed_config(tmp_path):          # resume ke direktori dengan konfigurasi lain harus ditolak, data lama utuh
+    out = str(tmp_path / "run")
+    run_sweep(out, **CFG)
+    before = np.array(load_sweep(out)[1]["lyapunov"])
+    with pytest.raises(ValueError, match="konfigurasi sweep berbeda"):
+        run_sweep(out, **dict(CFG, horizon=1.0))
+    with pytest.raises(ValueError):
+        run_sweep(out, params={"m2": 2.0}, **CFG)
+    np.testing.assert_array_equal(load_sweep(out)[1]["lyapunov"], before)
@@ -0,0 +1,88 @@
+# worker.py — thread fisika terpisah dari clock render 60 Hz; state dipublikasikan lewat snapshot immutable (tanpa lock di sisi pembaca), history/trail disalin UI di bawah `lock`
+import threading, time                                    # thread latar belakang dan jam monotonic
+from collections import namedtuple                        # snapshot immutable
+
+Snapshot = namedtuple("Snapshot", "time state prev_time prev_state wall ensemble prev_ensemble", defaults=(None, None))  # dua state terakhir + waktu wall-clock publikasi (+ array ensemble)
+
+class PhysicsWorker:                                      # menjalankan pendulum.update() pada laju tick tetap di thread sendiri
+    def __init__(self, pendulum, rate=60.0, max_catchup=5):
+        self.pendulum = pendulum                         # model yang dimajukan (ganti lewat set_pendulum)
+        self.period = 1.0 / rate                          # periode tick fisika (detik wall-clock)
+        self.max_catchup = max_catchup                    # tick tertinggal lebih dari ini dilewati (hindari spiral of death)
+        self.speed = 1.0                                  # multiplier kecepatan (dt = base_dt * speed)
+        self.running = False                              # False = jeda (thread tetap hidup, tidak melangkah)
+        self.lock = threading.RLock()                     # dipegang selama satu tick; UI memakainya saat mengubah model (reset/start) dan saat menyalin sampel baru history/trail
+        self.ticks = 0; self.dropped = 0; self.steps = 0  # statistik: tick dijalankan, tick dilewati, langkah fisika total
+        self.profiler = None                              # profiler.Profiler opsional: durasi tahap "physics", sim_steps, physics_dropped
+        self.ensemble = None                              # BatchPendulum opsional yang dimajukan bersama pendulum (mode ensemble)
+        self._snap = None; self._stop = threading.Event(); self._thread = None
+        self._publish(pendulum.time, pendulum.state)
+
+    def _publish(self, t, state, prev=None, ens_prev=None):  # ganti referensi snapshot (assignment atomik → handoff lock-free)
+        pt, ps = prev if prev else (t, state)
+        e = self.ensemble.state if self.ensemble is not None else None  # rk4_step_batch selalu membuat array baru → aman dibaca tanpa salin
+        self._snap = Snapshot(t, tuple(state), pt, tuple(ps), time.perf_counter(), e, e if ens_prev is None else ens_prev)
+
+    def snapshot(self):                                   # snapshot terbaru (tidak pernah setengah jadi)
+        return self._snap
+
+    def _alpha(self, s, now):                             # posisi relatif di antara dua tick terakhir (0..1)
+        alpha = ((time.perf_counter() if now is None else now) - s.wall) / self.period
+        return 0.0 if alpha < 0.0 else 1.0 if alpha > 1.0 else alpha
+
+    def interpolated_state(self, now=None):              # state untuk render: interpolasi linear antara dua tick terakhir
+        s = self._snap; alpha = self._alpha(s, now)
+        return [a + (b - a) * alpha for a, b in zip(s.prev_state, s.state)]
+
+    def interpolated_ensemble(self, now=None):           # state ensemble (4, N) terinterpolasi, atau None bila tidak ada ensemble
+        s = self._snap
+        if s.ensemble is None: return None
+        return s.prev_ensemble + (s.ensemble - s.prev_ensemble) * self._alpha(s, now)
+
+    def set_pendulum(self, pendulum, ensemble=None):      # ganti model yang dijalankan (mis. dari SetupScreen), opsional dengan ensemble
+        with self.lock:
+            self.pendulum = pendulum; self.ensemble = ensemble; self._publish(pendulum.time, pendulum.state)
+
+    def substeps(self):                                   # jumlah update per tick — sama dengan pacing lama (speed*2 sub-step per frame)
+        return max(1, int(max(1.0, self.speed) * 2))
+
+    def tick(self):                                       # satu tick fisika (bisa dipanggil langsung tanpa thread, mis. di bench.py)
+        with self.lock:
+            p = self.pendulum
+            prev = (p.time, p.state); e = self.ensemble
+            ens_prev = e.state if e is not None else None
+            if self.running:
+                p.dt = p.base_dt * self.speed             # atur dt model berdasarkan multiplier speed
+                n = self.substeps(); t0 = time.perf_counter()
+                for _ in range(n): p.update()
+                if e is not None: e.dt = p.dt; e.update(n)  # semua anggota ensemble: satu langkah RK4 vektor per sub-step
+                self.steps += n
+                if self.profiler is not None:
+                    self.profiler.record("physics", time.perf_counter() - t0); self.profiler.count("sim_steps", n)
+            elif self._snap.time == p.time and self._snap.state == tuple(p.state):
+                return                                    # jeda dan tidak ada perubahan: tidak perlu publikasi ulang
+            self._publish(p.time, p.state, prev if self.running else None, ens_prev if self.running else None)
+            self.ticks += 1
+
+    def _run(self):                                       # loop thread: deadline tetap, tidak terikat frame render
+        next_t = time.perf_counter()
+        while not self._stop.is_set():
+            now = time.perf_counter()
+            if now < next_t:
+                self._stop.wait(next_t - now); continue   # tidur sampai tick berikutnya
+            behind = int((now - next_t) / self.period)
+            if behind > self.max_catchup:                 # tertinggal jauh: lewati tick alih-alih mengejar
+                self.dropped += behind; next_t = now
+                if self.profiler is not None: self.profiler.count("physics_dropped", behind)
+            self.tick()
+            next_t += self.period
+
+    def start(self):                                      # mulai thread latar belakang (daemon)
+        if self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="physics", daemon=True); self._thread.start()
+        return self
+
+    def stop(self):                                       # hentikan thread dan tunggu selesai
+        if self._thread is not None:
+            self._stop.set(); self._thread.join(); self._thread = None